@@ -0,0 +1,43 @@
+"""
+Resolves a guild-sized list of Discord IDs sequentially and through
+get_users() against a stub server with simulated network latency.
+
+    python benchmarks/batch_users.py
+"""
+
+import asyncio
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI
+
+MEMBERS = 2000
+LATENCY = 0.02
+
+
+async def main() -> None:
+    ids = list(range(1, MEMBERS + 1))
+    async with StubServer(latency=LATENCY) as server:
+        async with SPAPI("card", "token", base_url=server.base_url) as spapi:
+            sample = ids[:100]
+            started = time.perf_counter()
+            for discord_id in sample:
+                await spapi.get_user(discord_id)
+            sequential = (time.perf_counter() - started) / len(sample) * MEMBERS
+            print(f"sequential get_user: ~{sequential:6.2f}s for {MEMBERS} members")
+
+            for concurrency in (10, 50, 100):
+                started = time.perf_counter()
+                ok = 0
+                async for result in spapi.get_users(ids, concurrency=concurrency):
+                    ok += result.ok
+                elapsed = time.perf_counter() - started
+                print(
+                    f"get_users(concurrency={concurrency:3d}): {elapsed:6.2f}s "
+                    f"for {MEMBERS} members ({ok} ok)"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""
+Counts new TCP connections (i.e. TLS handshakes against the real API) per
+1,000 calls with and without the pooled session.
+
+    python benchmarks/connection_pool.py
+"""
+
+import asyncio
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI
+
+CALLS = 1000
+
+
+async def run(server: StubServer, pooled: bool) -> None:
+    server.reset()
+    spapi = SPAPI("card", "token", base_url=server.base_url)
+
+    started = time.perf_counter()
+    if pooled:
+        async with spapi:
+            for _ in range(CALLS):
+                await spapi.balance
+    else:
+        for _ in range(CALLS):
+            await spapi.balance
+    elapsed = time.perf_counter() - started
+
+    mode = "pooled" if pooled else "per-call"
+    print(
+        f"{mode:>9}: {server.connections:5d} connections / {server.requests} calls, "
+        f"{CALLS / elapsed:8.1f} calls/s"
+    )
+
+
+async def main() -> None:
+    async with StubServer() as server:
+        await run(server, pooled=False)
+        await run(server, pooled=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+get_user() latency percentiles against a server with a slow tail, with and
+without hedged requests.
+
+    python benchmarks/hedging.py
+"""
+
+import asyncio
+import random
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, HedgePolicy
+
+CALLS = 2000
+CONCURRENCY = 20
+
+
+async def run(server: StubServer, hedging: HedgePolicy = None) -> None:
+    server.reset()
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async with SPAPI(
+        "card", "token", base_url=server.base_url, hedging=hedging
+    ) as spapi:
+
+        async def call(discord_id: int) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                await spapi.get_user(discord_id, with_cards=False)
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(call(i) for i in range(1, CALLS + 1)))
+
+    latencies.sort()
+    mode = "hedging" if hedging else "no hedging"
+    print(
+        f"{mode:>10}: p50 {latencies[len(latencies) // 2] * 1000:6.1f}ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.1f}ms, "
+        f"{server.requests} HTTP requests for {CALLS} calls; {hedging if hedging else ''}"
+    )
+
+
+async def main() -> None:
+    random.seed(0)
+    async with StubServer(latency=0.005, tail_latency=0.3, tail_ratio=0.03) as server:
+        await run(server)
+        await run(server, HedgePolicy(percentile=95, max_extra_load=0.1))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
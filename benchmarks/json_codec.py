@@ -0,0 +1,65 @@
+"""
+Response decoding cost per call: the previous double decode
+(resp.text() followed by resp.json()) against a single pass over the body
+bytes with each available JSON codec, including the default stdlib one.
+
+Variants run interleaved in short rounds and the fastest round of each is
+reported, so background noise affects them all alike.
+
+    python benchmarks/json_codec.py
+"""
+
+import json
+import time
+from typing import Callable, Dict
+
+import payloads
+
+from pyspapi.api import get_codec
+
+ITERATIONS = 1000
+ROUNDS = 40
+
+BODIES = {
+    "accounts/me": json.dumps(payloads.account_me(cities=10, cards=10)).encode(),
+    "users/{id}": json.dumps(payloads.user(262632724928397312)).encode(),
+    "accounts/{name}/cards": json.dumps(payloads.user_cards(5)).encode(),
+}
+
+
+def double_decode(body: bytes):
+    text = body.decode("utf-8")
+    json.loads(body.decode("utf-8"))
+    return text
+
+
+def bench(variants: Dict[str, Callable], body: bytes) -> None:
+    best = dict.fromkeys(variants, float("inf"))
+    for _ in range(ROUNDS):
+        for label, func in variants.items():
+            started = time.perf_counter()
+            for _ in range(ITERATIONS):
+                func(body)
+            best[label] = min(best[label], time.perf_counter() - started)
+    for label, elapsed in best.items():
+        print(f"  {label:>16}: {elapsed * 1e6 / ITERATIONS:7.2f} us/response")
+
+
+def main() -> None:
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"({name} not installed, skipped)")
+
+    for endpoint, body in BODIES.items():
+        print(f"{endpoint} ({len(body)} bytes)")
+        variants = {"text()+json()": double_decode}
+        for codec in codecs:
+            variants[f"{codec.name} single"] = codec.loads
+        bench(variants, body)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Bytes per cached model instance for the previous __dict__-based classes and
+the current __slots__-based ones, plus the cost of building an Account that
+is only read for its username.
+
+    python benchmarks/model_memory.py
+"""
+
+import gc
+import time
+import tracemalloc
+
+import payloads
+
+from pyspapi.types import Account, User
+
+COUNT = 20000
+
+
+class LegacyUserCards:
+    def __init__(self, name, number):
+        self._name = name
+        self._number = number
+
+
+class LegacyUser:
+    def __init__(self, username, uuid, cards):
+        self._username = username
+        self._uuid = uuid
+        self._cards = [LegacyUserCards(card["name"], card["number"]) for card in cards]
+
+
+class LegacyCity:
+    def __init__(self, city_id, name, x, z, nether_x, nether_z, lane, role, created_at):
+        self._id = city_id
+        self._name = name
+        self._x = x
+        self._z = z
+        self._nether_x = nether_x
+        self._nether_z = nether_z
+        self._lane = lane
+        self._role = role
+        self._created_at = created_at
+
+
+class LegacyCard:
+    def __init__(self, card_id, name, number, color):
+        self._id = card_id
+        self._name = name
+        self._number = number
+        self._color = color
+
+
+class LegacyAccount:
+    def __init__(self, data):
+        self._id = data["id"]
+        self._username = data["username"]
+        self._minecraftuuid = data["minecraftUUID"]
+        self._status = data["status"]
+        self._roles = data["roles"]
+        self._cities = [
+            LegacyCity(
+                c["city"]["id"],
+                c["city"]["name"],
+                c["city"]["x"],
+                c["city"]["z"],
+                c["city"]["netherX"],
+                c["city"]["netherZ"],
+                c["city"]["lane"],
+                c["role"],
+                c["createdAt"],
+            )
+            for c in data["cities"]
+        ]
+        self._cards = [
+            LegacyCard(c["id"], c["name"], c["number"], c["color"])
+            for c in data["cards"]
+        ]
+        self._created_at = data["createdAt"]
+
+
+def measure(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / COUNT
+
+
+def main() -> None:
+    users = [payloads.user(i) for i in range(COUNT)]
+    cards = payloads.user_cards(3)
+    accounts = [payloads.account_me() for _ in range(COUNT)]
+
+    legacy = measure(
+        lambda: [LegacyUser(u["username"], u["uuid"], cards) for u in users]
+    )
+    current = measure(lambda: [User.from_dict(u, cards) for u in users])
+    print(f"User (3 cards):   {legacy:7.0f} -> {current:7.0f} bytes/instance")
+
+    legacy = measure(lambda: [LegacyAccount(a) for a in accounts])
+    current = measure(lambda: [Account.from_dict(a) for a in accounts])
+    print(f"Account (lazy):   {legacy:7.0f} -> {current:7.0f} bytes/instance")
+
+    def materialized():
+        built = [Account.from_dict(a) for a in accounts]
+        for account in built:
+            account.cities, account.cards
+        return built
+
+    current = measure(materialized)
+    print(f"Account (loaded): {legacy:7.0f} -> {current:7.0f} bytes/instance")
+
+    big = payloads.account_me(cities=20, cards=20)
+    for label, build in (
+        ("eager", lambda: LegacyAccount(big)._username),
+        ("lazy", lambda: Account.from_dict(big).username),
+    ):
+        started = time.perf_counter()
+        for _ in range(COUNT):
+            build()
+        elapsed = time.perf_counter() - started
+        print(
+            f"Account 20 cities/20 cards, username only, {label:>5}: "
+            f"{elapsed * 1e6 / COUNT:6.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Realistic SPWorlds API response bodies shared by the benchmarks.
+"""
+
+from typing import Any, Dict, List
+
+
+def card(balance: int = 1000) -> Dict[str, Any]:
+    return {"balance": balance, "webhook": "https://example.com/webhook"}
+
+
+def user(discord_id: int) -> Dict[str, Any]:
+    return {
+        "username": f"player{discord_id}",
+        "uuid": f"{discord_id:032x}",
+    }
+
+
+def user_cards(count: int = 3) -> List[Dict[str, Any]]:
+    return [
+        {"name": f"Card {i}", "number": f"{i:05d}", "color": i % 8}
+        for i in range(count)
+    ]
+
+
+def account_me(cities: int = 3, cards: int = 5) -> Dict[str, Any]:
+    return {
+        "id": "6f0b4c9e-6a58-4c1b-9a39-7c4f2f3b7a11",
+        "username": "deesiigneer",
+        "minecraftUUID": "0f5a3b7b1c5e4a3d9b8c7d6e5f4a3b2c",
+        "status": "active",
+        "roles": ["player", "banker"],
+        "cities": [
+            {
+                "city": {
+                    "id": f"city-{i}",
+                    "name": f"City {i}",
+                    "x": 100 * i,
+                    "z": -100 * i,
+                    "netherX": 12 * i,
+                    "netherZ": -12 * i,
+                    "lane": "red",
+                },
+                "role": "mayor" if i == 0 else "member",
+                "createdAt": "2024-01-01T00:00:00.000Z",
+            }
+            for i in range(cities)
+        ],
+        "cards": [
+            {
+                "id": f"card-{i}",
+                "name": f"Card {i}",
+                "number": f"{i:05d}",
+                "color": i % 8,
+            }
+            for i in range(cards)
+        ],
+        "createdAt": "2023-05-05T12:00:00.000Z",
+    }
@@ -0,0 +1,88 @@
+"""
+HTTP requests and time to resolve the same users after a process restart
+with the in-memory ResponseCache (cold) and SQLiteCache (warm), call
+latency once the entries expire with and without stale-while-revalidate,
+and how long the synchronous SQLite reads and writes hold the event loop.
+
+    python benchmarks/persistent_cache.py
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, ResponseCache, SQLiteCache
+
+USERS = 500
+TTLS = {"users/": 0.5, "accounts/": 0.5}
+
+
+async def restart(server: StubServer, label: str, cache: ResponseCache) -> None:
+    server.reset()
+    async with SPAPI("card", "token", base_url=server.base_url, cache=cache) as spapi:
+        started = time.perf_counter()
+        warmed = await spapi.warm_up(range(1, USERS + 1), concurrency=50)
+        elapsed = time.perf_counter() - started
+    print(
+        f"{label:>16}: {warmed} users in {elapsed * 1000:7.1f}ms, "
+        f"{server.requests} HTTP requests"
+    )
+
+
+async def expired(server: StubServer, label: str, stale_ttl: float) -> None:
+    cache = ResponseCache(ttls=TTLS, stale_ttl=stale_ttl)
+    async with SPAPI("card", "token", base_url=server.base_url, cache=cache) as spapi:
+        await spapi.get_user(1)
+        await asyncio.sleep(TTLS["users/"])
+        started = time.perf_counter()
+        await spapi.get_user(1)
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(server.latency * 3)
+    print(f"{label:>16}: expired get_user in {elapsed * 1000:6.1f}ms; {cache}")
+
+
+def disk_costs(path: str) -> None:
+    cache = SQLiteCache(path, maxsize=1, max_entries=USERS)
+    value = {"username": "user", "uuid": "0" * 32, "cards": []}
+    started = time.perf_counter()
+    for i in range(USERS * 4):
+        cache.set(f"users/{i}", value)
+    write = (time.perf_counter() - started) / (USERS * 4)
+    started = time.perf_counter()
+    for i in range(USERS * 3, USERS * 4):
+        cache._entries.clear()
+        cache.get(f"users/{i}")
+    read = (time.perf_counter() - started) / USERS
+    cache.close()
+    print(
+        f"{'event loop':>16}: {write * 1e6:5.1f}us per write with eviction, "
+        f"{read * 1e6:5.1f}us per read from disk"
+    )
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cache.db")
+        async with StubServer(latency=0.02) as server:
+            first = SQLiteCache(path)
+            await restart(server, "first start", first)
+            first.close()
+
+            await restart(server, "memory restart", ResponseCache())
+
+            warm = SQLiteCache(path)
+            await restart(server, "sqlite restart", warm)
+            print(f"{'':>16}  {warm}")
+            warm.close()
+
+            await expired(server, "no stale", 0.0)
+            await expired(server, "stale 60s", 60.0)
+
+        disk_costs(os.path.join(directory, "costs.db"))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
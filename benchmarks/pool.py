@@ -0,0 +1,103 @@
+"""
+Sockets and throughput for many cards served by independent SPAPI clients
+versus one SPAPIPool, and how a bulk payout is spread across card balances.
+
+    python benchmarks/pool.py
+"""
+
+import asyncio
+import random
+import time
+from typing import List
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, RateLimiter, SPAPIPool
+
+CARDS = 30
+CALLS = 1500
+WORKERS = 10
+TRANSFERS = 300
+
+
+def credentials():
+    return {f"card-{i}": f"token-{i}" for i in range(CARDS)}
+
+
+async def traffic(clients: List[SPAPI]) -> float:
+    """
+    WORKERS concurrent callers, each call for a random card.
+    """
+    remaining = iter(range(CALLS))
+
+    async def worker() -> None:
+        for _ in remaining:
+            await random.choice(clients).get_card()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    return time.perf_counter() - started
+
+
+async def independent(server: StubServer) -> None:
+    server.reset()
+    clients = [
+        SPAPI(card_id, token, base_url=server.base_url)
+        for card_id, token in credentials().items()
+    ]
+    for client in clients:
+        await client.start()
+    elapsed = await traffic(clients)
+    for client in clients:
+        await client.close()
+    print(
+        f"{'independent':>12}: {CALLS / elapsed:7.0f} calls/s, "
+        f"{server.connections} connections for {CARDS} cards, {WORKERS} callers"
+    )
+
+
+async def pooled(server: StubServer) -> None:
+    server.reset()
+    async with SPAPIPool(credentials(), base_url=server.base_url) as pool:
+        elapsed = await traffic([pool[card_id] for card_id in pool])
+    print(
+        f"{'pool':>12}: {CALLS / elapsed:7.0f} calls/s, "
+        f"{server.connections} connections for {CARDS} cards, {WORKERS} callers"
+    )
+
+
+async def payout(server: StubServer) -> None:
+    server.balances = {card_id: random.randint(500, 5000) for card_id in credentials()}
+    total = sum(server.balances.values())
+    transfers = [
+        ("12345", random.randint(1, 150), f"payout {i}") for i in range(TRANSFERS)
+    ]
+    async with SPAPIPool(
+        credentials(),
+        base_url=server.base_url,
+        rate_limiter_factory=lambda card_id: RateLimiter(rate=50),
+    ) as pool:
+        started = time.perf_counter()
+        report = await pool.create_transactions(transfers, concurrency=5)
+        elapsed = time.perf_counter() - started
+
+    requested = sum(amount for _, amount, _ in transfers)
+    leftovers = sorted(server.balances.values())
+    print(
+        f"{'payout':>12}: {report.succeeded}/{TRANSFERS} transfers ({report.paid}/{requested}) "
+        f"over {len(report.cards)} cards in {elapsed:.2f}s, not sent {report.not_sent}; "
+        f"balances {total} -> {report.final_balance}, "
+        f"left per card min {leftovers[0]} max {leftovers[-1]}"
+    )
+
+
+async def main() -> None:
+    random.seed(0)
+    async with StubServer(latency=0.002) as server:
+        await independent(server)
+        await pooled(server)
+        await payout(server)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+"""
+Throughput of a burst of concurrent calls against a stub server that allows
+RATE requests per second, with and without the client-side rate limiter.
+
+    python benchmarks/rate_limiter.py
+"""
+
+import asyncio
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, RateLimiter
+
+RATE = 100
+CALLS = 500
+
+
+async def run(server: StubServer, limiter: RateLimiter = None) -> None:
+    server.reset()
+    await asyncio.sleep(1 - time.monotonic() % 1)
+
+    async with SPAPI(
+        "card", "token", retries=50, base_url=server.base_url, rate_limiter=limiter
+    ) as spapi:
+        started = time.perf_counter()
+        results = await asyncio.gather(*(spapi.balance for _ in range(CALLS)))
+        elapsed = time.perf_counter() - started
+
+    ok = sum(result is not None for result in results)
+    mode = "limiter" if limiter else "no limiter"
+    print(
+        f"{mode:>10}: {ok}/{CALLS} ok in {elapsed:5.2f}s ({ok / elapsed:6.1f} calls/s), "
+        f"{server.requests} requests sent, {server.throttled} rejected with 429"
+    )
+
+
+async def main() -> None:
+    async with StubServer(rate_limit=RATE) as server:
+        await run(server)
+        await run(server, RateLimiter(rate=RATE, burst=RATE))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+"""
+HTTP requests issued for concurrent and repeated get_user() calls with and
+without the response cache.
+
+    python benchmarks/response_cache.py
+"""
+
+import asyncio
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, ResponseCache
+
+CONCURRENT = 500
+ROUNDS = 5
+
+
+async def run(server: StubServer, cache: ResponseCache = None) -> None:
+    server.reset()
+    async with SPAPI("card", "token", base_url=server.base_url, cache=cache) as spapi:
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            await asyncio.gather(
+                *(spapi.get_user(262632724928397312) for _ in range(CONCURRENT))
+            )
+        elapsed = time.perf_counter() - started
+
+    calls = CONCURRENT * ROUNDS
+    mode = "cache" if cache else "no cache"
+    print(
+        f"{mode:>8}: {calls} get_user calls -> {server.requests} HTTP requests "
+        f"in {elapsed:5.2f}s; {cache if cache else ''}"
+    )
+
+
+async def main() -> None:
+    async with StubServer() as server:
+        await run(server)
+        await run(server, ResponseCache())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+Latency of a payment issued while a background job floods the client with
+user lookups, with and without the request scheduler.
+
+    python benchmarks/scheduler.py
+"""
+
+import asyncio
+import time
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI, Priority, RequestScheduler, scheduling
+
+BACKGROUND = 300
+PAYMENTS = 5
+
+
+async def run(server: StubServer, scheduler: RequestScheduler = None) -> None:
+    server.reset()
+    async with SPAPI(
+        "card", "token", base_url=server.base_url, scheduler=scheduler
+    ) as spapi:
+
+        async def background() -> None:
+            with scheduling(Priority.BACKGROUND, tag="sync"):
+                await spapi.gather_users(
+                    range(1, BACKGROUND + 1), concurrency=BACKGROUND
+                )
+
+        job = asyncio.ensure_future(background())
+        await asyncio.sleep(0.05)
+        latencies = []
+        for _ in range(PAYMENTS):
+            started = time.perf_counter()
+            await spapi.create_transaction("12345", 1, "benchmark")
+            latencies.append(time.perf_counter() - started)
+        await job
+
+    mode = "scheduler" if scheduler else "no scheduler"
+    print(
+        f"{mode:>12}: payment latency avg {sum(latencies) / PAYMENTS * 1000:6.1f}ms, "
+        f"max {max(latencies) * 1000:6.1f}ms behind {BACKGROUND} background lookups"
+    )
+
+
+async def main() -> None:
+    async with StubServer(latency=0.02) as server:
+        await run(server)
+        await run(server, RequestScheduler(max_in_flight=8))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+Peak memory while syncing many members: collecting every result with
+gather_users() versus consuming stream_users() from an async source of IDs.
+
+    python benchmarks/stream_users.py
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI
+
+MEMBERS = 10000
+CONCURRENCY = 50
+
+
+async def members():
+    for discord_id in range(1, MEMBERS + 1):
+        yield discord_id
+
+
+async def run(label: str, server: StubServer, consume) -> None:
+    server.reset()
+    async with SPAPI("card", "token", base_url=server.base_url) as spapi:
+        tracemalloc.start()
+        started = time.perf_counter()
+        synced = await consume(spapi)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(
+        f"{label:>14}: {synced} users in {elapsed:5.2f}s, "
+        f"peak {peak / 1024 / 1024:6.1f} MiB"
+    )
+
+
+async def gathered(spapi: SPAPI) -> int:
+    results = await spapi.gather_users(
+        range(1, MEMBERS + 1), concurrency=CONCURRENCY, with_cards=False
+    )
+    return sum(result.ok for result in results)
+
+
+async def streamed(spapi: SPAPI) -> int:
+    synced = 0
+    async for result in spapi.stream_users(
+        members(), concurrency=CONCURRENCY, with_cards=False
+    ):
+        synced += result.ok
+    return synced
+
+
+async def main() -> None:
+    async with StubServer() as server:
+        await run("gather_users", server, gathered)
+        await run("stream_users", server, streamed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,216 @@
+"""
+In-process simulator of the SPWorlds public API used by the benchmarks.
+
+Serves ``card``, ``card/webhook``, ``accounts/me``, ``users/{id}``,
+``accounts/{name}/cards``, ``transactions`` and ``payments`` with bodies from
+``payloads``. Cards listed in ``balances`` keep their own balance; other
+credentials share ``balance``. Latency (with an optional slow tail), random
+5xx errors and 429 responses (a per-second budget and/or a random ratio)
+are configurable.
+
+    python benchmarks/stub_server.py
+"""
+
+import asyncio
+import math
+import random
+import time
+from base64 import b64decode
+from typing import Dict, Optional, Set, Tuple
+from uuid import uuid4
+
+import payloads
+from aiohttp import web
+
+
+class StubServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate_limit: Optional[int] = None,
+        latency: float = 0.0,
+        tail_latency: float = 0.0,
+        tail_ratio: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        balance: int = 1000,
+    ):
+        self.host = host
+        self.port = port
+        self.rate_limit = rate_limit
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_ratio = tail_ratio
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.balance = balance
+        self.balances: Dict[str, int] = {}
+        self.webhook = "https://example.com/webhook"
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.unauthorized = 0
+        self._window = 0
+        self._window_hits = 0
+        self.peers: Set[Tuple[str, int]] = set()
+        self._runner: web.AppRunner = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/api/public/"
+
+    @property
+    def connections(self) -> int:
+        return len(self.peers)
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.unauthorized = 0
+        self.peers.clear()
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_get("/api/public/card", self.card)
+        app.router.add_put("/api/public/card/webhook", self.update_webhook)
+        app.router.add_get("/api/public/accounts/me", self.me)
+        app.router.add_get("/api/public/users/{discord_id}", self.user)
+        app.router.add_get("/api/public/accounts/{username}/cards", self.cards)
+        app.router.add_post("/api/public/transactions", self.transactions)
+        app.router.add_post("/api/public/payments", self.payments)
+        return app
+
+    def throttle(self) -> web.Response:
+        self.throttled += 1
+        now = time.monotonic()
+        retry_after = int(now) + 1 - now
+        return web.json_response(
+            {"message": "Too many requests", "retry_after": retry_after},
+            status=429,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    def track(self, request: web.Request) -> Optional[web.Response]:
+        self.requests += 1
+        if request.transport is not None:
+            self.peers.add(request.transport.get_extra_info("peername"))
+
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            return self.throttle()
+        if self.rate_limit is None:
+            return None
+
+        window = int(time.monotonic())
+        if window != self._window:
+            self._window, self._window_hits = window, 0
+        self._window_hits += 1
+        if self._window_hits <= self.rate_limit:
+            return None
+        return self.throttle()
+
+    @staticmethod
+    def card_id(request: web.Request) -> str:
+        token = request.headers.get("Authorization", "")[len("Bearer ") :]
+        return b64decode(token).decode("utf-8").split(":", 1)[0]
+
+    def get_balance(self, request: web.Request) -> int:
+        return self.balances.get(self.card_id(request), self.balance)
+
+    def set_balance(self, request: web.Request, balance: int) -> None:
+        card_id = self.card_id(request)
+        if card_id in self.balances:
+            self.balances[card_id] = balance
+        else:
+            self.balance = balance
+
+    async def delay(self) -> None:
+        latency = self.latency
+        if self.tail_ratio and random.random() < self.tail_ratio:
+            latency = self.tail_latency
+        if latency:
+            await asyncio.sleep(latency)
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        throttled = self.track(request)
+        if throttled is not None:
+            return throttled
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            self.unauthorized += 1
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        await self.delay()
+        if self.error_rate and random.random() < self.error_rate:
+            self.errors += 1
+            return web.json_response({"message": "Internal Server Error"}, status=500)
+        return await handler(request)
+
+    async def card(self, request: web.Request) -> web.Response:
+        body = payloads.card(self.get_balance(request))
+        body["webhook"] = self.webhook
+        return web.json_response(body)
+
+    async def update_webhook(self, request: web.Request) -> web.Response:
+        url = (await request.json()).get("url")
+        if not url:
+            return web.json_response({"message": "url is required"}, status=400)
+        self.webhook = url
+        return web.json_response({"id": "card-0", "webhook": url})
+
+    async def me(self, request: web.Request) -> web.Response:
+        return web.json_response(payloads.account_me())
+
+    async def user(self, request: web.Request) -> web.Response:
+        return web.json_response(payloads.user(int(request.match_info["discord_id"])))
+
+    async def cards(self, request: web.Request) -> web.Response:
+        return web.json_response(payloads.user_cards())
+
+    async def transactions(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        amount = data.get("amount")
+        if not data.get("receiver") or not isinstance(amount, int) or amount <= 0:
+            return web.json_response({"message": "Invalid transfer"}, status=400)
+        balance = self.get_balance(request)
+        if amount > balance:
+            return web.json_response(
+                {"error": "error.public.transactions.notEnoughBalance"}, status=400
+            )
+        self.set_balance(request, balance - amount)
+        return web.json_response({"balance": balance - amount})
+
+    async def payments(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        if not data.get("items") or not data.get("webhookUrl"):
+            return web.json_response({"message": "Invalid payment"}, status=400)
+        return web.json_response({"url": f"https://spworlds.ru/pay/{uuid4().hex}"})
+
+    async def start(self) -> "StubServer":
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+if __name__ == "__main__":
+
+    async def main():
+        async with StubServer(port=8080) as server:
+            print(f"Serving on {server.base_url}")
+            await asyncio.Event().wait()
+
+    asyncio.run(main())
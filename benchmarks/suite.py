@@ -0,0 +1,293 @@
+"""
+Offline benchmark suite: every SPAPI method against the in-process SPWorlds
+simulator at several concurrency levels.
+
+For each method and concurrency level the suite reports requests/sec
+(SPAPI calls per second) and p50/p99 call latency of the fastest of
+``--repeat`` passes, plus allocations: the tracemalloc peak of a separate
+pass and the bytes per call still held after it. Results can be saved as
+a JSON baseline and later compared against it; the exit status is 1 if
+any metric regressed by more than ``--threshold``.
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json --threshold 0.1
+    python benchmarks/suite.py --only get_user,create_transaction --error-rate 0.01 --retries 2
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib.metadata
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from base64 import b64encode
+from datetime import datetime, timezone
+from hashlib import sha256
+from hmac import new
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from stub_server import StubServer
+
+from pyspapi import SPAPI
+from pyspapi.types import Item
+
+TOKEN = "benchmark-token"
+BATCH = 10
+LATENCY_FLOOR = 0.0005
+MEMORY_FLOOR = 16 * 1024
+
+WEBHOOK_BODY = json.dumps({"payer": "player1", "amount": 10, "data": "x" * 200})
+WEBHOOK_HEADER = b64encode(
+    new(TOKEN.encode("utf-8"), WEBHOOK_BODY.encode("utf-8"), sha256).digest()
+).decode()
+ITEMS = [Item("Diamond", 1, 10, "benchmark").to_json()]
+
+Scenario = Callable[[SPAPI, int], Awaitable[Any]]
+
+
+async def _get_users(spapi: SPAPI, n: int) -> List[Any]:
+    ids = range(n * BATCH + 1, (n + 1) * BATCH + 1)
+    return [result async for result in spapi.get_users(ids)]
+
+
+async def _webhook_verify(spapi: SPAPI, n: int) -> bool:
+    return spapi.webhook_verify(WEBHOOK_BODY, WEBHOOK_HEADER)
+
+
+async def _verify_many(spapi: SPAPI, n: int) -> List[bool]:
+    return spapi.verify_many([(WEBHOOK_BODY, WEBHOOK_HEADER)] * BATCH, max_workers=1)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "get_card": lambda spapi, n: spapi.get_card(),
+    "balance": lambda spapi, n: spapi.balance,
+    "webhook": lambda spapi, n: spapi.webhook,
+    "get_me": lambda spapi, n: spapi.get_me(),
+    "get_user": lambda spapi, n: spapi.get_user(n + 1),
+    "get_user_no_cards": lambda spapi, n: spapi.get_user(n + 1, with_cards=False),
+    "get_users": _get_users,
+    "gather_users": lambda spapi, n: spapi.gather_users(
+        range(n * BATCH + 1, (n + 1) * BATCH + 1)
+    ),
+    "create_transaction": lambda spapi, n: spapi.create_transaction(
+        "12345", 1, f"benchmark {n}"
+    ),
+    "create_transactions": lambda spapi, n: spapi.create_transactions(
+        [("12345", 1, f"benchmark {n}-{i}") for i in range(BATCH)], precheck=False
+    ).run(),
+    "create_payment": lambda spapi, n: spapi.create_payment(
+        "https://example.com/webhook", "https://example.com/", f"order {n}", ITEMS
+    ),
+    "update_webhook": lambda spapi, n: spapi.update_webhook(
+        f"https://example.com/webhook/{n}"
+    ),
+    "webhook_verify": _webhook_verify,
+    "verify_many": _verify_many,
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def drive(
+    spapi: SPAPI, scenario: Scenario, calls: int, concurrency: int, numbers: count
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    failures = 0
+    remaining = iter(range(calls))
+
+    async def worker() -> None:
+        nonlocal failures
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                result = await scenario(spapi, next(numbers))
+            except Exception:
+                result = None
+            latencies.append(time.perf_counter() - started)
+            if result is None or result is False:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"latencies": latencies, "failures": failures, "elapsed": elapsed}
+
+
+async def measure(
+    server: StubServer, args: argparse.Namespace, name: str, concurrency: int
+) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    numbers = count()
+    server.balance = 10**12
+    async with SPAPI(
+        "card",
+        TOKEN,
+        base_url=server.base_url,
+        retries=args.retries,
+        sleep_time=0.01,
+    ) as spapi:
+        await drive(spapi, scenario, concurrency, concurrency, numbers)
+
+        timed = None
+        for _ in range(args.repeat):
+            server.reset()
+            run = await drive(spapi, scenario, args.calls, concurrency, numbers)
+            if timed is None or run["elapsed"] < timed["elapsed"]:
+                timed, http_requests = run, server.requests
+
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await drive(spapi, scenario, args.alloc_calls, concurrency, numbers)
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    latencies = timed["latencies"]
+    return {
+        "calls": args.calls,
+        "rps": args.calls / timed["elapsed"],
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "failures": timed["failures"],
+        "http_requests": http_requests,
+        "peak_kib": (peak - before) / 1024,
+        "retained_bytes_per_call": max(0, after - before) / args.alloc_calls,
+    }
+
+
+def print_row(name: str, concurrency: int, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:>20} c={concurrency:<3} {result['rps']:9.0f} calls/s  "
+        f"p50 {result['p50_ms']:7.2f}ms  p99 {result['p99_ms']:7.2f}ms  "
+        f"peak {result['peak_kib']:8.1f}KiB  "
+        f"retained {result['retained_bytes_per_call']:7.0f}B/call  "
+        f"http {result['http_requests']:5d}  failed {result['failures']}"
+    )
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Returns a line per metric that is worse than the baseline by more than
+    ``threshold`` (a fraction) and by more than the noise floor.
+    """
+    regressions = []
+    for name, levels in current["results"].items():
+        for concurrency, result in levels.items():
+            old = baseline.get("results", {}).get(name, {}).get(concurrency)
+            if old is None:
+                continue
+            label = f"{name} c={concurrency}"
+            if result["rps"] < old["rps"] * (1 - threshold):
+                regressions.append(
+                    f"{label}: rps {old['rps']:.0f} -> {result['rps']:.0f}"
+                )
+            for metric in ("p50_ms", "p99_ms"):
+                if (
+                    result[metric] > old[metric] * (1 + threshold)
+                    and result[metric] - old[metric] > LATENCY_FLOOR * 1000
+                ):
+                    regressions.append(
+                        f"{label}: {metric} {old[metric]:.2f} -> {result[metric]:.2f}"
+                    )
+            if (
+                result["peak_kib"] > old["peak_kib"] * (1 + threshold)
+                and (result["peak_kib"] - old["peak_kib"]) * 1024 > MEMORY_FLOOR
+            ):
+                regressions.append(
+                    f"{label}: peak_kib {old['peak_kib']:.1f} -> {result['peak_kib']:.1f}"
+                )
+            if result["failures"] > old["failures"]:
+                regressions.append(
+                    f"{label}: failures {old['failures']} -> {result['failures']}"
+                )
+    return regressions
+
+
+def metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    try:
+        version = importlib.metadata.version("pyspapi")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pyspapi": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "calls": args.calls,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retries": args.retries,
+        "repeat": args.repeat,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--alloc-calls", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3, help="keep the fastest pass")
+    parser.add_argument("--concurrency", default="1,10,50")
+    parser.add_argument("--only", help="comma-separated scenario names")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retries", type=int, default=0)
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON to compare")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    args.levels = [int(level) for level in args.concurrency.split(",")]
+    args.scenarios = args.only.split(",") if args.only else list(SCENARIOS)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+async def main(args: argparse.Namespace) -> int:
+    report = {"meta": metadata(args), "results": {}}
+    async with StubServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    ) as server:
+        for name in args.scenarios:
+            for concurrency in args.levels:
+                result = await measure(server, args, name, concurrency)
+                report["results"].setdefault(name, {})[str(concurrency)] = result
+                print_row(name, concurrency, result)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,74 @@
+"""
+Local load test for WebhookReceiver: signed webhooks/sec accepted and
+handled on one event loop, including a share of redeliveries.
+
+    python benchmarks/webhook_receiver.py
+"""
+
+import asyncio
+import json
+import time
+from base64 import b64encode
+from hashlib import sha256
+from hmac import new
+
+import aiohttp
+
+from pyspapi import SPAPI, WebhookReceiver
+
+TOKEN = "token"
+WEBHOOKS = 20000
+CONCURRENCY = 100
+REDELIVERY_EVERY = 10
+
+
+def sign(body: bytes) -> str:
+    return b64encode(new(TOKEN.encode("utf-8"), body, sha256).digest()).decode()
+
+
+async def main() -> None:
+    handled = 0
+
+    receiver = WebhookReceiver(SPAPI("card", TOKEN), workers=4, queue_size=5000)
+
+    @receiver.on()
+    async def on_event(event):
+        nonlocal handled
+        handled += 1
+
+    host, port = await receiver.start("127.0.0.1", 0)
+    url = f"http://{host}:{port}{receiver.path}"
+
+    payloads = []
+    for i in range(WEBHOOKS):
+        n = i - 1 if i % REDELIVERY_EVERY == 0 and i else i
+        body = json.dumps({"payer": f"player{n}", "amount": n, "data": str(n)}).encode()
+        payloads.append((body, sign(body)))
+
+    statuses = {}
+    queue = iter(payloads)
+
+    async def sender(session: aiohttp.ClientSession) -> None:
+        for body, signature in queue:
+            async with session.post(
+                url, data=body, headers={"X-Body-Hash": signature}
+            ) as resp:
+                statuses[resp.status] = statuses.get(resp.status, 0) + 1
+
+    connector = aiohttp.TCPConnector(limit=CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(sender(session) for _ in range(CONCURRENCY)))
+        await receiver.drain()
+        elapsed = time.perf_counter() - started
+
+    await receiver.stop()
+    print(
+        f"{WEBHOOKS} webhooks in {elapsed:.2f}s ({WEBHOOKS / elapsed:.0f}/s): "
+        f"statuses={statuses}, handled={handled}, duplicates={receiver.duplicates}, "
+        f"rejected={receiver.rejected}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
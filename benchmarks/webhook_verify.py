@@ -0,0 +1,83 @@
+"""
+Microbenchmark for SPAPI.webhook_verify against the previous per-call
+implementation, and for verify_many on bursts of small and large payloads.
+
+verify_many only uses threads when the process may run on more than one
+CPU; on a single CPU it must match the sequential loop.
+
+    python benchmarks/webhook_verify.py
+"""
+
+import json
+import os
+import time
+from base64 import b64encode
+from hashlib import sha256
+from hmac import compare_digest, new
+
+from pyspapi import SPAPI
+
+TOKEN = "a" * 32
+SMALL = 100000
+LARGE = 64
+LARGE_SIZE = 4 * 1024 * 1024
+
+
+def sign(body: bytes) -> str:
+    return b64encode(new(TOKEN.encode("utf-8"), body, sha256).digest()).decode()
+
+
+def legacy_verify(token: str, data: bytes, header: str) -> bool:
+    hmac_data = b64encode(new(token.encode("utf-8"), data, sha256).digest())
+    return compare_digest(hmac_data, header.encode("utf-8"))
+
+
+def bench(label: str, func, count: int) -> float:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>28}: {elapsed * 1e6 / count:8.2f} us/webhook")
+    return elapsed
+
+
+def main() -> None:
+    spapi = SPAPI("card", TOKEN)
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count()
+    print(f"{cpus} usable CPU(s)")
+
+    body = json.dumps({"payer": "player", "amount": 10, "data": "order-1"}).encode()
+    header = sign(body)
+    bench(
+        "legacy webhook_verify",
+        lambda: [legacy_verify(TOKEN, body, header) for _ in range(SMALL)],
+        SMALL,
+    )
+    bench(
+        "webhook_verify",
+        lambda: [spapi.webhook_verify(body, header) for _ in range(SMALL)],
+        SMALL,
+    )
+
+    small = [(body, header)] * 1000
+    bench(
+        "sequential (small bodies)",
+        lambda: [spapi.webhook_verify(*w) for w in small],
+        1000,
+    )
+    bench("verify_many (small bodies)", lambda: spapi.verify_many(small), 1000)
+
+    large = [bytes([i]) * LARGE_SIZE for i in range(LARGE)]
+    burst = [(memoryview(data), sign(data)) for data in large]
+    bench(
+        "sequential (4 MiB bodies)",
+        lambda: [spapi.webhook_verify(*w) for w in burst],
+        LARGE,
+    )
+    bench("verify_many (4 MiB bodies)", lambda: spapi.verify_many(burst), LARGE)
+
+
+if __name__ == "__main__":
+    main()
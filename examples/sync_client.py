@@ -0,0 +1,10 @@
+from pyspapi import SyncSPAPI
+
+spapi = SyncSPAPI(card_id="CARD_ID", token="TOKEN")
+
+print(spapi.balance)
+
+user = spapi.get_user(262632724928397312)
+print(user.username, user.uuid)
+
+spapi.close()
@@ -0,0 +1,23 @@
+import asyncio
+from pyspapi import SPAPI, WebhookReceiver
+
+spapi = SPAPI(card_id="CARD_ID", token="TOKEN")
+receiver = WebhookReceiver(spapi, path="/webhook", workers=4)
+
+
+@receiver.on("payment")
+async def on_payment(event):
+    print(f"{event.payer} paid {event.amount} ({event.data})")
+
+
+@receiver.on("transaction")
+async def on_transaction(event):
+    print(event.sender, "->", event.receiver, event.amount)
+
+
+async def main():
+    await receiver.start(host="0.0.0.0", port=8080)
+    await asyncio.Event().wait()
+
+
+asyncio.run(main())
@@ -10,8 +10,25 @@ High-level client for interacting with the SPWorlds API.
 
 import importlib.metadata
 
+from pyspapi.api import (
+    CircuitBreaker,
+    HedgePolicy,
+    IdempotencyJournal,
+    Instrumentation,
+    Priority,
+    PrometheusCollector,
+    RateLimiter,
+    RequestScheduler,
+    ResponseCache,
+    RetryBudget,
+    RetryPolicy,
+    SQLiteCache,
+    SQLiteJournal,
+    scheduling,
+)
 from pyspapi.exceptions import (
     BadRequestError,
+    CircuitOpenError,
     ClientError,
     ForbiddenError,
     HTTPError,
@@ -23,13 +40,37 @@ from pyspapi.exceptions import (
     SPAPIError,
     TimeoutError,
     UnauthorizedError,
+    UnknownOutcomeError,
     ValidationError,
 )
+from pyspapi.payouts import BulkPayout, PayoutCheckpoint
+from pyspapi.pool import SPAPIPool
 from pyspapi.spworlds import SPAPI
+from pyspapi.sync import SyncSPAPI
+from pyspapi.webhooks import WebhookReceiver
 
 __all__ = [
     "SPAPI",
+    "SPAPIPool",
+    "SyncSPAPI",
+    "BulkPayout",
+    "CircuitBreaker",
+    "HedgePolicy",
+    "IdempotencyJournal",
+    "Instrumentation",
+    "PayoutCheckpoint",
+    "Priority",
+    "PrometheusCollector",
+    "RateLimiter",
+    "RequestScheduler",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SQLiteCache",
+    "SQLiteJournal",
+    "scheduling",
     "BadRequestError",
+    "CircuitOpenError",
     "ClientError",
     "ForbiddenError",
     "HTTPError",
@@ -41,7 +82,9 @@ __all__ = [
     "SPAPIError",
     "TimeoutError",
     "UnauthorizedError",
+    "UnknownOutcomeError",
     "ValidationError",
+    "WebhookReceiver",
 ]
 
 __title__: str = "pyspapi"
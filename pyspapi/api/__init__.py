@@ -1,3 +1,39 @@
-from .api import APISession
+from .api import APISession, TimeoutLike
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, SQLiteCache
+from .codec import JSONCodec, MsgspecCodec, OrjsonCodec, get_codec
+from .hedging import HedgePolicy
+from .journal import IdempotencyJournal, JournalEntry, SQLiteJournal
+from .metrics import PrometheusCollector
+from .ratelimit import RateLimiter, TokenBucket
+from .retry import RetryBudget, RetryPolicy
+from .scheduler import Priority, RequestScheduler, scheduling
+from .stream import bounded_map
+from .tracing import Instrumentation, RequestTrace
 
-__all__ = ["APISession"]
+__all__ = [
+    "APISession",
+    "CircuitBreaker",
+    "HedgePolicy",
+    "IdempotencyJournal",
+    "Instrumentation",
+    "JSONCodec",
+    "JournalEntry",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "Priority",
+    "PrometheusCollector",
+    "RateLimiter",
+    "RequestScheduler",
+    "RequestTrace",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SQLiteCache",
+    "SQLiteJournal",
+    "TimeoutLike",
+    "TokenBucket",
+    "bounded_map",
+    "get_codec",
+    "scheduling",
+]
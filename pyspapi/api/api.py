@@ -1,13 +1,25 @@
 import asyncio
-import json
+import time
 from base64 import b64encode
+from contextlib import nullcontext
 from logging import NullHandler, getLogger
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
 
 import aiohttp
 
+from pyspapi.api.breaker import CircuitBreaker
+from pyspapi.api.cache import ResponseCache
+from pyspapi.api.codec import JSONCodec, get_codec
+from pyspapi.api.hedging import HedgePolicy
+from pyspapi.api.journal import IdempotencyJournal, JournalEntry
+from pyspapi.api.ratelimit import RateLimiter, parse_retry_after
+from pyspapi.api.retry import RetryBudget, RetryPolicy
+from pyspapi.api.scheduler import RequestScheduler
+from pyspapi.api.tracing import Instrumentation, RequestTrace
 from pyspapi.exceptions import (
     BadRequestError,
+    CircuitOpenError,
     ClientError,
     ForbiddenError,
     HTTPError,
@@ -18,6 +30,7 @@ from pyspapi.exceptions import (
     ServerError,
     SPAPIError,
     UnauthorizedError,
+    UnknownOutcomeError,
     ValidationError,
 )
 from pyspapi.exceptions import (
@@ -28,29 +41,69 @@ log = getLogger("pyspapi")
 log.addHandler(NullHandler())
 
 
+TimeoutLike = Union[float, aiohttp.ClientTimeout]
+
+
 class APISession(object):
     def __init__(
         self,
         card_id: str,
         token: str,
-        timeout: int = 5,
+        timeout: float = 5,
         sleep_time: float = 0.2,
         retries: int = 0,
         raise_exception: bool = False,
         proxy: str = None,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        base_url: str = "https://spworlds.ru/api/public/",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        journal: Optional[IdempotencyJournal] = None,
+        cache: Optional[ResponseCache] = None,
+        json_codec: Union[str, JSONCodec, None] = "json",
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        hedging: Optional[HedgePolicy] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self._validate_credentials(card_id, token)
 
-        self.__url = "https://spworlds.ru/api/public/"
+        self.__url = base_url
         self.__id = card_id
         self.__token = token
-        self.__sleep_timeout = sleep_time
-        self.__retries = retries
-        self.__timeout = timeout
+        self.__headers = self._build_headers()
+        self.__retry_policy = retry_policy or RetryPolicy(
+            retries=retries, base_delay=sleep_time, budget=RetryBudget()
+        )
+        self.__timeout = aiohttp.ClientTimeout(
+            total=timeout, connect=connect_timeout, sock_read=read_timeout
+        )
         self.__raise_exception = raise_exception
         self.__proxy = proxy
+        self.__connector_limit = connector_limit
+        self.__connector_limit_per_host = connector_limit_per_host
+        self.__keepalive_timeout = keepalive_timeout
+        self.__dns_cache_ttl = dns_cache_ttl
+        self.__rate_limiter = rate_limiter
+        self.__journal = journal if journal is not None else IdempotencyJournal()
+        self.__inflight_operations: Dict[str, asyncio.Task] = {}
+        self.__cache = cache
+        self.__codec = get_codec(json_codec)
+        self.__scheduler = scheduler
+        self.__breaker = circuit_breaker
+        self.__hedging = hedging
+        self.__instrumentation = instrumentation
+        self.__trace_config = (
+            instrumentation.trace_config() if instrumentation is not None else None
+        )
         self.session: Optional[aiohttp.ClientSession] = None
         self._session_owner = False
+        self.__shared_session = False
 
     @staticmethod
     def _validate_credentials(card_id: str, token: str) -> None:
@@ -59,31 +112,112 @@ class APISession(object):
         if not token or not isinstance(token, str):
             raise ValueError("token must be a non-empty string")
 
-    async def __aenter__(self):
-        try:
-            if not self.session:
-                self.session = aiohttp.ClientSession(
-                    json_serialize=json.dumps,
-                    timeout=aiohttp.ClientTimeout(total=self.__timeout),
-                    proxy=self.__proxy,
-                )
-                self._session_owner = True
-                log.debug(f"[pyspapi] Session created with timeout={self.__timeout}s")
-            else:
-                self._session_owner = False
-        except Exception as e:
-            log.error(f"[pyspapi] Failed to create session: {e}")
-            raise
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.__connector_limit,
+            limit_per_host=self.__connector_limit_per_host,
+            keepalive_timeout=self.__keepalive_timeout,
+            ttl_dns_cache=self.__dns_cache_ttl,
+            use_dns_cache=self.__dns_cache_ttl is not None,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=self.__codec.dumps,
+            timeout=self.__timeout,
+            proxy=self.__proxy,
+            trace_configs=[self.__trace_config] if self.__trace_config else None,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.__rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    @property
+    def journal(self) -> IdempotencyJournal:
+        return self.__journal
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self.__cache
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self.__codec
+
+    @property
+    def scheduler(self) -> Optional[RequestScheduler]:
+        return self.__scheduler
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self.__breaker
+
+    @property
+    def hedging(self) -> Optional[HedgePolicy]:
+        return self.__hedging
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self.__instrumentation
+
+    @property
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return self.__timeout
+
+    @property
+    def is_started(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def start(self) -> "APISession":
+        if not self.is_started:
+            try:
+                self.session = self._create_session()
+                self.__shared_session = False
+            except Exception as e:
+                log.error("[pyspapi] Failed to create session: %s", e)
+                raise
+            log.debug(
+                "[pyspapi] Pooled session started with timeout=%ss, limit=%s, limit_per_host=%s",
+                self.__timeout.total,
+                self.__connector_limit,
+                self.__connector_limit_per_host,
+            )
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._session_owner and self.session:
+    def attach_session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """
+        Переключает клиент на чужую сессию, например общую сессию :class:`SPAPIPool`.
+
+        Такая сессия не закрывается в :meth:`close`; None отсоединяет ее.
+        """
+        self.session = session
+        self.__shared_session = session is not None
+
+    async def close(self) -> None:
+        session, self.session = self.session, None
+        if self.__shared_session:
+            self.__shared_session = False
+            return
+        if session is not None and not session.closed:
             try:
-                await self.session.close()
+                await session.close()
                 log.debug("[pyspapi] Session closed")
             except Exception as e:
-                log.error(f"[pyspapi] Error closing session: {e}")
-            self.session = None
+                log.error("[pyspapi] Error closing session: %s", e)
+
+    async def __aenter__(self):
+        self._session_owner = not self.is_started
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._session_owner:
+            await self.close()
+            self._session_owner = False
 
         return False
 
@@ -92,18 +226,34 @@ class APISession(object):
         encoded = b64encode(credentials.encode("utf-8")).decode("utf-8")
         return f"Bearer {encoded}"
 
-    def _get_headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": self._get_auth_header(),
-            "User-Agent": "https://github.com/deesiigneer/pyspapi",
-            "Content-Type": "application/json",
-        }
+    def _build_headers(self) -> Mapping[str, str]:
+        return MappingProxyType(
+            {
+                "Authorization": self._get_auth_header(),
+                "User-Agent": "https://github.com/deesiigneer/pyspapi",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def _get_headers(self) -> Mapping[str, str]:
+        return self.__headers
+
+    def update_credentials(self, card_id: str, token: str) -> None:
+        self._validate_credentials(card_id, token)
+        self.__id = card_id
+        self.__token = token
+        self.__headers = self._build_headers()
+        # Card and account snapshots belong to the previous credentials.
+        self._invalidate("card")
+        self._invalidate("accounts/me")
+        log.debug("[pyspapi] Credentials updated")
 
     def _parse_error_response(self, content: str) -> Dict[str, Any]:
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            data = self.__codec.loads(content)
+        except self.__codec.decode_errors:
             return {"raw_response": content}
+        return data if isinstance(data, dict) else {"raw_response": content}
 
     def _format_error_message(
         self, error_data: Dict[str, Any], status_code: int
@@ -131,13 +281,290 @@ class APISession(object):
         message = self._format_error_message(error_data, status_code)
 
         log.error(
-            f"[pyspapi] HTTP {status_code}: {method.upper()} {endpoint} | {message}"
+            "[pyspapi] HTTP %s: %s %s | %s",
+            status_code,
+            method.upper(),
+            endpoint,
+            message,
+        )
+
+    def _get_retry_after(
+        self, headers: Any, error_data: Dict[str, Any]
+    ) -> Optional[float]:
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = parse_retry_after(error_data.get("retry_after"))
+        return retry_after
+
+    def _retry_delay(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        previous: float,
+        deadline: Optional[float],
+        status: Optional[int] = None,
+        sent: bool = True,
+        retry_after: Optional[float] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Optional[float]:
+        policy = self.__retry_policy
+        if attempt > policy.retries or not policy.is_retryable(
+            method, status, sent, idempotent
+        ):
+            return None
+
+        delay = max(policy.backoff(attempt, previous), retry_after or 0.0)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            log.warning(
+                "[pyspapi] Deadline exceeded, not retrying: %s %s",
+                method.upper(),
+                endpoint,
+            )
+            return None
+        # The server told us when to come back, so throttling does not use up
+        # the budget meant for errors.
+        throttled = status == 429 and retry_after is not None
+        if (
+            policy.budget is not None
+            and not throttled
+            and not policy.budget.try_retry()
+        ):
+            log.warning(
+                "[pyspapi] Retry budget exhausted, not retrying: %s %s",
+                method.upper(),
+                endpoint,
+            )
+            return None
+        return delay
+
+    def _resolve_timeout(
+        self, timeout: Optional[TimeoutLike] = None
+    ) -> aiohttp.ClientTimeout:
+        if timeout is None:
+            return self.__timeout
+        if isinstance(timeout, aiohttp.ClientTimeout):
+            return timeout
+        return aiohttp.ClientTimeout(
+            total=timeout,
+            connect=self.__timeout.connect,
+            sock_read=self.__timeout.sock_read,
+            sock_connect=self.__timeout.sock_connect,
+        )
+
+    def _attempt_timeout(
+        self, deadline: Optional[float], timeout: Optional[TimeoutLike] = None
+    ) -> aiohttp.ClientTimeout:
+        timeout = self._resolve_timeout(timeout)
+        if deadline is None:
+            return timeout
+        remaining = max(deadline - time.monotonic(), 0.001)
+        return aiohttp.ClientTimeout(
+            total=remaining if timeout.total is None else min(timeout.total, remaining),
+            connect=timeout.connect,
+            sock_read=timeout.sock_read,
+            sock_connect=timeout.sock_connect,
         )
 
-    def _should_retry(self, status_code: int, attempt: int) -> bool:
-        if attempt > self.__retries:
-            return False
-        return status_code in {408, 429, 500, 502, 503, 504}
+    def _slot(self, method: str, endpoint: str):
+        if self.__scheduler is None:
+            return nullcontext()
+        return self.__scheduler.slot(method, endpoint)
+
+    async def _exchange(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        endpoint: str,
+        body: Optional[bytes],
+        headers: Mapping[str, str],
+        deadline: Optional[float],
+        timeout: aiohttp.ClientTimeout,
+        attempt: int = 1,
+        hedge: bool = False,
+        on_send: Optional[Callable[[], None]] = None,
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        breaker = self.__breaker
+        instrumentation = self.__instrumentation
+        trace = None
+        try:
+            async with self._slot(method, endpoint):
+                if on_send is not None:
+                    on_send()
+                if instrumentation is not None:
+                    trace = RequestTrace(method, endpoint, attempt, hedge)
+                    trace.bytes_sent = len(body) if body else 0
+                    await instrumentation.emit(instrumentation.on_request_start, trace)
+                async with session.request(
+                    method,
+                    url,
+                    data=body,
+                    headers=headers,
+                    timeout=self._attempt_timeout(deadline, timeout),
+                    trace_request_ctx=trace,
+                ) as resp:
+                    raw = await resp.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            if breaker is not None:
+                breaker.record(endpoint, False)
+            if trace is not None:
+                await self._trace_error(trace, e)
+            raise
+        except BaseException as e:
+            if breaker is not None:
+                breaker.release(endpoint)
+            if trace is not None:
+                await self._trace_error(trace, e)
+            raise
+
+        if breaker is not None:
+            breaker.record(endpoint, resp.status < 500)
+        if trace is not None:
+            trace.status = resp.status
+            trace.bytes_received = len(raw)
+            trace.finish()
+            await instrumentation.emit(instrumentation.on_request_end, trace)
+        return resp, raw
+
+    async def _trace_error(self, trace: RequestTrace, error: BaseException) -> None:
+        trace.error = error
+        trace.finish()
+        await self.__instrumentation.emit(self.__instrumentation.on_error, trace)
+
+    async def _trace_retry(
+        self,
+        method: str,
+        endpoint: str,
+        attempt: int,
+        delay: float,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        instrumentation = self.__instrumentation
+        if instrumentation is None or not instrumentation.on_retry:
+            return
+        trace = RequestTrace(method, endpoint, attempt)
+        trace.status = status
+        trace.error = error
+        trace.retry_delay = delay
+        await instrumentation.emit(instrumentation.on_retry, trace)
+
+    async def _hedged_exchange(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        endpoint: str,
+        body: Optional[bytes],
+        headers: Mapping[str, str],
+        deadline: Optional[float],
+        timeout: aiohttp.ClientTimeout,
+        attempt: int = 1,
+    ) -> Tuple[aiohttp.ClientResponse, bytes]:
+        hedging = self.__hedging
+        if (
+            hedging is None
+            or not hedging.applies(method)
+            or (
+                self.__breaker is not None
+                and self.__breaker.state(endpoint) != CircuitBreaker.CLOSED
+            )
+        ):
+            return await self._exchange(
+                session,
+                method,
+                url,
+                endpoint,
+                body,
+                headers,
+                deadline,
+                timeout,
+                attempt,
+            )
+
+        hedging.record_request()
+
+        async def send(
+            hedge: bool, sent: asyncio.Event
+        ) -> Tuple[aiohttp.ClientResponse, bytes, float]:
+            started = 0.0
+
+            def on_send() -> None:
+                # Waiting for a scheduler slot counts neither as latency nor as load.
+                nonlocal started
+                started = time.monotonic()
+                if hedge:
+                    hedging.issued += 1
+                sent.set()
+
+            # try_hedge() has already charged the budget, so no token is spent
+            # on a hedge the budget would refuse.
+            if hedge and self.__rate_limiter is not None:
+                await self.__rate_limiter.acquire(endpoint)
+            resp, raw = await self._exchange(
+                session,
+                method,
+                url,
+                endpoint,
+                body,
+                headers,
+                deadline,
+                timeout,
+                attempt,
+                hedge,
+                on_send,
+            )
+            return resp, raw, time.monotonic() - started
+
+        primary_sent = asyncio.Event()
+        primary = asyncio.ensure_future(send(False, primary_sent))
+        pending = {primary}
+        try:
+            waiter = asyncio.ensure_future(primary_sent.wait())
+            try:
+                await asyncio.wait(
+                    {primary, waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                waiter.cancel()
+
+            delay = hedging.delay(endpoint)
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0.0))
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and hedging.try_hedge():
+                log.debug(
+                    "[pyspapi] Hedging %s %s after %.0fms",
+                    method.upper(),
+                    endpoint,
+                    delay * 1000,
+                )
+                hedge_sent = asyncio.Event()
+                hedge = asyncio.ensure_future(send(True, hedge_sent))
+                hedge.add_done_callback(
+                    lambda _: hedge_sent.is_set() or hedging.refund()
+                )
+                pending.add(hedge)
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        resp, raw, latency = task.result()
+                        hedging.observe(endpoint, latency)
+                        if task is not primary:
+                            hedging.won += 1
+                        return resp, raw
+                    if task is primary or error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _handle_http_error(
         self,
@@ -145,12 +572,15 @@ class APISession(object):
         endpoint: str,
         status_code: int,
         content: str,
+        raise_exception: Optional[bool] = None,
     ) -> None:
         error_data = self._parse_error_response(content)
 
         self._log_error_with_details(method, endpoint, status_code, error_data, content)
 
-        if not self.__raise_exception:
+        if raise_exception is None:
+            raise_exception = self.__raise_exception
+        if not raise_exception:
             return
 
         error_message = self._format_error_message(error_data, status_code)
@@ -194,89 +624,272 @@ class APISession(object):
             )
 
     async def request(
-        self, method: str, endpoint: str, data: Optional[Dict] = None
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        return await self._request(
+            self.session, method, endpoint, data, timeout=timeout, deadline=deadline
+        )
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        idempotency_key: Optional[str] = None,
+        raise_exception: Optional[bool] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: Optional[bool] = None,
     ) -> Any:
         url = self.__url + endpoint
-        headers = self._get_headers()
+        if raise_exception is None:
+            raise_exception = self.__raise_exception
+        headers = self.__headers
+        try:
+            body = self.__codec.encode(data) if data is not None else None
+        except Exception as e:
+            log.exception(
+                "[pyspapi] Failed to encode request body: %s | %s %s",
+                e,
+                method.upper(),
+                endpoint,
+            )
+            if raise_exception:
+                raise SPAPIError(
+                    message=f"Unexpected error: {str(e)}",
+                    details={
+                        "error": str(e),
+                        "method": method,
+                        "endpoint": endpoint,
+                    },
+                )
+            return None
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        policy = self.__retry_policy
+        timeout = self._resolve_timeout(timeout)
+        if deadline is None:
+            deadline = policy.deadline
+        if deadline is not None:
+            deadline = time.monotonic() + deadline
+        if policy.budget is not None:
+            policy.budget.record_request()
 
         attempt = 0
+        delay = 0.0
+        # Set once an attempt may have reached the server without a definite answer.
+        ambiguous = False
 
         while True:
             attempt += 1
             if attempt > 1:
                 log.warning(
-                    f"[pyspapi] Retry attempt {attempt}/{self.__retries + 1}: {method.upper()} {endpoint}"
+                    "[pyspapi] Retry attempt %s/%s: %s %s",
+                    attempt,
+                    policy.retries + 1,
+                    method.upper(),
+                    endpoint,
                 )
 
+            if self.__breaker is not None and not self.__breaker.allow(endpoint):
+                retry_after = self.__breaker.retry_after(endpoint)
+                log.warning(
+                    "[pyspapi] Circuit open, failing fast: %s %s",
+                    method.upper(),
+                    endpoint,
+                )
+                if idempotency_key is not None and ambiguous:
+                    self._unknown_outcome(
+                        method, endpoint, idempotency_key, raise_exception
+                    )
+                    return None
+                if raise_exception:
+                    raise CircuitOpenError(
+                        self.__breaker.group(endpoint), retry_after=retry_after
+                    )
+                return None
+
+            if self.__rate_limiter is not None:
+                try:
+                    await self.__rate_limiter.acquire(endpoint)
+                except BaseException:
+                    # Give back the half-open probe reserved by allow().
+                    if self.__breaker is not None:
+                        self.__breaker.release(endpoint)
+                    raise
+
             try:
-                async with self.session.request(
-                    method, url, json=data, headers=headers
-                ) as resp:
-                    response_text = await resp.text()
+                resp, raw = await self._hedged_exchange(
+                    session,
+                    method,
+                    url,
+                    endpoint,
+                    body,
+                    headers,
+                    deadline,
+                    timeout,
+                    attempt,
+                )
 
-                    if resp.status == 422:
-                        try:
-                            errors = json.loads(response_text)
-                        except json.JSONDecodeError:
-                            errors = {"raw_response": response_text}
+                if resp.status >= 400:
+                    response_text = raw.decode("utf-8", "replace")
 
-                        error_msg = self._format_error_message(errors, 422)
-                        log.error(
-                            f"[pyspapi] Validation error (422): {method.upper()} {endpoint} | {error_msg}"
-                        )
-                        if self.__raise_exception:
-                            raise ValidationError(errors)
-                        return None
+                if resp.status == 422:
+                    try:
+                        errors = self.__codec.loads(raw)
+                    except self.__codec.decode_errors:
+                        errors = {"raw_response": response_text}
+
+                    error_msg = self._format_error_message(errors, 422)
+                    log.error(
+                        "[pyspapi] Validation error (422): %s %s | %s",
+                        method.upper(),
+                        endpoint,
+                        error_msg,
+                    )
+                    if raise_exception:
+                        raise ValidationError(errors)
+                    return None
 
-                    if resp.status >= 400:
-                        await self._handle_http_error(
-                            method, endpoint, resp.status, response_text
+                if resp.status >= 400:
+                    retry_after = None
+                    if resp.status >= 500:
+                        ambiguous = True
+                    if resp.status == 429:
+                        retry_after = self._get_retry_after(
+                            resp.headers, self._parse_error_response(response_text)
                         )
+                        if self.__rate_limiter is not None and retry_after:
+                            self.__rate_limiter.pause(endpoint, retry_after)
 
-                        if self._should_retry(resp.status, attempt):
-                            await asyncio.sleep(self.__sleep_timeout * attempt)
-                            continue
+                    delay = self._retry_delay(
+                        method,
+                        endpoint,
+                        attempt,
+                        delay,
+                        deadline,
+                        status=resp.status,
+                        retry_after=retry_after,
+                        idempotent=idempotent,
+                    )
+                    if delay is not None:
+                        log.warning(
+                            "[pyspapi] HTTP %s: %s %s | retrying in %.2fs",
+                            resp.status,
+                            method.upper(),
+                            endpoint,
+                            delay,
+                        )
+                        await self._trace_retry(
+                            method, endpoint, attempt, delay, status=resp.status
+                        )
+                        await asyncio.sleep(delay)
+                        continue
 
+                    if idempotency_key is not None and resp.status >= 500:
+                        self._unknown_outcome(
+                            method,
+                            endpoint,
+                            idempotency_key,
+                            raise_exception,
+                            {"status": resp.status, "response": response_text[:500]},
+                        )
                         return None
+                    await self._handle_http_error(
+                        method,
+                        endpoint,
+                        resp.status,
+                        response_text,
+                        raise_exception,
+                    )
+                    return None
 
-                    try:
-                        return await resp.json()
-                    except json.JSONDecodeError as e:
-                        log.error(
-                            f"[pyspapi] Failed to parse JSON response: {e} | Status: {resp.status}"
+                if not raw.strip():
+                    # The server accepted the operation, so it must not be resent.
+                    if idempotency_key is not None:
+                        self.__journal.complete(idempotency_key, None)
+                    return None
+
+                try:
+                    return self.__codec.loads(raw)
+                except self.__codec.decode_errors as e:
+                    log.error(
+                        "[pyspapi] Failed to parse JSON response: %s | Status: %s",
+                        e,
+                        resp.status,
+                    )
+                    if idempotency_key is not None:
+                        self._unknown_outcome(
+                            method,
+                            endpoint,
+                            idempotency_key,
+                            raise_exception,
+                            {
+                                "status": resp.status,
+                                "error": str(e),
+                                "response": raw[:500].decode("utf-8", "replace"),
+                            },
                         )
-                        if self.__raise_exception:
-                            raise SPAPIError(
-                                status_code=resp.status,
-                                message="Invalid JSON in response",
-                                details={
-                                    "error": str(e),
-                                    "response": response_text[:500],
-                                },
-                            )
                         return None
+                    if raise_exception:
+                        raise SPAPIError(
+                            status_code=resp.status,
+                            message="Invalid JSON in response",
+                            details={
+                                "error": str(e),
+                                "response": raw[:500].decode("utf-8", "replace"),
+                            },
+                        )
+                    return None
 
-            except asyncio.TimeoutError:
+            except asyncio.TimeoutError as e:
+                ambiguous = True
                 log.warning(
-                    f"[pyspapi] Request timeout ({self.__timeout}s): {method.upper()} {endpoint} | Attempt {attempt}/{self.__retries + 1}"
+                    "[pyspapi] Request timeout (%ss): %s %s | Attempt %s/%s",
+                    timeout.total,
+                    method.upper(),
+                    endpoint,
+                    attempt,
+                    policy.retries + 1,
                 )
 
-                if self._should_retry(408, attempt):
-                    await asyncio.sleep(self.__sleep_timeout * attempt)
+                delay = self._retry_delay(
+                    method, endpoint, attempt, delay, deadline, idempotent=idempotent
+                )
+                if delay is not None:
+                    await self._trace_retry(method, endpoint, attempt, delay, error=e)
+                    await asyncio.sleep(delay)
                     continue
 
                 log.error("[pyspapi] Max retries reached for timeout")
-                if self.__raise_exception:
+                if idempotency_key is not None:
+                    self._unknown_outcome(
+                        method,
+                        endpoint,
+                        idempotency_key,
+                        raise_exception,
+                        {"timeout": timeout.total, "attempt": attempt},
+                    )
+                    return None
+                if raise_exception:
                     raise APITimeoutError(
-                        timeout=self.__timeout,
+                        timeout=timeout.total,
                         endpoint=endpoint,
                         details={"method": method, "attempt": attempt},
                     )
                 return None
 
             except aiohttp.ClientSSLError as e:
-                log.error(f"[pyspapi] SSL error: {e} | {method.upper()} {endpoint}")
-                if self.__raise_exception:
+                log.error(
+                    "[pyspapi] SSL error: %s | %s %s", e, method.upper(), endpoint
+                )
+                if raise_exception:
                     raise NetworkError(
                         message=f"SSL error: {str(e)}",
                         details={
@@ -287,17 +900,50 @@ class APISession(object):
                     )
                 return None
 
-            except (aiohttp.ClientConnectorError, aiohttp.ClientOSError) as e:
+            except (
+                aiohttp.ClientConnectorError,
+                aiohttp.ClientOSError,
+                aiohttp.ServerDisconnectedError,
+                aiohttp.ClientPayloadError,
+            ) as e:
+                # A stale keep-alive connection dropped by the server surfaces as
+                # ServerDisconnectedError or ClientPayloadError after sending.
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+                ambiguous = ambiguous or sent
                 log.warning(
-                    f"[pyspapi] Connection error: {e} | {method.upper()} {endpoint} | Attempt {attempt}/{self.__retries + 1}"
+                    "[pyspapi] Connection error: %s | %s %s | Attempt %s/%s",
+                    e,
+                    method.upper(),
+                    endpoint,
+                    attempt,
+                    policy.retries + 1,
                 )
 
-                if self._should_retry(0, attempt):
-                    await asyncio.sleep(self.__sleep_timeout * attempt)
+                delay = self._retry_delay(
+                    method,
+                    endpoint,
+                    attempt,
+                    delay,
+                    deadline,
+                    sent=sent,
+                    idempotent=idempotent,
+                )
+                if delay is not None:
+                    await self._trace_retry(method, endpoint, attempt, delay, error=e)
+                    await asyncio.sleep(delay)
                     continue
 
                 log.error("[pyspapi] Max retries reached for connection error")
-                if self.__raise_exception:
+                if idempotency_key is not None and ambiguous:
+                    self._unknown_outcome(
+                        method,
+                        endpoint,
+                        idempotency_key,
+                        raise_exception,
+                        {"error": str(e), "attempt": attempt},
+                    )
+                    return None
+                if raise_exception:
                     raise NetworkError(
                         message=f"Connection error: {str(e)}",
                         details={
@@ -310,8 +956,19 @@ class APISession(object):
                 return None
 
             except aiohttp.ClientError as e:
-                log.error(f"[pyspapi] Client error: {e} | {method.upper()} {endpoint}")
-                if self.__raise_exception:
+                log.error(
+                    "[pyspapi] Client error: %s | %s %s", e, method.upper(), endpoint
+                )
+                if idempotency_key is not None:
+                    self._unknown_outcome(
+                        method,
+                        endpoint,
+                        idempotency_key,
+                        raise_exception,
+                        {"error": str(e)},
+                    )
+                    return None
+                if raise_exception:
                     raise NetworkError(
                         message=f"HTTP client error: {str(e)}",
                         details={
@@ -326,9 +983,12 @@ class APISession(object):
                 raise
             except Exception as e:
                 log.exception(
-                    f"[pyspapi] Unexpected error: {e} | {method.upper()} {endpoint}"
+                    "[pyspapi] Unexpected error: %s | %s %s",
+                    e,
+                    method.upper(),
+                    endpoint,
                 )
-                if self.__raise_exception:
+                if raise_exception:
                     raise SPAPIError(
                         message=f"Unexpected error: {str(e)}",
                         details={
@@ -339,14 +999,170 @@ class APISession(object):
                     )
                 return None
 
-    async def get(self, endpoint: str) -> Any:
-        async with self:
-            return await self.request("GET", endpoint)
+    def _unknown_outcome(
+        self,
+        method: str,
+        endpoint: str,
+        idempotency_key: str,
+        raise_exception: bool,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.__journal.mark_unknown(idempotency_key)
+        log.error(
+            "[pyspapi] Outcome of %s %s is unknown, not resending (%s)",
+            method.upper(),
+            endpoint,
+            idempotency_key,
+        )
+        if raise_exception:
+            raise UnknownOutcomeError(idempotency_key, method, endpoint, details)
+
+    async def _send(
+        self, method: str, endpoint: str, data: Optional[Dict] = None, **kwargs
+    ) -> Any:
+        if self.is_started:
+            return await self._request(self.session, method, endpoint, data, **kwargs)
+
+        async with self._create_session() as session:
+            return await self._request(session, method, endpoint, data, **kwargs)
+
+    def _check_idempotency_key(
+        self, endpoint: str, data: Optional[Dict], idempotency_key: str
+    ) -> None:
+        entry = self.__journal.get(idempotency_key)
+        if entry is not None and (entry.endpoint != endpoint or entry.payload != data):
+            raise ValueError(
+                f"idempotency_key {idempotency_key!r} was already used for another operation"
+            )
+
+    async def _send_idempotent(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        idempotency_key: str,
+        **kwargs,
+    ) -> Any:
+        task = self.__inflight_operations.get(idempotency_key)
+        if task is None:
+            self._check_idempotency_key(endpoint, data, idempotency_key)
+            entry = self.__journal.get(idempotency_key)
+            if entry is not None:
+                if entry.state == JournalEntry.COMPLETED:
+                    log.debug(
+                        "[pyspapi] Returning journaled result for %s %s (%s)",
+                        method.upper(),
+                        endpoint,
+                        idempotency_key,
+                    )
+                    return entry.result
+                if entry.state == JournalEntry.UNKNOWN:
+                    if not kwargs.get("idempotent"):
+                        raise_exception = kwargs.get("raise_exception")
+                        if raise_exception is None:
+                            raise_exception = self.__raise_exception
+                        self._unknown_outcome(
+                            method, endpoint, idempotency_key, raise_exception
+                        )
+                        return None
+                    log.warning(
+                        "[pyspapi] Replaying %s %s with unknown outcome "
+                        "under the same idempotency key (%s)",
+                        method.upper(),
+                        endpoint,
+                        idempotency_key,
+                    )
+
+            task = asyncio.ensure_future(
+                self._run_idempotent(method, endpoint, data, idempotency_key, **kwargs)
+            )
+            self.__inflight_operations[idempotency_key] = task
+            task.add_done_callback(
+                lambda _: self.__inflight_operations.pop(idempotency_key, None)
+            )
+
+        # The operation keeps running if the caller is cancelled, so the
+        # journal always learns its outcome.
+        return await asyncio.shield(task)
+
+    async def _run_idempotent(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        idempotency_key: str,
+        **kwargs,
+    ) -> Any:
+        journal = self.__journal
+        entry = journal.begin(idempotency_key, method, endpoint, data)
+        try:
+            result = await self._send(
+                method, endpoint, data, idempotency_key=idempotency_key, **kwargs
+            )
+        except asyncio.CancelledError:
+            journal.mark_unknown(idempotency_key)
+            raise
+        except Exception:
+            if entry.state == JournalEntry.PENDING:
+                journal.fail(idempotency_key)
+            raise
+
+        if result is not None:
+            journal.complete(idempotency_key, result)
+        elif entry.state == JournalEntry.PENDING:
+            journal.fail(idempotency_key)
+        return result
+
+    def _invalidate(self, prefix: Optional[str] = None) -> None:
+        if self.__cache is not None:
+            self.__cache.invalidate(prefix)
 
-    async def post(self, endpoint: str, data: Optional[Dict] = None) -> Any:
-        async with self:
-            return await self.request("POST", endpoint, data)
+    async def get(
+        self,
+        endpoint: str,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        def fetch():
+            return self._send("GET", endpoint, timeout=timeout, deadline=deadline)
 
-    async def put(self, endpoint: str, data: Optional[Dict] = None) -> Any:
-        async with self:
-            return await self.request("PUT", endpoint, data)
+        # Coalesced callers share the limits of the call that started the request.
+        if self.__cache is not None:
+            return await self.__cache.get_or_fetch(endpoint, fetch)
+        if self.__scheduler is not None and self.__scheduler.coalesce_gets:
+            return await self.__scheduler.coalesce(("GET", endpoint), fetch)
+        return await fetch()
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = False,
+    ) -> Any:
+        if idempotency_key is not None:
+            return await self._send_idempotent(
+                "POST",
+                endpoint,
+                data,
+                idempotency_key,
+                timeout=timeout,
+                deadline=deadline,
+                idempotent=idempotent,
+            )
+        return await self._send(
+            "POST", endpoint, data, timeout=timeout, deadline=deadline
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        return await self._send(
+            "PUT", endpoint, data, timeout=timeout, deadline=deadline
+        )
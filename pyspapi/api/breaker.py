@@ -0,0 +1,170 @@
+import time
+from logging import getLogger
+from typing import Dict
+
+__all__ = ["CircuitBreaker"]
+
+log = getLogger("pyspapi")
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "successes", "probes", "opened_at")
+
+    def __init__(self):
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.probes = 0
+        self.opened_at = 0.0
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель для групп эндпоинтов API.
+
+    После ``failure_threshold`` подряд неудачных запросов (таймаут, ошибка
+    соединения или ответ 5xx) группа размыкается, и запросы к ней сразу
+    завершаются ошибкой :class:`CircuitOpenError`, не дожидаясь таймаута.
+    Через ``recovery_timeout`` секунд группа переходит в полуоткрытое
+    состояние и пропускает не более ``half_open_max_calls`` пробных
+    запросов; ``success_threshold`` успешных проб замыкают ее снова, а
+    любая неудача снова размыкает.
+
+    Группы совпадают с группами :class:`RateLimiter`: ``card``,
+    ``accounts``, ``users``, ``transactions``, ``payments``.
+
+    :param failure_threshold: Число неудач подряд до размыкания. По умолчанию 5.
+    :param recovery_timeout: Время в разомкнутом состоянии в секундах. По умолчанию 30.
+    :param half_open_max_calls: Одновременных пробных запросов в полуоткрытом состоянии. По умолчанию 1.
+    :param success_threshold: Успешных проб для замыкания. По умолчанию 1.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be a positive integer")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be a positive integer")
+        if success_threshold < 1:
+            raise ValueError("success_threshold must be a positive integer")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.rejected = 0
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.states})>"
+
+    @staticmethod
+    def group(endpoint: str) -> str:
+        return endpoint.lstrip("/").split("/", 1)[0]
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        group = self.group(endpoint)
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit()
+        return circuit
+
+    def _transition(self, endpoint: str, circuit: _Circuit, state: str) -> None:
+        if circuit.state != state:
+            log.warning(
+                "[pyspapi] Circuit for '%s' %s -> %s",
+                self.group(endpoint),
+                circuit.state,
+                state,
+            )
+        circuit.state = state
+        circuit.successes = 0
+        circuit.probes = 0
+        if state == self.OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == self.CLOSED:
+            circuit.failures = 0
+
+    def state(self, endpoint: str) -> str:
+        """
+        Текущее состояние группы, к которой относится ``endpoint``.
+        """
+        circuit = self._circuits.get(self.group(endpoint))
+        if circuit is None:
+            return self.CLOSED
+        if circuit.state == self.OPEN and self.retry_after(endpoint) == 0:
+            return self.HALF_OPEN
+        return circuit.state
+
+    @property
+    def states(self) -> Dict[str, str]:
+        return {group: self.state(group) for group in self._circuits}
+
+    def retry_after(self, endpoint: str) -> float:
+        """
+        Сколько секунд группа еще останется разомкнутой.
+        """
+        circuit = self._circuits.get(self.group(endpoint))
+        if circuit is None or circuit.state != self.OPEN:
+            return 0.0
+        return max(0.0, circuit.opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Проверяет, можно ли отправить запрос, и резервирует пробу в полуоткрытом состоянии.
+
+        Каждый разрешенный запрос должен завершиться вызовом :meth:`record`
+        или :meth:`release`.
+        """
+        circuit = self._circuit(endpoint)
+        if circuit.state == self.OPEN:
+            if self.retry_after(endpoint) > 0:
+                self.rejected += 1
+                return False
+            self._transition(endpoint, circuit, self.HALF_OPEN)
+
+        if circuit.state == self.HALF_OPEN:
+            if circuit.probes >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            circuit.probes += 1
+        return True
+
+    def record(self, endpoint: str, success: bool) -> None:
+        """
+        Учитывает результат разрешенного запроса.
+        """
+        circuit = self._circuit(endpoint)
+        if circuit.state == self.HALF_OPEN:
+            circuit.probes = max(0, circuit.probes - 1)
+            if not success:
+                self._transition(endpoint, circuit, self.OPEN)
+                return
+            circuit.successes += 1
+            if circuit.successes >= self.success_threshold:
+                self._transition(endpoint, circuit, self.CLOSED)
+            return
+
+        if success:
+            circuit.failures = 0
+            return
+        circuit.failures += 1
+        if circuit.state == self.CLOSED and circuit.failures >= self.failure_threshold:
+            self._transition(endpoint, circuit, self.OPEN)
+
+    def release(self, endpoint: str) -> None:
+        """
+        Освобождает разрешение запроса, завершившегося без результата (например, отмененного).
+        """
+        circuit = self._circuit(endpoint)
+        if circuit.state == self.HALF_OPEN:
+            circuit.probes = max(0, circuit.probes - 1)
@@ -0,0 +1,364 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+__all__ = ["ResponseCache", "SQLiteCache"]
+
+log = getLogger("pyspapi")
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class ResponseCache:
+    """
+    Кеш ответов GET-запросов с ограниченным временем жизни.
+
+    Записи вытесняются по принципу LRU при превышении ``maxsize``. Одновременные
+    промахи по одному эндпоинту объединяются в один HTTP-запрос. Неудачные
+    ответы (None) не кешируются.
+
+    Если задан ``stale_ttl``, просроченная запись еще ``stale_ttl`` секунд
+    отдается сразу, а обновляется фоновым запросом (stale-while-revalidate).
+    Пока обновление не удалось, продолжает отдаваться старое значение.
+
+    :param ttl: Время жизни записи в секундах по умолчанию.
+    :param maxsize: Максимальное число записей.
+    :param ttls: Время жизни по префиксу эндпоинта, например
+        ``{"card": 5, "users/": 300}``. Значение 0 отключает кеширование.
+    :param stale_ttl: Сколько секунд после истечения ``ttl`` отдавать запись, обновляя ее в фоне.
+        По умолчанию 0 — просроченные записи не отдаются.
+    """
+
+    DEFAULT_TTLS = {
+        "card": 5.0,
+        "accounts/me": 60.0,
+        "users/": 300.0,
+        "accounts/": 300.0,
+    }
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        maxsize: int = 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        stale_ttl: float = 0.0,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must be non-negative")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(size={len(self)}, hits={self.hits}, "
+            f"stale_hits={self.stale_hits}, misses={self.misses}, coalesced={self.coalesced})>"
+        )
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def ttl_for(self, endpoint: str) -> float:
+        for prefix in self._prefixes:
+            if endpoint.startswith(prefix):
+                return self.ttls[prefix]
+        return self.ttl
+
+    def _lookup(self, endpoint: str) -> Tuple[str, Any]:
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return MISS, None
+        expires, value = entry
+        now = time.monotonic()
+        if expires <= now:
+            if expires + self.stale_ttl <= now:
+                del self._entries[endpoint]
+                return MISS, None
+            return STALE, value
+        self._entries.move_to_end(endpoint)
+        return FRESH, value
+
+    def _remember(self, endpoint: str, expires: float, value: Any) -> None:
+        self._entries[endpoint] = (expires, value)
+        self._entries.move_to_end(endpoint)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, endpoint: str) -> Tuple[bool, Any]:
+        """
+        :return: Пара ``(найдено, значение)``; просроченные записи не возвращаются.
+        """
+        state, value = self._lookup(endpoint)
+        if state != FRESH:
+            return False, None
+        return True, value
+
+    def set(self, endpoint: str, value: Any) -> None:
+        ttl = self.ttl_for(endpoint)
+        if value is None or ttl <= 0:
+            return
+        self._remember(endpoint, time.monotonic() + ttl, value)
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """
+        Удаляет записи, эндпоинт которых начинается с ``prefix``, или все записи.
+
+        :return: Количество удаленных записей.
+        """
+        self._generation += 1
+        if prefix is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    async def get_or_fetch(
+        self, endpoint: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        state, value = self._lookup(endpoint)
+        if state == FRESH:
+            self.hits += 1
+            return value
+        if state == STALE:
+            self.stale_hits += 1
+            if endpoint not in self._inflight:
+                task = asyncio.ensure_future(self._fetch(endpoint, fetch))
+                task.add_done_callback(self._log_refresh_error)
+                self._inflight[endpoint] = task
+            return value
+
+        task = self._inflight.get(endpoint)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fetch(endpoint, fetch))
+            self._inflight[endpoint] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, endpoint: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generation
+        try:
+            value = await fetch()
+            if generation == self._generation:
+                self.set(endpoint, value)
+            return value
+        finally:
+            self._inflight.pop(endpoint, None)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            log.warning(
+                "[pyspapi] Background cache refresh failed: %s", task.exception()
+            )
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Кеш ответов с сохранением в SQLite, переживающий перезапуск процесса.
+
+    Работает как :class:`ResponseCache` в памяти и дополнительно сохраняет
+    на диск ответы эндпоинтов с префиксами ``persist`` (по умолчанию
+    ``users/`` и ``accounts/``: пользователи, их карты и ``accounts/me``).
+    При промахе в памяти запись ищется в базе, поэтому после перезапуска
+    пользователи не запрашиваются заново, пока не истек их ``ttl``. Баланс
+    карты (``card``) на диск не попадает.
+
+    Время жизни на диске отсчитывается по системным часам. Если записей
+    больше ``max_entries``, удаляются дольше всего не обновлявшиеся.
+
+    Запросы к SQLite выполняются синхронно в потоке событийного цикла:
+    чтение при промахе в памяти, запись с вытеснением при каждом ответе
+    и удаление в :meth:`invalidate`. На локальном диске это десятки
+    микросекунд на операцию (см. ``benchmarks/persistent_cache.py``), но
+    медленный или сетевой диск будет задерживать все корутины клиента;
+    размещайте файл на локальном диске.
+    Ответ ``accounts/me`` зависит от карты, поэтому не используйте один
+    файл для разных карт.
+
+    .. code-block:: python
+
+        cache = SQLiteCache("spapi-cache.db", ttls={"users/": 86400, "accounts/": 3600}, stale_ttl=600)
+        spapi = SPAPI(card_id, token, cache=cache)
+        cache.warm_up()
+
+    :param path: Путь к файлу базы данных.
+    :param max_entries: Максимальное число записей на диске. По умолчанию 100000.
+    :param persist: Префиксы эндпоинтов, сохраняемых на диск.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 30.0,
+        maxsize: int = 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        stale_ttl: float = 0.0,
+        max_entries: int = 100000,
+        persist: Iterable[str] = ("users/", "accounts/"),
+    ):
+        super().__init__(ttl, maxsize, ttls, stale_ttl)
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.persist = tuple(persist)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "endpoint TEXT PRIMARY KEY, value TEXT, expires_at REAL, updated_at REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_updated_at ON responses (updated_at)"
+        )
+        (self._rows,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        self.purge()
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(path={self.path!r}, size={len(self)}, stored={self._rows}, "
+            f"hits={self.hits}, stale_hits={self.stale_hits}, misses={self.misses})>"
+        )
+
+    @property
+    def stored(self) -> int:
+        """
+        Число записей на диске.
+        """
+        return self._rows
+
+    def _persisted(self, endpoint: str) -> bool:
+        return endpoint.startswith(self.persist)
+
+    def _lookup(self, endpoint: str) -> Tuple[str, Any]:
+        state, value = super()._lookup(endpoint)
+        if state != MISS or not self._persisted(endpoint):
+            return state, value
+
+        row = self._db.execute(
+            "SELECT value, expires_at FROM responses WHERE endpoint = ?", (endpoint,)
+        ).fetchone()
+        if row is None:
+            return MISS, None
+        remaining = row[1] - time.time()
+        if remaining + self.stale_ttl <= 0:
+            return MISS, None
+        value = json.loads(row[0])
+        self._remember(endpoint, time.monotonic() + remaining, value)
+        return (FRESH if remaining > 0 else STALE), value
+
+    def set(self, endpoint: str, value: Any) -> None:
+        super().set(endpoint, value)
+        ttl = self.ttl_for(endpoint)
+        if value is None or ttl <= 0 or not self._persisted(endpoint):
+            return
+
+        now = time.time()
+        data = json.dumps(value, separators=(",", ":"))
+        cursor = self._db.execute(
+            "UPDATE responses SET value = ?, expires_at = ?, updated_at = ? WHERE endpoint = ?",
+            (data, now + ttl, now, endpoint),
+        )
+        if cursor.rowcount:
+            return
+        self._db.execute(
+            "INSERT INTO responses VALUES (?, ?, ?, ?)",
+            (endpoint, data, now + ttl, now),
+        )
+        self._rows += 1
+        if self._rows > self.max_entries:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE endpoint IN "
+                "(SELECT endpoint FROM responses ORDER BY updated_at LIMIT ?)",
+                (self._rows - self.max_entries,),
+            )
+            self._rows -= cursor.rowcount
+
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        removed = super().invalidate(prefix)
+        if prefix is None:
+            cursor = self._db.execute("DELETE FROM responses")
+        else:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE substr(endpoint, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        self._rows -= cursor.rowcount
+        return max(removed, cursor.rowcount)
+
+    def purge(self) -> int:
+        """
+        Удаляет с диска записи, которые уже нельзя отдать даже как устаревшие.
+
+        :return: Количество удаленных записей.
+        """
+        cursor = self._db.execute(
+            "DELETE FROM responses WHERE expires_at <= ?",
+            (time.time() - self.stale_ttl,),
+        )
+        self._rows -= cursor.rowcount
+        return cursor.rowcount
+
+    def warm_up(self, prefix: Optional[str] = None, limit: Optional[int] = None) -> int:
+        """
+        Загружает в память последние обновленные записи с диска.
+
+        :param prefix: Загружать только эндпоинты с этим префиксом.
+        :param limit: Максимальное число записей. По умолчанию ``maxsize``.
+
+        :return: Количество загруженных записей.
+        """
+        limit = min(limit or self.maxsize, self.maxsize)
+        now = time.time()
+        rows = self._db.execute(
+            "SELECT endpoint, value, expires_at FROM responses "
+            "WHERE expires_at > ? AND substr(endpoint, 1, ?) = ? "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (now - self.stale_ttl, len(prefix or ""), prefix or "", limit),
+        ).fetchall()
+        monotonic = time.monotonic()
+        for endpoint, value, expires_at in reversed(rows):
+            self._remember(endpoint, monotonic + expires_at - now, json.loads(value))
+        log.debug(
+            "[pyspapi] Warmed up %s cached responses from %s", len(rows), self.path
+        )
+        return len(rows)
+
+    def close(self) -> None:
+        self._db.close()
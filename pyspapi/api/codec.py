@@ -0,0 +1,115 @@
+import json
+from typing import Any, Tuple, Type, Union
+
+__all__ = ["JSONCodec", "MsgspecCodec", "OrjsonCodec", "get_codec"]
+
+
+class JSONCodec:
+    """
+    Кодек JSON на стандартной библиотеке ``json``.
+
+    Используется для сериализации тел запросов и разбора ответов API.
+    """
+
+    name = "json"
+    decode_errors: Tuple[Type[Exception], ...] = (
+        json.JSONDecodeError,
+        UnicodeDecodeError,
+    )
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # json.loads() on bytes detects the encoding and decodes with
+        # surrogatepass, which is slower than a plain UTF-8 decode.
+        if not isinstance(data, str):
+            data = str(data, "utf-8")
+        return json.loads(data)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Кодек JSON на ``orjson``. Требует установленного пакета ``orjson``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self.decode_errors = (orjson.JSONDecodeError,)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode("utf-8")
+
+    def encode(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Кодек JSON на ``msgspec``. Требует установленного пакета ``msgspec``.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self.decode_errors = (msgspec.DecodeError,)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = "json") -> JSONCodec:
+    """
+    Возвращает кодек JSON по имени.
+
+    :param codec: ``"json"``, ``"orjson"``, ``"msgspec"``, ``"auto"`` (самый
+        быстрый из установленных) или готовый объект кодека.
+    :raises ValueError: Если имя кодека неизвестно.
+    :raises ImportError: Если пакет выбранного кодека не установлен.
+    """
+    if codec is None:
+        codec = "json"
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return JSONCodec()
+    if codec not in _CODECS:
+        raise ValueError(
+            f"unknown JSON codec {codec!r}, expected one of {sorted(_CODECS)} or 'auto'"
+        )
+    return _CODECS[codec]()
@@ -0,0 +1,118 @@
+from collections import deque
+from typing import Collection, Deque, Dict
+
+from pyspapi.api.retry import RetryBudget
+
+__all__ = ["HedgePolicy"]
+
+
+class HedgePolicy:
+    """
+    Политика дублирующих (hedged) запросов для идемпотентных чтений.
+
+    Если запрос не получил ответ за ``percentile``-й процентиль недавних
+    задержек своей группы эндпоинтов, отправляется второй такой же запрос;
+    используется ответ, пришедший первым, а второй запрос отменяется.
+    Доля дублей ограничена ``max_extra_load`` от числа запросов за
+    ``window`` секунд. Задержка и измерения отсчитываются с момента, когда
+    запрос получил слот :class:`RequestScheduler`. Дубль списывается из
+    бюджета до того, как занять токен :class:`RateLimiter`; если он не успел
+    уйти до ответа на основной запрос, списание возвращается, а в ``issued``
+    учитываются только отправленные дубли.
+
+    :param percentile: Процентиль задержки, после которого отправляется дубль. По умолчанию 95.
+    :param min_delay: Нижняя граница задержки перед дублем в секундах. По умолчанию 0.01.
+    :param max_delay: Верхняя граница задержки перед дублем в секундах; используется,
+        пока не накоплено ``min_samples`` измерений. По умолчанию 1.
+    :param max_extra_load: Допустимая доля дублей от числа запросов. По умолчанию 0.05.
+    :param window: Окно для ограничения доли дублей в секундах. По умолчанию 10.
+    :param samples: Сколько последних задержек хранить для каждой группы. По умолчанию 200.
+    :param min_samples: Сколько измерений нужно для расчета процентиля. По умолчанию 20.
+    :param methods: Методы, для которых разрешены дубли. По умолчанию только GET.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_delay: float = 1.0,
+        max_extra_load: float = 0.05,
+        window: int = 10,
+        samples: int = 200,
+        min_samples: int = 20,
+        methods: Collection[str] = ("GET",),
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError("delays must satisfy 0 <= min_delay <= max_delay")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_extra_load = max_extra_load
+        self.samples = samples
+        self.min_samples = min_samples
+        self.methods = frozenset(m.upper() for m in methods)
+        self.budget = RetryBudget(ratio=max_extra_load, min_retries=1, window=window)
+        self.issued = 0
+        self.won = 0
+        self.skipped = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(percentile={self.percentile}, "
+            f"issued={self.issued}, won={self.won}, skipped={self.skipped})>"
+        )
+
+    @staticmethod
+    def group(endpoint: str) -> str:
+        return endpoint.lstrip("/").split("/", 1)[0]
+
+    def applies(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def observe(self, endpoint: str, latency: float) -> None:
+        group = self.group(endpoint)
+        latencies = self._latencies.get(group)
+        if latencies is None:
+            latencies = self._latencies[group] = deque(maxlen=self.samples)
+        latencies.append(latency)
+
+    def delay(self, endpoint: str) -> float:
+        """
+        Сколько ждать ответа на запрос к ``endpoint`` перед отправкой дубля.
+        """
+        latencies = self._latencies.get(self.group(endpoint))
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.max_delay
+        ordered = sorted(latencies)
+        value = ordered[int(self.percentile / 100 * (len(ordered) - 1))]
+        return min(self.max_delay, max(self.min_delay, value))
+
+    def record_request(self) -> None:
+        self.budget.record_request()
+
+    def try_hedge(self) -> bool:
+        """
+        Списывает один дубль из бюджета. В ``issued`` дубль учитывается
+        только после отправки.
+
+        :return: True, если дубль разрешен.
+        """
+        if self.budget.try_retry():
+            return True
+        self.skipped += 1
+        return False
+
+    def refund(self) -> None:
+        """
+        Возвращает в бюджет дубль, который не был отправлен до ответа
+        на основной запрос.
+        """
+        self.budget.refund()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"issued": self.issued, "won": self.won, "skipped": self.skipped}
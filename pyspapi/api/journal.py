@@ -0,0 +1,193 @@
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+__all__ = ["IdempotencyJournal", "JournalEntry", "SQLiteJournal"]
+
+
+class JournalEntry:
+    """
+    Запись журнала об одной логической операции.
+
+    Состояния: ``pending`` — запрос отправляется, ``completed`` — получен
+    успешный ответ (в том числе с пустым телом), ``failed`` — сервер отклонил
+    запрос или запрос не был отправлен, ``unknown`` — ответ не получен после
+    отправки (таймаут или обрыв соединения) или тело успешного ответа не
+    удалось разобрать.
+    """
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    UNKNOWN = "unknown"
+
+    __slots__ = (
+        "key",
+        "method",
+        "endpoint",
+        "payload",
+        "state",
+        "result",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        method: str,
+        endpoint: str,
+        payload: Any,
+        state: str = PENDING,
+        result: Any = None,
+        updated_at: Optional[float] = None,
+    ):
+        self.key = key
+        self.method = method
+        self.endpoint = endpoint
+        self.payload = payload
+        self.state = state
+        self.result = result
+        self.updated_at = updated_at if updated_at is not None else time.time()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(key={self.key!r}, endpoint={self.endpoint!r}, state={self.state!r})>"
+
+
+class IdempotencyJournal:
+    """
+    Журнал операций с ключами идемпотентности, хранящийся в памяти.
+
+    :param max_entries: Максимальное число записей; при переполнении
+        вытесняются самые старые завершенные операции.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, JournalEntry]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[JournalEntry]:
+        return self._entries.get(key)
+
+    def pending(self) -> List[JournalEntry]:
+        """
+        :return: Операции, исход которых еще не известен.
+        """
+        return [
+            entry
+            for entry in self._entries.values()
+            if entry.state in (JournalEntry.PENDING, JournalEntry.UNKNOWN)
+        ]
+
+    def begin(self, key: str, method: str, endpoint: str, payload: Any) -> JournalEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = JournalEntry(key, method, endpoint, payload)
+        else:
+            entry.state = JournalEntry.PENDING
+            entry.updated_at = time.time()
+        self._save(entry)
+        self._evict()
+        return entry
+
+    def complete(self, key: str, result: Any) -> None:
+        self._update(key, JournalEntry.COMPLETED, result)
+
+    def fail(self, key: str) -> None:
+        self._update(key, JournalEntry.FAILED)
+
+    def mark_unknown(self, key: str) -> None:
+        self._update(key, JournalEntry.UNKNOWN)
+
+    def _update(self, key: str, state: str, result: Any = None) -> None:
+        entry = self.get(key)
+        if entry is None:
+            return
+        entry.state = state
+        entry.result = result
+        entry.updated_at = time.time()
+        self._save(entry)
+
+    def _save(self, entry: JournalEntry) -> None:
+        self._entries[entry.key] = entry
+        self._entries.move_to_end(entry.key)
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_entries:
+                break
+            if self._entries[key].state in (
+                JournalEntry.COMPLETED,
+                JournalEntry.FAILED,
+            ):
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class SQLiteJournal(IdempotencyJournal):
+    """
+    Журнал операций, сохраняемый в SQLite и переживающий перезапуск процесса.
+
+    Операции, оставшиеся в состоянии ``pending`` после аварийного завершения,
+    при открытии журнала помечаются как ``unknown``.
+
+    :param path: Путь к файлу базы данных.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        super().__init__(max_entries)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS operations ("
+            "key TEXT PRIMARY KEY, method TEXT, endpoint TEXT, payload TEXT, "
+            "state TEXT, result TEXT, updated_at REAL)"
+        )
+        self._db.execute(
+            "UPDATE operations SET state = ? WHERE state = ?",
+            (JournalEntry.UNKNOWN, JournalEntry.PENDING),
+        )
+        rows = self._db.execute(
+            "SELECT key, method, endpoint, payload, state, result, updated_at "
+            "FROM operations ORDER BY updated_at"
+        )
+        for key, method, endpoint, payload, state, result, updated_at in rows:
+            self._entries[key] = JournalEntry(
+                key,
+                method,
+                endpoint,
+                json.loads(payload),
+                state,
+                json.loads(result) if result is not None else None,
+                updated_at,
+            )
+
+    def _save(self, entry: JournalEntry) -> None:
+        super()._save(entry)
+        self._db.execute(
+            "INSERT OR REPLACE INTO operations VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.key,
+                entry.method,
+                entry.endpoint,
+                json.dumps(entry.payload),
+                entry.state,
+                json.dumps(entry.result) if entry.result is not None else None,
+                entry.updated_at,
+            ),
+        )
+
+    def _remove(self, key: str) -> None:
+        super()._remove(key)
+        self._db.execute("DELETE FROM operations WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._db.close()
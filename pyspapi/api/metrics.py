@@ -0,0 +1,210 @@
+import asyncio
+from bisect import bisect_left
+from functools import partial
+from typing import Dict, List, Sequence, Tuple
+
+from pyspapi.api.tracing import Instrumentation, RequestTrace
+
+__all__ = ["PrometheusCollector"]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class PrometheusCollector:
+    """
+    Сборщик метрик запросов в текстовом формате Prometheus.
+
+    Подписывается на события :class:`Instrumentation` и считает запросы,
+    ошибки, повторы, переданные байты и гистограммы задержек. Эндпоинты
+    группируются по первому сегменту пути (``users``, ``accounts``, ...),
+    чтобы ID в путях не раздували число временных рядов.
+
+    .. code-block:: python
+
+        hooks = Instrumentation()
+        metrics = PrometheusCollector()
+        metrics.install(hooks)
+        spapi = SPAPI(card_id, token, instrumentation=hooks)
+        ...
+        print(metrics.render())
+
+    :param buckets: Границы корзин гистограммы задержек в секундах.
+    :param prefix: Префикс имен метрик. По умолчанию ``pyspapi``.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "pyspapi"
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.in_flight = 0
+        self._requests: Dict[Labels, int] = {}
+        self._errors: Dict[Labels, int] = {}
+        self._retries: Dict[Labels, int] = {}
+        self._bytes_sent: Dict[Labels, int] = {}
+        self._bytes_received: Dict[Labels, int] = {}
+        self._latency: Dict[Labels, _Histogram] = {}
+        self._ttfb: Dict[Labels, _Histogram] = {}
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(requests={sum(self._requests.values())}, "
+            f"errors={sum(self._errors.values())}, retries={sum(self._retries.values())})>"
+        )
+
+    def install(
+        self, instrumentation: Instrumentation, **labels: str
+    ) -> "PrometheusCollector":
+        """
+        Подписывает сборщик на события ``instrumentation``.
+
+        :param labels: Постоянные метки рядов этого источника, например
+            ``card="..."``, чтобы один сборщик обслуживал несколько клиентов.
+        """
+        extra = tuple(sorted(labels.items()))
+        instrumentation.on_request_start.append(self.on_request_start)
+        instrumentation.on_request_end.append(
+            partial(self.on_request_end, labels=extra)
+        )
+        instrumentation.on_retry.append(partial(self.on_retry, labels=extra))
+        instrumentation.on_error.append(partial(self.on_error, labels=extra))
+        return self
+
+    @staticmethod
+    def _inc(counter: Dict[Labels, int], labels: Labels, value: int = 1) -> None:
+        counter[labels] = counter.get(labels, 0) + value
+
+    def _observe(
+        self, histograms: Dict[Labels, _Histogram], labels: Labels, value: float
+    ) -> None:
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = _Histogram(len(self.buckets))
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            histogram.counts[index] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def on_request_start(self, trace: RequestTrace) -> None:
+        self.in_flight += 1
+
+    def on_request_end(self, trace: RequestTrace, labels: Labels = ()) -> None:
+        self.in_flight -= 1
+        labels += (("method", trace.method), ("group", trace.group))
+        self._inc(self._requests, labels + (("status", str(trace.status)),))
+        self._inc(self._bytes_sent, labels, trace.bytes_sent)
+        self._inc(self._bytes_received, labels, trace.bytes_received)
+        if trace.elapsed is not None:
+            self._observe(self._latency, labels, trace.elapsed)
+        if trace.ttfb is not None:
+            self._observe(self._ttfb, labels, trace.ttfb)
+
+    def on_retry(self, trace: RequestTrace, labels: Labels = ()) -> None:
+        labels += (("method", trace.method), ("group", trace.group))
+        self._inc(self._retries, labels)
+
+    def on_error(self, trace: RequestTrace, labels: Labels = ()) -> None:
+        self.in_flight -= 1
+        if isinstance(trace.error, asyncio.CancelledError):
+            return
+        labels += (("method", trace.method), ("group", trace.group))
+        self._inc(self._errors, labels + (("error", type(trace.error).__name__),))
+        if trace.elapsed is not None:
+            self._observe(self._latency, labels, trace.elapsed)
+
+    @staticmethod
+    def _format_labels(labels: Labels) -> str:
+        if not labels:
+            return ""
+        pairs = ",".join(
+            '%s="%s"' % (name, value.replace("\\", "\\\\").replace('"', '\\"'))
+            for name, value in labels
+        )
+        return "{%s}" % pairs
+
+    def _render_counter(
+        self, lines: List[str], name: str, help_text: str, values: Dict[Labels, int]
+    ) -> None:
+        name = f"{self.prefix}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(values.items()):
+            lines.append(f"{name}{self._format_labels(labels)} {value}")
+
+    def _render_histogram(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        values: Dict[Labels, _Histogram],
+    ) -> None:
+        name = f"{self.prefix}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, histogram.counts):
+                cumulative += count
+                bucket_labels = labels + (("le", repr(float(bound))),)
+                lines.append(
+                    f"{name}_bucket{self._format_labels(bucket_labels)} {cumulative}"
+                )
+            inf_labels = labels + (("le", "+Inf"),)
+            lines.append(
+                f"{name}_bucket{self._format_labels(inf_labels)} {histogram.count}"
+            )
+            lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        """
+        Возвращает метрики в текстовом формате Prometheus (``text/plain; version=0.0.4``).
+        """
+        lines: List[str] = []
+        self._render_counter(
+            lines, "requests_total", "HTTP responses received.", self._requests
+        )
+        self._render_counter(
+            lines,
+            "request_errors_total",
+            "Requests failed without a response.",
+            self._errors,
+        )
+        self._render_counter(
+            lines, "request_retries_total", "Retried requests.", self._retries
+        )
+        self._render_counter(
+            lines,
+            "request_sent_bytes_total",
+            "Request body bytes sent.",
+            self._bytes_sent,
+        )
+        self._render_counter(
+            lines,
+            "response_received_bytes_total",
+            "Response body bytes received.",
+            self._bytes_received,
+        )
+        self._render_histogram(
+            lines, "request_duration_seconds", "Request latency.", self._latency
+        )
+        self._render_histogram(
+            lines, "request_ttfb_seconds", "Time to response headers.", self._ttfb
+        )
+        name = f"{self.prefix}_requests_in_flight"
+        lines.append(f"# HELP {name} Requests currently on the wire.")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {self.in_flight}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+__all__ = ["RateLimiter", "TokenBucket", "parse_retry_after"]
+
+log = getLogger("pyspapi")
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Преобразует значение ``Retry-After`` (секунды или HTTP-дата) в секунды ожидания.
+
+    :return: Количество секунд или None, если значение не распознано.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class TokenBucket:
+    """
+    Асинхронное ведро токенов.
+
+    Пополняется со скоростью ``rate`` токенов в секунду до ``capacity``.
+    Ожидающие корутины обслуживаются в порядке очереди.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def pause(self, delay: float) -> None:
+        """
+        Приостанавливает выдачу токенов на ``delay`` секунд и обнуляет запас.
+        """
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + delay)
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._paused_until)
+
+    async def acquire(self) -> float:
+        """
+        Ожидает и забирает один токен.
+
+        :return: Время ожидания в секундах.
+        """
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - started
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+    Клиентский ограничитель частоты запросов.
+
+    Держит отдельное ведро токенов для каждой группы эндпоинтов (``card``,
+    ``accounts``, ``users``, ``transactions``, ``payments``) и разделяется
+    всеми корутинами, использующими один экземпляр :class:`SPAPI`.
+
+    :param rate: Запросов в секунду для групп без собственного лимита.
+    :param burst: Размер всплеска для групп без собственного лимита.
+    :param limits: Лимиты по группам в виде ``{"transactions": (rate, burst)}``.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[int] = None,
+        limits: Optional[Mapping[str, Tuple[float, Optional[int]]]] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def group(endpoint: str) -> str:
+        return endpoint.lstrip("/").split("/", 1)[0]
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        group = self.group(endpoint)
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            rate, burst = self.limits.get(group, (self.rate, self.burst))
+            bucket = self._buckets[group] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, endpoint: str) -> float:
+        waited = await self.bucket(endpoint).acquire()
+        if waited > 0.05:
+            log.debug("[pyspapi] Rate limiter delayed %s by %.3fs", endpoint, waited)
+        return waited
+
+    def pause(self, endpoint: str, delay: float) -> None:
+        log.warning(
+            "[pyspapi] Rate limit hit, pausing group '%s' for %.2fs",
+            self.group(endpoint),
+            delay,
+        )
+        self.bucket(endpoint).pause(delay)
@@ -0,0 +1,177 @@
+import random
+import time
+from typing import Collection, List, Optional
+
+__all__ = ["RetryBudget", "RetryPolicy"]
+
+
+class RetryBudget:
+    """
+    Глобальный бюджет повторов.
+
+    Разрешает повтор, только если за последние ``window`` секунд повторы
+    составили не больше ``ratio`` от числа запросов (но не меньше
+    ``min_retries`` повторов за окно), чтобы сотни корутин не устраивали
+    лавину повторов при деградации API.
+
+    :param ratio: Допустимая доля повторов от числа запросов.
+    :param min_retries: Число повторов, разрешенных за окно при малом трафике.
+    :param window: Размер скользящего окна в секундах.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: int = 10):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        if window < 1:
+            raise ValueError("window must be at least 1 second")
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = int(window)
+        self._requests: List[int] = [0] * self.window
+        self._retries: List[int] = [0] * self.window
+        self._seconds: List[int] = [0] * self.window
+
+    def _slot(self) -> int:
+        second = int(time.monotonic())
+        slot = second % self.window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._requests[slot] = 0
+            self._retries[slot] = 0
+        return slot
+
+    def _totals(self):
+        oldest = int(time.monotonic()) - self.window
+        requests = retries = 0
+        for slot, second in enumerate(self._seconds):
+            if second > oldest:
+                requests += self._requests[slot]
+                retries += self._retries[slot]
+        return requests, retries
+
+    def record_request(self) -> None:
+        self._requests[self._slot()] += 1
+
+    def try_retry(self) -> bool:
+        """
+        Списывает один повтор из бюджета.
+
+        :return: True, если повтор разрешен.
+        """
+        requests, retries = self._totals()
+        if retries >= max(self.min_retries, self.ratio * requests):
+            return False
+        self._retries[self._slot()] += 1
+        return True
+
+    def refund(self) -> None:
+        """
+        Возвращает в бюджет последний списанный повтор, если он еще в окне.
+        """
+        oldest = int(time.monotonic()) - self.window
+        for slot in sorted(
+            range(self.window), key=self._seconds.__getitem__, reverse=True
+        ):
+            if self._seconds[slot] <= oldest:
+                return
+            if self._retries[slot]:
+                self._retries[slot] -= 1
+                return
+
+
+class RetryPolicy:
+    """
+    Политика повторных запросов.
+
+    :param retries: Максимальное число повторов одного запроса.
+    :param base_delay: Базовая задержка перед повтором в секундах.
+    :param max_delay: Верхняя граница задержки в секундах.
+    :param jitter: ``"full"``, ``"decorrelated"`` или None для чистой экспоненты.
+    :param retry_statuses: HTTP-статусы, после которых запрос повторяется.
+    :param idempotent_methods: Методы, которые безопасно повторять после отправки,
+        в том числе после таймаута или обрыва соединения (например, когда сервер закрыл
+        keep-alive соединение из пула). Неидемпотентные запросы (например, ``POST transactions``) повторяются
+        только если сервер гарантированно их не обработал: соединение не
+        установлено или получен HTTP 429.
+    :param budget: Глобальный бюджет повторов или None. Повторы после HTTP 429
+        с ``Retry-After`` бюджет не расходуют: сервер сам назначил время повтора.
+    :param deadline: Предельное суммарное время запроса со всеми повторами в секундах.
+    """
+
+    JITTER_MODES = (None, "full", "decorrelated")
+
+    def __init__(
+        self,
+        retries: int = 0,
+        base_delay: float = 0.2,
+        max_delay: float = 10.0,
+        jitter: Optional[str] = "full",
+        retry_statuses: Collection[int] = (408, 429, 500, 502, 503, 504),
+        idempotent_methods: Collection[str] = (
+            "GET",
+            "HEAD",
+            "OPTIONS",
+            "PUT",
+            "DELETE",
+        ),
+        budget: Optional[RetryBudget] = None,
+        deadline: Optional[float] = None,
+    ):
+        if retries < 0:
+            raise ValueError("retries must be non-negative")
+        if jitter not in self.JITTER_MODES:
+            raise ValueError(f"jitter must be one of {self.JITTER_MODES}")
+
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.budget = budget
+        self.deadline = deadline
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(retries={self.retries}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter!r}, deadline={self.deadline})"
+        )
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def is_retryable(
+        self,
+        method: str,
+        status: Optional[int] = None,
+        sent: bool = True,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """
+        Проверяет, можно ли повторить запрос после данного исхода.
+
+        :param status: HTTP-статус ответа или None, если ответ не получен.
+        :param sent: False, если запрос гарантированно не дошел до сервера.
+        :param idempotent: Переопределяет идемпотентность метода для этого запроса.
+        """
+        if not sent or status == 429:
+            return True
+        if idempotent is None:
+            idempotent = self.is_idempotent(method)
+        if not idempotent:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def backoff(self, attempt: int, previous: float = 0.0) -> float:
+        """
+        Вычисляет задержку перед повтором номер ``attempt`` (начиная с 1).
+        """
+        if self.jitter == "decorrelated":
+            upper = max(self.base_delay, previous * 3)
+            return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        return delay
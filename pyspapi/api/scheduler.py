@@ -0,0 +1,173 @@
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+__all__ = ["Priority", "RequestScheduler", "scheduling"]
+
+
+class Priority(IntEnum):
+    """
+    Классы приоритета запросов; меньшее значение обслуживается раньше.
+    """
+
+    PAYMENT = 0
+    READ = 1
+    BACKGROUND = 2
+
+
+_priority: ContextVar[Optional[Priority]] = ContextVar("pyspapi_priority", default=None)
+_tag: ContextVar[Optional[str]] = ContextVar("pyspapi_tag", default=None)
+
+
+@contextmanager
+def scheduling(
+    priority: Optional[Priority] = None, tag: Optional[str] = None
+) -> Iterator[None]:
+    """
+    Задает приоритет и метку вызывающего для запросов внутри блока.
+
+    Значения наследуются задачами, созданными внутри блока, поэтому
+    достаточно обернуть вызов массового метода:
+
+    .. code-block:: python
+
+        with scheduling(Priority.BACKGROUND, tag="role-sync"):
+            await spapi.gather_users(ids)
+    """
+    priority_token = _priority.set(priority) if priority is not None else None
+    tag_token = _tag.set(tag) if tag is not None else None
+    try:
+        yield
+    finally:
+        if tag_token is not None:
+            _tag.reset(tag_token)
+        if priority_token is not None:
+            _priority.reset(priority_token)
+
+
+class RequestScheduler:
+    """
+    Планировщик запросов :class:`APISession`.
+
+    Ограничивает число одновременно выполняемых HTTP-запросов, выдает
+    освободившиеся слоты сначала платежам, затем чтениям, затем фоновым
+    задачам, а внутри одного приоритета — по кругу между метками
+    вызывающих, чтобы массовая синхронизация не вытесняла остальных.
+    Одинаковые одновременные GET-запросы объединяются в один.
+
+    :param max_in_flight: Максимальное число одновременных запросов. По умолчанию 10.
+    :param coalesce: Объединять одинаковые одновременные GET-запросы. По умолчанию True.
+    """
+
+    DEFAULT_TAG = "default"
+
+    def __init__(self, max_in_flight: int = 10, coalesce: bool = True):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        self.max_in_flight = max_in_flight
+        self.coalesce_gets = coalesce
+        self.in_flight = 0
+        self.coalesced = 0
+        self._queues: Dict[Priority, "OrderedDict[str, Deque[asyncio.Future]]"] = {
+            priority: OrderedDict() for priority in Priority
+        }
+        self._shared: Dict[Any, asyncio.Task] = {}
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(in_flight={self.in_flight}/{self.max_in_flight}, "
+            f"queued={self.queued}, coalesced={self.coalesced})>"
+        )
+
+    @property
+    def queued(self) -> Dict[str, int]:
+        return {
+            priority.name.lower(): sum(len(waiters) for waiters in queue.values())
+            for priority, queue in self._queues.items()
+        }
+
+    @staticmethod
+    def classify(method: str, endpoint: str) -> Priority:
+        priority = _priority.get()
+        if priority is not None:
+            return priority
+        if method.upper() != "GET" and endpoint.startswith(
+            ("transactions", "payments")
+        ):
+            return Priority.PAYMENT
+        return Priority.READ
+
+    def _has_waiters(self) -> bool:
+        return any(queue for queue in self._queues.values())
+
+    async def acquire(self, priority: Priority, tag: Optional[str] = None) -> None:
+        if self.in_flight < self.max_in_flight and not self._has_waiters():
+            self.in_flight += 1
+            return
+
+        tag = tag or self.DEFAULT_TAG
+        queue = self._queues[priority]
+        waiter = asyncio.get_running_loop().create_future()
+        queue.setdefault(tag, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiters = queue.get(tag)
+                if waiters is not None and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del queue[tag]
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        for priority in Priority:
+            queue = self._queues[priority]
+            while queue:
+                tag, waiters = next(iter(queue.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    queue.move_to_end(tag)
+                else:
+                    del queue[tag]
+                if not waiter.done():
+                    self.in_flight += 1
+                    waiter.set_result(None)
+                    return
+
+    @asynccontextmanager
+    async def slot(self, method: str, endpoint: str) -> AsyncIterator[None]:
+        await self.acquire(self.classify(method, endpoint), _tag.get())
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def coalesce(self, key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполняет ``factory`` один раз для всех одновременных вызовов с одним ключом.
+        """
+        task = self._shared.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._shared[key] = task
+            task.add_done_callback(lambda _: self._shared.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
@@ -0,0 +1,102 @@
+import asyncio
+from collections import deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
+
+__all__ = ["bounded_map"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Source = Union[Iterable[T], AsyncIterable[T]]
+
+
+async def _iterate(source: Source) -> AsyncIterator[T]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def bounded_map(
+    source: Source,
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int = 10,
+    prefetch: Optional[int] = None,
+    ordered: bool = False,
+) -> AsyncIterator[R]:
+    """
+    Применяет ``func`` к элементам ``source`` с ограниченным параллелизмом и памятью.
+
+    Элементы читаются из источника по мере освобождения мест, а задачи
+    создаются только для выполняемых вызовов, поэтому обработка 100 000
+    элементов не создает 100 000 задач. Одновременно выполняется не больше
+    ``concurrency`` вызовов, и не больше ``concurrency + prefetch``
+    элементов находятся в работе или ждут, пока их заберет потребитель.
+
+    :param source: Обычный или асинхронный итерируемый источник.
+    :param func: Асинхронная функция обработки одного элемента.
+    :param concurrency: Максимальное число одновременных вызовов. По умолчанию 10.
+    :param prefetch: Сколько готовых результатов можно держать впереди потребителя.
+        По умолчанию равно ``concurrency``.
+    :param ordered: Отдавать результаты в порядке источника, иначе — по мере готовности.
+
+    :return: Асинхронный итератор результатов ``func``. Исключение ``func``
+        пробрасывается потребителю, остальные вызовы при этом отменяются.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+    if prefetch is None:
+        prefetch = concurrency
+    if prefetch < 0:
+        raise ValueError("prefetch must be non-negative")
+
+    items = _iterate(source)
+    window: Deque[asyncio.Future] = deque()
+    running: Set[asyncio.Future] = set()
+    exhausted = False
+    try:
+        while True:
+            running.difference_update([task for task in running if task.done()])
+            while (
+                not exhausted
+                and len(running) < concurrency
+                and len(window) < concurrency + prefetch
+            ):
+                try:
+                    item = await items.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(func(item))
+                running.add(task)
+                window.append(task)
+
+            if ordered:
+                while window and window[0].done():
+                    yield window.popleft().result()
+            else:
+                for task in [task for task in window if task.done()]:
+                    window.remove(task)
+                    yield task.result()
+
+            if not window and exhausted:
+                return
+            if running:
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in window:
+            task.cancel()
+        await items.aclose()
@@ -0,0 +1,195 @@
+import inspect
+import time
+from logging import getLogger
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, List, Optional, Union
+
+import aiohttp
+
+__all__ = ["Instrumentation", "RequestTrace"]
+
+log = getLogger("pyspapi")
+
+
+class RequestTrace:
+    """
+    Сведения об одной попытке HTTP-запроса, передаваемые обработчикам :class:`Instrumentation`.
+
+    Все времена указаны в секундах. ``dns``, ``connect`` и ``ttfb`` равны
+    None, если этап не выполнялся (например, соединение взято из пула).
+    ``connect`` включает разрешение DNS и TLS-рукопожатие: aiohttp не
+    сообщает время TLS отдельно.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "group",
+        "attempt",
+        "hedge",
+        "status",
+        "error",
+        "retry_delay",
+        "started",
+        "elapsed",
+        "dns",
+        "connect",
+        "reused_connection",
+        "ttfb",
+        "bytes_sent",
+        "bytes_received",
+        "_request_started",
+        "_dns_started",
+        "_connect_started",
+    )
+
+    def __init__(
+        self, method: str, endpoint: str, attempt: int = 1, hedge: bool = False
+    ):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.group = endpoint.lstrip("/").split("/", 1)[0]
+        self.attempt = attempt
+        self.hedge = hedge
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None
+        self.started = time.monotonic()
+        self.elapsed: Optional[float] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.reused_connection = False
+        self.ttfb: Optional[float] = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._request_started: Optional[float] = None
+        self._dns_started: Optional[float] = None
+        self._connect_started: Optional[float] = None
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}({self.method} {self.endpoint}, attempt={self.attempt}, "
+            f"status={self.status}, elapsed={self.elapsed}, error={self.error!r})>"
+        )
+
+    def finish(self) -> None:
+        self.elapsed = time.monotonic() - self.started
+
+
+Hook = Callable[[RequestTrace], Union[None, Awaitable[None]]]
+
+
+class Instrumentation:
+    """
+    Обработчики событий HTTP-запросов :class:`APISession` в стиле ``aiohttp.TraceConfig``.
+
+    Каждый список содержит обычные или асинхронные функции, принимающие
+    :class:`RequestTrace`. Ошибки обработчиков логируются и не влияют на
+    запрос.
+
+    .. code-block:: python
+
+        hooks = Instrumentation()
+
+        async def on_end(trace):
+            print(trace.endpoint, trace.status, trace.elapsed)
+
+        hooks.on_request_end.append(on_end)
+        spapi = SPAPI(card_id, token, instrumentation=hooks)
+
+    * ``on_request_start`` — перед отправкой попытки;
+    * ``on_request_end`` — после получения ответа с любым статусом;
+    * ``on_retry`` — перед ожиданием повтора, задержка в ``retry_delay``;
+    * ``on_error`` — при таймауте или сетевой ошибке, исключение в ``error``.
+    """
+
+    def __init__(self):
+        self.on_request_start: List[Hook] = []
+        self.on_request_end: List[Hook] = []
+        self.on_retry: List[Hook] = []
+        self.on_error: List[Hook] = []
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(start={len(self.on_request_start)}, "
+            f"end={len(self.on_request_end)}, retry={len(self.on_retry)}, "
+            f"error={len(self.on_error)})>"
+        )
+
+    async def emit(self, hooks: List[Hook], trace: RequestTrace) -> None:
+        for hook in hooks:
+            try:
+                result = hook(trace)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                log.exception("[pyspapi] Instrumentation hook %r failed", hook)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Создает ``aiohttp.TraceConfig``, заполняющий сетевые тайминги :class:`RequestTrace`.
+        """
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(_on_request_start)
+        config.on_dns_resolvehost_start.append(_on_dns_start)
+        config.on_dns_resolvehost_end.append(_on_dns_end)
+        config.on_connection_create_start.append(_on_connect_start)
+        config.on_connection_create_end.append(_on_connect_end)
+        config.on_connection_reuseconn.append(_on_connection_reused)
+        config.on_request_end.append(_on_headers_received)
+        return config
+
+
+def _trace(context: SimpleNamespace) -> Optional[RequestTrace]:
+    trace = context.trace_request_ctx
+    return trace if isinstance(trace, RequestTrace) else None
+
+
+async def _on_request_start(
+    session: Any, context: SimpleNamespace, params: Any
+) -> None:
+    trace = _trace(context)
+    if trace is not None:
+        trace._request_started = time.monotonic()
+
+
+async def _on_dns_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    trace = _trace(context)
+    if trace is not None:
+        trace._dns_started = time.monotonic()
+
+
+async def _on_dns_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    trace = _trace(context)
+    if trace is not None and trace._dns_started is not None:
+        trace.dns = time.monotonic() - trace._dns_started
+
+
+async def _on_connect_start(
+    session: Any, context: SimpleNamespace, params: Any
+) -> None:
+    trace = _trace(context)
+    if trace is not None:
+        trace._connect_started = time.monotonic()
+
+
+async def _on_connect_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    trace = _trace(context)
+    if trace is not None and trace._connect_started is not None:
+        trace.connect = time.monotonic() - trace._connect_started
+
+
+async def _on_connection_reused(
+    session: Any, context: SimpleNamespace, params: Any
+) -> None:
+    trace = _trace(context)
+    if trace is not None:
+        trace.reused_connection = True
+
+
+async def _on_headers_received(
+    session: Any, context: SimpleNamespace, params: Any
+) -> None:
+    trace = _trace(context)
+    if trace is not None and trace._request_started is not None:
+        trace.ttfb = time.monotonic() - trace._request_started
@@ -195,3 +195,48 @@ class InsufficientBalanceError(ClientError):
             message="Insufficient balance. Not enough funds to complete the transaction.",
             details=details or {"error": "error.public.transactions.notEnoughBalance"},
         )
+
+
+class CircuitOpenError(SPAPIError):
+    """
+    Группа эндпоинтов временно отключена автоматическим выключателем.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        retry_after: float = 0.0,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(
+            message=f"Circuit open for '{group}'. Retry after {retry_after:.1f}s",
+            details=details or {"group": group, "retry_after": retry_after},
+        )
+
+
+class UnknownOutcomeError(SPAPIError):
+    """
+    Запрос отправлен, но неизвестно, выполнил ли его сервер.
+
+    Возникает, если неидемпотентная операция (перевод или платеж) прервана
+    таймаутом, обрывом соединения или ошибкой 5xx уже после отправки.
+    Операция не отправляется повторно: сверьте ее (например, по балансу
+    карты), затем вызовите ``journal.fail(key)``, если она не выполнена,
+    и повторите вызов с тем же ключом.
+    """
+
+    def __init__(
+        self,
+        idempotency_key: str,
+        method: str = "",
+        endpoint: str = "",
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.idempotency_key = idempotency_key
+        super().__init__(
+            message=f"Outcome of {method.upper()} {endpoint} is unknown "
+            f"(idempotency key {idempotency_key})",
+            details=details or {"method": method, "endpoint": endpoint},
+        )
@@ -0,0 +1,353 @@
+import asyncio
+import json
+import os
+from hashlib import sha256
+from logging import getLogger
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from pyspapi.api import TimeoutLike
+from pyspapi.exceptions import (
+    InsufficientBalanceError,
+    SPAPIError,
+    UnknownOutcomeError,
+)
+from pyspapi.types.transactions import PayoutReport, Transfer, TransferResult
+
+__all__ = ["BulkPayout", "PayoutCheckpoint"]
+
+log = getLogger("pyspapi")
+
+TransferLike = Union[Transfer, Dict[str, Any], tuple]
+
+
+class PayoutCheckpoint:
+    """
+    Файл контрольной точки массовой выплаты в формате JSON Lines.
+
+    Перед отправкой перевода на диск записывается строка ``sending``, после
+    ответа — его результат; обе записи сбрасываются через ``fsync``. Если
+    процесс упал или был отменен во время отправки, у перевода остается
+    только строка ``sending``: при возобновлении он считается переводом
+    с неизвестным исходом, как и записанные со статусом ``unknown``, и не
+    отправляется, пока его не сверят через :meth:`resolve`. Успешные переводы
+    при возобновлении пропускаются.
+
+    :param path: Путь к файлу контрольной точки.
+    """
+
+    SENDING = "sending"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._completed: Dict[str, Optional[int]] = {}
+        self._statuses: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        log.warning(
+                            "[pyspapi] Skipping corrupt checkpoint line in %s", path
+                        )
+                        continue
+                    self._load(
+                        entry["key"],
+                        entry.get("status", TransferResult.SUCCEEDED),
+                        entry.get("balance"),
+                    )
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._statuses
+
+    def __len__(self):
+        return len(self._statuses)
+
+    def _load(self, key: str, status: str, balance: Optional[int]) -> None:
+        if status == TransferResult.FAILED:
+            self._statuses.pop(key, None)
+            self._completed.pop(key, None)
+            return
+        if status == self.SENDING:
+            status = TransferResult.UNKNOWN
+        self._statuses[key] = status
+        if status == TransferResult.SUCCEEDED:
+            self._completed[key] = balance
+
+    def status(self, key: str) -> Optional[str]:
+        """
+        :return: ``succeeded``, ``unknown`` или None, если перевод не записан.
+        """
+        return self._statuses.get(key)
+
+    def balance(self, key: str) -> Optional[int]:
+        return self._completed.get(key)
+
+    def unknown(self) -> List[str]:
+        """
+        :return: Ключи переводов с неизвестным исходом.
+        """
+        return [
+            key
+            for key, status in self._statuses.items()
+            if status == TransferResult.UNKNOWN
+        ]
+
+    def begin(self, transfer: Transfer) -> None:
+        """
+        Записывает, что перевод сейчас будет отправлен.
+        """
+        self._write({"key": transfer.key, **transfer.to_json(), "status": self.SENDING})
+
+    def record(
+        self,
+        transfer: Transfer,
+        balance: Optional[int],
+        status: str = TransferResult.SUCCEEDED,
+    ) -> None:
+        self._write(
+            {
+                "key": transfer.key,
+                **transfer.to_json(),
+                "status": status,
+                "balance": balance,
+            }
+        )
+
+    def resolve(self, key: str, succeeded: bool, balance: Optional[int] = None) -> None:
+        """
+        Записывает результат сверки перевода с неизвестным исходом.
+
+        :param key: Ключ перевода.
+        :param succeeded: True, если перевод выполнен; иначе он будет отправлен
+            при следующем запуске.
+        :param balance: Баланс после перевода, если известен.
+        """
+        status = TransferResult.SUCCEEDED if succeeded else TransferResult.FAILED
+        self._write({"key": key, "status": status, "balance": balance})
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        self._load(entry["key"], entry["status"], entry.get("balance"))
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BulkPayout:
+    """
+    Массовая выплата через ``POST transactions``.
+
+    Перед отправкой один раз проверяет баланс карты против суммы пакета,
+    выполняет переводы не более чем ``concurrency`` одновременно, прекращает
+    отправку при нехватке средств и отдает результат по каждому переводу.
+
+    Ключ идемпотентности перевода берется из :attr:`Transfer.key` или
+    вычисляется из его позиции и содержимого, поэтому при возобновлении
+    по контрольной точке пакет нужно передавать в том же порядке.
+
+    Перевод, ответ на который не получен после отправки, получает статус
+    ``unknown``, а не ``failed``, и не отправляется повторно ни в этом
+    запуске, ни при возобновлении: его нужно сверить и отметить через
+    :meth:`PayoutCheckpoint.resolve`. То же относится к переводам, которые
+    отправлялись в момент падения или отмены: журнал идемпотентности по
+    умолчанию хранится в памяти и их исход не сохраняет, поэтому без сверки
+    повторная отправка могла бы выплатить их дважды.
+
+    Используется как асинхронный итератор результатов в порядке завершения
+    (после обхода сводка доступна в :attr:`report`) или через :meth:`run`.
+    """
+
+    def __init__(
+        self,
+        client,
+        transfers: Iterable[TransferLike],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+        precheck: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        self.client = client
+        self.transfers = [
+            self._normalize(index, transfer) for index, transfer in enumerate(transfers)
+        ]
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint
+        self.precheck = precheck
+        self.timeout = timeout
+        self.deadline = deadline
+        self.report = PayoutReport()
+        self._stopped = False
+
+    @staticmethod
+    def _normalize(index: int, transfer: TransferLike) -> Transfer:
+        if isinstance(transfer, Transfer):
+            receiver, amount = transfer.receiver, transfer.amount
+            comment, key = transfer.comment, transfer.key
+        elif isinstance(transfer, dict):
+            receiver, amount = transfer.get("receiver"), transfer.get("amount")
+            comment, key = transfer.get("comment", ""), transfer.get("key")
+        else:
+            receiver, amount, comment = transfer
+            key = None
+
+        if not receiver:
+            raise ValueError(f"transfer #{index}: receiver must be a non-empty string")
+        if not isinstance(amount, int) or amount <= 0:
+            raise ValueError(f"transfer #{index}: amount must be a positive integer")
+
+        if key is None:
+            digest = sha256(f"{index}:{receiver}:{amount}:{comment}".encode("utf-8"))
+            key = digest.hexdigest()[:32]
+        return Transfer(receiver, amount, comment, key)
+
+    async def _transfer(self, transfer: Transfer) -> TransferResult:
+        if self._stopped:
+            return TransferResult(transfer, TransferResult.NOT_SENT)
+
+        try:
+            response = await self.client._send_idempotent(
+                "POST",
+                "transactions",
+                transfer.to_json(),
+                transfer.key,
+                raise_exception=True,
+                timeout=self.timeout,
+                deadline=self.deadline,
+            )
+        except InsufficientBalanceError as e:
+            log.error("[pyspapi] Insufficient balance, stopping payout at %r", transfer)
+            self._stopped = True
+            return TransferResult(transfer, TransferResult.FAILED, error=e)
+        except UnknownOutcomeError as e:
+            return TransferResult(transfer, TransferResult.UNKNOWN, error=e)
+        except (SPAPIError, ValueError) as e:
+            return TransferResult(transfer, TransferResult.FAILED, error=e)
+        except Exception as e:
+            log.exception("[pyspapi] Unexpected error sending %r", transfer)
+            return TransferResult(transfer, TransferResult.UNKNOWN, error=e)
+
+        if response is None:
+            # Rejections raise with raise_exception=True, so the server accepted
+            # the request but its answer carried no result.
+            return TransferResult(transfer, TransferResult.UNKNOWN)
+        try:
+            balance = int(response.get("balance", 0))
+        except (AttributeError, TypeError, ValueError):
+            balance = None
+        return TransferResult(transfer, TransferResult.SUCCEEDED, balance=balance)
+
+    @staticmethod
+    def _resumed(
+        checkpoint: PayoutCheckpoint, transfer: Transfer
+    ) -> Optional[TransferResult]:
+        status = checkpoint.status(transfer.key)
+        if status == TransferResult.SUCCEEDED:
+            return TransferResult(
+                transfer,
+                TransferResult.SKIPPED,
+                balance=checkpoint.balance(transfer.key),
+            )
+        if status == TransferResult.UNKNOWN:
+            log.warning(
+                "[pyspapi] Not resending %r: its outcome is unknown, resolve it first",
+                transfer,
+            )
+            return TransferResult(transfer, TransferResult.UNKNOWN)
+        return None
+
+    async def _check_balance(self, transfers: List[Transfer]) -> None:
+        required = sum(transfer.amount for transfer in transfers)
+        card = await self.client.get_card(timeout=self.timeout, deadline=self.deadline)
+        balance = card.balance if card is not None else None
+        if balance is None:
+            log.warning("[pyspapi] Could not fetch balance, skipping payout pre-check")
+            return
+        if balance < required:
+            raise InsufficientBalanceError(
+                details={"balance": balance, "required": required}
+            )
+
+    async def __aiter__(self) -> AsyncIterator[TransferResult]:
+        checkpoint = (
+            PayoutCheckpoint(self.checkpoint_path) if self.checkpoint_path else None
+        )
+        try:
+            todo = []
+            for transfer in self.transfers:
+                result = (
+                    self._resumed(checkpoint, transfer)
+                    if checkpoint is not None
+                    else None
+                )
+                if result is not None:
+                    self.report.add(result)
+                    yield result
+                else:
+                    todo.append(transfer)
+
+            if self.precheck and todo:
+                await self._check_balance(todo)
+
+            pending = iter(todo)
+            results: asyncio.Queue = asyncio.Queue()
+
+            async def worker() -> None:
+                try:
+                    for transfer in pending:
+                        if checkpoint is not None and not self._stopped:
+                            checkpoint.begin(transfer)
+                        result = await self._transfer(transfer)
+                        if (
+                            checkpoint is not None
+                            and result.status != TransferResult.NOT_SENT
+                        ):
+                            checkpoint.record(transfer, result.balance, result.status)
+                        results.put_nowait(result)
+                except Exception as e:
+                    # Without a checkpoint record the payout can no longer be
+                    # resumed safely, so stop it instead of carrying on.
+                    results.put_nowait(e)
+
+            workers = [
+                asyncio.ensure_future(worker())
+                for _ in range(min(self.concurrency, len(todo)))
+            ]
+            try:
+                for _ in range(len(todo)):
+                    result = await results.get()
+                    if isinstance(result, Exception):
+                        log.error("[pyspapi] Payout stopped: %s", result)
+                        raise result
+                    self.report.add(result)
+                    yield result
+            finally:
+                for task in workers:
+                    task.cancel()
+
+            self.client._invalidate("card")
+            self.report.finish(await self.client.balance, self._stopped)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    async def run(self) -> PayoutReport:
+        """
+        Выполняет выплату целиком.
+
+        :return: Сводка по выплате.
+        :rtype: :class:`PayoutReport`
+        """
+        async for _ in self:
+            pass
+        return self.report
@@ -0,0 +1,359 @@
+import asyncio
+import heapq
+from logging import getLogger
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import aiohttp
+
+from pyspapi.api import (
+    Instrumentation,
+    PrometheusCollector,
+    RateLimiter,
+    ResponseCache,
+    TimeoutLike,
+)
+from pyspapi.payouts import BulkPayout, PayoutCheckpoint, TransferLike
+from pyspapi.spworlds import SPAPI
+from pyspapi.types.transactions import PoolPayoutReport, Transfer, TransferResult
+
+__all__ = ["SPAPIPool"]
+
+log = getLogger("pyspapi")
+
+Credentials = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+
+
+class SPAPIPool:
+    """
+    Набор клиентов :class:`SPAPI` для нескольких карт с общим пулом соединений.
+
+    Каждая карта получает собственный клиент со своими учетными данными,
+    ограничителем частоты запросов, кешем и журналом идемпотентности, но
+    после :meth:`start` все клиенты работают через одну ``aiohttp``-сессию,
+    поэтому десятки карт не держат десятки наборов сокетов. Метрики всех
+    карт собирает один :class:`PrometheusCollector` с меткой ``card``.
+
+    .. code-block:: python
+
+        async with SPAPIPool({card_a: token_a, card_b: token_b}) as pool:
+            print(await pool[card_a].balance)
+            report = await pool.create_transactions(batch)
+            print(pool.metrics.render())
+
+    :param credentials: Пары ``card_id -> token`` в виде словаря или последовательности кортежей.
+    :param rate_limiter_factory: Функция ``card_id -> RateLimiter``, создающая лимиты каждой
+        карты. По умолчанию без ограничителя.
+    :param cache_factory: Функция ``card_id -> ResponseCache``. Кеш нельзя разделять между
+        картами: ответы ``card`` у них разные. По умолчанию кеш отключен.
+    :param metrics: Сборщик метрик для всех карт. По умолчанию создается новый.
+    :param options: Остальные параметры :class:`SPAPI`, общие для всех карт
+        (``timeout``, ``retries``, ``connector_limit``, ``base_url``, ...).
+    """
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        rate_limiter_factory: Optional[Callable[[str], RateLimiter]] = None,
+        cache_factory: Optional[Callable[[str], ResponseCache]] = None,
+        metrics: Optional[PrometheusCollector] = None,
+        **options,
+    ):
+        for name in ("rate_limiter", "cache", "instrumentation"):
+            if name in options:
+                raise TypeError(
+                    f"{name} is created per card by SPAPIPool and cannot be shared"
+                )
+
+        self.rate_limiter_factory = rate_limiter_factory
+        self.cache_factory = cache_factory
+        self.metrics = metrics if metrics is not None else PrometheusCollector()
+        self._options = options
+        self._clients: Dict[str, SPAPI] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_owner = False
+
+        if isinstance(credentials, Mapping):
+            credentials = credentials.items()
+        for card_id, token in credentials:
+            self.add(card_id, token)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(cards={len(self._clients)}, started={self.is_started})>"
+
+    def __getitem__(self, card_id: str) -> SPAPI:
+        client = self._clients.get(card_id)
+        if client is None:
+            raise KeyError(f"card {card_id!r} is not in the pool")
+        return client
+
+    def __contains__(self, card_id: str) -> bool:
+        return card_id in self._clients
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._clients)
+
+    def __len__(self):
+        return len(self._clients)
+
+    @property
+    def cards(self) -> List[str]:
+        return list(self._clients)
+
+    @property
+    def is_started(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    def add(self, card_id: str, token: str) -> SPAPI:
+        """
+        Добавляет карту в пул. Если пул запущен, клиент сразу использует общую сессию.
+
+        :return: Клиент новой карты.
+        :rtype: :class:`SPAPI`
+        """
+        if card_id in self._clients:
+            raise ValueError(f"card {card_id!r} is already in the pool")
+
+        instrumentation = Instrumentation()
+        self.metrics.install(instrumentation, card=card_id)
+        client = SPAPI(
+            card_id,
+            token,
+            rate_limiter=(
+                self.rate_limiter_factory(card_id)
+                if self.rate_limiter_factory is not None
+                else None
+            ),
+            cache=(
+                self.cache_factory(card_id) if self.cache_factory is not None else None
+            ),
+            instrumentation=instrumentation,
+            **self._options,
+        )
+        if self.is_started:
+            client.attach_session(self._session)
+        self._clients[card_id] = client
+        return client
+
+    def remove(self, card_id: str) -> SPAPI:
+        """
+        Убирает карту из пула и отсоединяет ее клиент от общей сессии.
+
+        :return: Клиент убранной карты.
+        :rtype: :class:`SPAPI`
+        """
+        client = self[card_id]
+        del self._clients[card_id]
+        if client.session is self._session:
+            client.attach_session(None)
+        return client
+
+    async def start(self) -> "SPAPIPool":
+        if not self.is_started:
+            if not self._clients:
+                raise ValueError("cannot start an empty pool")
+            self._session = next(iter(self._clients.values()))._create_session()
+            for client in self._clients.values():
+                client.attach_session(self._session)
+            log.debug("[pyspapi] Pool session started for %s cards", len(self))
+        return self
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        for client in self._clients.values():
+            if client.session is session:
+                client.attach_session(None)
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+                log.debug("[pyspapi] Pool session closed")
+            except Exception as e:
+                log.error("[pyspapi] Error closing pool session: %s", e)
+
+    async def __aenter__(self):
+        self._session_owner = not self.is_started
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._session_owner:
+            await self.close()
+            self._session_owner = False
+
+        return False
+
+    async def balances(
+        self,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Optional[int]]:
+        """
+        Получает балансы всех карт параллельно.
+
+        :return: Балансы по ID карт; None, если баланс карты получить не удалось.
+        :rtype: dict[str, int]
+        """
+        cards = await asyncio.gather(
+            *(
+                client.get_card(timeout=timeout, deadline=deadline)
+                for client in self._clients.values()
+            )
+        )
+        return {
+            card_id: card.balance if card is not None else None
+            for card_id, card in zip(self._clients, cards)
+        }
+
+    def webhook_verify(
+        self, data: Union[bytes, bytearray, memoryview, str], header: Union[str, bytes]
+    ) -> Optional[str]:
+        """
+        Определяет, какой карте пула адресован вебхук.
+
+        :param data: Тело вебхука.
+        :param header: Заголовок X-Body-Hash из вебхука.
+
+        :return: ID карты, токеном которой подписан вебхук, или None.
+        :rtype: str
+        """
+        for card_id, client in self._clients.items():
+            if client.webhook_verify(data, header):
+                return card_id
+        return None
+
+    @staticmethod
+    def distribute(
+        transfers: Iterable[Transfer], balances: Mapping[str, Optional[int]]
+    ) -> Tuple[Dict[str, List[Transfer]], List[Transfer]]:
+        """
+        Распределяет переводы по картам с учетом доступного баланса.
+
+        Переводы раскладываются от крупных к мелким, каждый — на карту с
+        наибольшим остатком, поэтому нагрузка и остатки выравниваются.
+        Карты с неизвестным или нулевым балансом не используются.
+
+        :return: Переводы по ID карт и переводы, которые не покрывает ни одна карта.
+        """
+        heap = [
+            (-balance, index, card_id)
+            for index, (card_id, balance) in enumerate(balances.items())
+            if balance
+        ]
+        heapq.heapify(heap)
+        plan: Dict[str, List[Transfer]] = {}
+        unassigned: List[Transfer] = []
+        for transfer in sorted(transfers, key=lambda t: t.amount, reverse=True):
+            if not heap or -heap[0][0] < transfer.amount:
+                unassigned.append(transfer)
+                continue
+            remaining, index, card_id = heapq.heappop(heap)
+            plan.setdefault(card_id, []).append(transfer)
+            heapq.heappush(heap, (remaining + transfer.amount, index, card_id))
+        return plan, unassigned
+
+    async def create_transactions(
+        self,
+        transfers: Iterable[TransferLike],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> PoolPayoutReport:
+        """
+        Выполняет массовую выплату, распределяя переводы по картам пула.
+
+        Балансы карт запрашиваются один раз, переводы раскладываются через
+        :meth:`distribute`, и каждая карта выполняет свою часть как
+        :class:`BulkPayout` со своими лимитами. Переводы, которые не
+        покрывает ни одна карта, не отправляются.
+
+        Ключи идемпотентности вычисляются по позиции перевода во всем пакете,
+        а контрольная точка общая для всех карт, поэтому возобновленная
+        выплата пропускает уже выполненные переводы и переводы с неизвестным
+        исходом, даже если остальные попадут на другие карты.
+
+        Ошибка выплаты одной карты не прерывает остальные: ее исключение
+        попадает в ``errors`` сводки, в ``cards`` остаются переводы, выполненные
+        до ошибки, а сводка получает ``stopped=True``.
+
+        :param transfers: Переводы в любом формате :meth:`SPAPI.create_transactions`.
+        :param concurrency: Максимальное число одновременных переводов на карту. По умолчанию 5.
+        :type concurrency: int
+        :param checkpoint: Путь к файлу контрольной точки. По умолчанию None.
+        :type checkpoint: str
+        :param timeout: Таймаут каждого запроса. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждый запрос в секундах с учетом повторных попыток.
+        :type deadline: float
+
+        :return: Сводка по выплате с отчетами по картам в ``cards`` и ошибками карт в ``errors``.
+        :rtype: :class:`PoolPayoutReport`
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        report = PoolPayoutReport()
+        todo = [
+            BulkPayout._normalize(index, transfer)
+            for index, transfer in enumerate(transfers)
+        ]
+        if checkpoint is not None:
+            completed = PayoutCheckpoint(checkpoint)
+            try:
+                remaining = []
+                for transfer in todo:
+                    result = BulkPayout._resumed(completed, transfer)
+                    if result is not None:
+                        report.add(result)
+                    else:
+                        remaining.append(transfer)
+                todo = remaining
+            finally:
+                completed.close()
+
+        balances = await self.balances(timeout, deadline)
+        plan, unassigned = self.distribute(todo, balances)
+        if unassigned:
+            log.warning(
+                "[pyspapi] %s transfers exceed the balance of every card, not sending",
+                len(unassigned),
+            )
+        for transfer in unassigned:
+            report.add(TransferResult(transfer, TransferResult.NOT_SENT))
+
+        payouts = {
+            card_id: BulkPayout(
+                self[card_id], batch, concurrency, checkpoint, False, timeout, deadline
+            )
+            for card_id, batch in plan.items()
+        }
+        # Every card's payout is awaited to the end, so no transfer keeps running
+        # unobserved after one card fails.
+        results = await asyncio.gather(
+            *(payout.run() for payout in payouts.values()), return_exceptions=True
+        )
+
+        stopped = False
+        for (card_id, payout), outcome in zip(payouts.items(), results):
+            if isinstance(outcome, BaseException):
+                log.error("[pyspapi] Payout from %s failed: %r", card_id, outcome)
+                report.errors[card_id] = outcome
+                outcome = payout.report
+            report.cards[card_id] = outcome
+            for result in outcome.results:
+                report.add(result)
+            balances[card_id] = outcome.final_balance
+            stopped = stopped or outcome.stopped or card_id in report.errors
+
+        known = [balance for balance in balances.values() if balance is not None]
+        report.finish(sum(known) if known else None, stopped)
+        return report
@@ -1,34 +1,84 @@
-from base64 import b64encode
+import binascii
+import os
+import time
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from hmac import compare_digest, new
-from typing import Optional
-
-from pyspapi.api import APISession
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from pyspapi.api import (
+    APISession,
+    CircuitBreaker,
+    HedgePolicy,
+    IdempotencyJournal,
+    Instrumentation,
+    JSONCodec,
+    RateLimiter,
+    RequestScheduler,
+    ResponseCache,
+    RetryPolicy,
+    SQLiteCache,
+    TimeoutLike,
+    bounded_map,
+)
 from pyspapi.exceptions import InsufficientBalanceError
-from pyspapi.types import User
+from pyspapi.payouts import BulkPayout, TransferLike
+from pyspapi.types import CardInfo, User, UserCards, UserCardsResult, UserResult
 from pyspapi.types.me import Account
 from pyspapi.types.payment import Item
 
 __all__ = ["SPAPI"]
 
 
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
 class SPAPI(APISession):
     """
     pyspapi — высокоуровневый клиент для взаимодействия с SPWorlds API.
 
     Предоставляет удобные методы для работы с балансом карты, вебхуками,
     информацией о пользователе, транзакциями и платежами, а также верификацией вебхуков.
+
+    По умолчанию каждый вызов открывает и закрывает собственную HTTP-сессию.
+    Для переиспользования соединений между вызовами запустите пул через
+    :meth:`start` и закройте его через :meth:`close` (или используйте
+    ``async with SPAPI(...) as spapi:``).
     """
 
+    PARALLEL_VERIFY_BYTES = 1024 * 1024
+
     def __init__(
         self,
         card_id: str,
         token: str,
-        timeout: int = 5,
+        timeout: float = 5,
         sleep_time: float = 0.2,
         retries: int = 0,
         raise_exception: bool = False,
         proxy: str = None,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        base_url: str = "https://spworlds.ru/api/public/",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        journal: Optional[IdempotencyJournal] = None,
+        cache: Optional[ResponseCache] = None,
+        json_codec: Union[str, JSONCodec, None] = "json",
+        scheduler: Optional[RequestScheduler] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        hedging: Optional[HedgePolicy] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         """
         Инициализирует объект SPAPI.
@@ -38,21 +88,81 @@ class SPAPI(APISession):
         :param token: Токен API.
         :type token: str
         :param timeout: Таймаут для запросов API в секундах. По умолчанию 5.
-        :type timeout: int
-        :param sleep_time: Время ожидания между повторными запросами в секундах. По умолчанию 0.2.
+        :type timeout: float
+        :param sleep_time: Базовая задержка между повторными запросами в секундах. По умолчанию 0.2.
+            Игнорируется, если задан ``retry_policy``.
         :type sleep_time: float
         :param retries: Количество повторных попыток для неудачных запросов. По умолчанию 0.
+            Игнорируется, если задан ``retry_policy``.
         :type retries: int
         :param raise_exception: Поднимать исключения при ошибке, если True.
         :type raise_exception: bool
         :param proxy: Прокси для подключения к API. По умолчанию None.
         :type proxy: str
+        :param connector_limit: Максимальное число одновременных соединений в пуле. По умолчанию 100.
+        :type connector_limit: int
+        :param connector_limit_per_host: Максимальное число соединений к одному хосту, 0 — без ограничения. По умолчанию 0.
+        :type connector_limit_per_host: int
+        :param keepalive_timeout: Время жизни простаивающего соединения в секундах. По умолчанию 15.
+        :type keepalive_timeout: float
+        :param dns_cache_ttl: Время кеширования DNS в секундах, None отключает кеш. По умолчанию 10.
+        :type dns_cache_ttl: int
+        :param base_url: Базовый URL API. По умолчанию https://spworlds.ru/api/public/.
+        :type base_url: str
+        :param rate_limiter: Клиентский ограничитель частоты запросов. По умолчанию None.
+        :type rate_limiter: :class:`RateLimiter`
+        :param retry_policy: Политика повторных запросов. По умолчанию строится из ``retries`` и ``sleep_time``.
+        :type retry_policy: :class:`RetryPolicy`
+        :param journal: Журнал операций с ключами идемпотентности. По умолчанию хранится в памяти.
+        :type journal: :class:`IdempotencyJournal`
+        :param cache: Кеш ответов для запросов на чтение. По умолчанию отключен.
+        :type cache: :class:`ResponseCache`
+        :param json_codec: Кодек JSON для запросов и ответов: ``"json"``, ``"orjson"``,
+            ``"msgspec"``, ``"auto"`` или объект :class:`JSONCodec`. По умолчанию ``"json"``.
+        :type json_codec: str
+        :param scheduler: Планировщик запросов с приоритетами и ограничением одновременных
+            запросов. По умолчанию отключен.
+        :type scheduler: :class:`RequestScheduler`
+        :param circuit_breaker: Автоматический выключатель, быстро отклоняющий запросы к
+            недоступным группам эндпоинтов. По умолчанию отключен.
+        :type circuit_breaker: :class:`CircuitBreaker`
+        :param connect_timeout: Таймаут установки соединения в секундах. По умолчанию без отдельного ограничения.
+        :type connect_timeout: float
+        :param read_timeout: Таймаут ожидания данных от сервера в секундах. По умолчанию без отдельного ограничения.
+        :type read_timeout: float
+        :param hedging: Политика дублирующих запросов для идемпотентных чтений. По умолчанию отключена.
+        :type hedging: :class:`HedgePolicy`
+        :param instrumentation: Обработчики событий запросов для метрик и трассировки. По умолчанию отключены.
+        :type instrumentation: :class:`Instrumentation`
         """
         super().__init__(
-            card_id, token, timeout, sleep_time, retries, raise_exception, proxy
+            card_id,
+            token,
+            timeout=timeout,
+            sleep_time=sleep_time,
+            retries=retries,
+            raise_exception=raise_exception,
+            proxy=proxy,
+            connector_limit=connector_limit,
+            connector_limit_per_host=connector_limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            base_url=base_url,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            journal=journal,
+            cache=cache,
+            json_codec=json_codec,
+            scheduler=scheduler,
+            circuit_breaker=circuit_breaker,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            hedging=hedging,
+            instrumentation=instrumentation,
         )
         self.__card_id = card_id
         self.__token = token
+        self.__hmac = new(token.encode("utf-8"), digestmod=sha256)
 
     def __repr__(self):
         """
@@ -60,24 +170,49 @@ class SPAPI(APISession):
         """
         return f"{self.__class__.__name__}({vars(self)})"
 
-    @property
-    async def balance(self) -> Optional[int]:
+    async def get_card(
+        self,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[CardInfo]:
         """
-        Получает текущий баланс карты.
+        Получает баланс, вебхук и остальные данные карты одним запросом.
 
-        :return: Текущий баланс карты.
-        :rtype: int
+        При включенном кеше ответов снимок карты разделяется между
+        :attr:`balance`, :attr:`webhook` и одновременными вызовами.
+
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Объект CardInfo с данными карты.
+        :rtype: :class:`CardInfo`
         """
         try:
-            response = await super().get("card")
+            response = await super().get("card", timeout=timeout, deadline=deadline)
             if response is None:
                 return None
-            return int(response.get("balance", 0))
-        except (KeyError, ValueError, TypeError) as e:
+
+            return CardInfo.from_dict(response)
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to parse balance response: {e}")
+            log.error("Failed to parse card response: %s", e)
             return None
 
+    @property
+    async def balance(self) -> Optional[int]:
+        """
+        Получает текущий баланс карты.
+
+        :return: Текущий баланс карты.
+        :rtype: int
+        """
+        card = await self.get_card()
+        return card.balance if card is not None else None
+
     @property
     async def webhook(self) -> Optional[str]:
         """
@@ -86,50 +221,70 @@ class SPAPI(APISession):
         :return: URL вебхука.
         :rtype: str
         """
-        try:
-            response = await super().get("card")
-            if response is None:
-                return None
-            return str(response.get("webhook", ""))
-        except (KeyError, ValueError, TypeError) as e:
-            log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to parse webhook response: {e}")
-            return None
+        card = await self.get_card()
+        return card.webhook if card is not None else None
 
     @property
     async def me(self) -> Optional[Account]:
         """
         Получает информацию об аккаунте текущего пользователя.
 
+        :return: Объект Account, представляющий аккаунт текущего пользователя.
+        :rtype: :class:`Account`
+        """
+        return await self.get_me()
+
+    async def get_me(
+        self,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[Account]:
+        """
+        То же, что :attr:`me`, с ограничениями времени для этого вызова.
+
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
         :return: Объект Account, представляющий аккаунт текущего пользователя.
         :rtype: :class:`Account`
         """
         try:
-            me = await super().get("accounts/me")
+            me = await super().get("accounts/me", timeout=timeout, deadline=deadline)
             if me is None:
                 return None
 
-            return Account(
-                account_id=me.get("id"),
-                username=me.get("username"),
-                minecraftuuid=me.get("minecraftUUID"),
-                status=me.get("status"),
-                roles=me.get("roles", []),
-                cities=me.get("cities", []),
-                cards=me.get("cards", []),
-                created_at=me.get("createdAt"),
-            )
+            return Account.from_dict(me)
         except (KeyError, TypeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to parse account response: {e}")
+            log.error("Failed to parse account response: %s", e)
             return None
 
-    async def get_user(self, discord_id: int) -> Optional[User]:
+    async def get_user(
+        self,
+        discord_id: int,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[User]:
         """
         Получает информацию о пользователе по его ID в Discord.
 
         :param discord_id: ID пользователя в Discord.
         :type discord_id: int
+        :param with_cards: Запрашивать карты пользователя. Если False, выполняется
+            один запрос вместо двух, ``User.cards`` равен None, а карты можно
+            получить позже через ``await user.fetch_cards()``. По умолчанию True.
+        :type with_cards: bool
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова (обоих запросов) в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
 
         :return: Объект User, представляющий пользователя.
         :rtype: :class:`User`
@@ -137,33 +292,326 @@ class SPAPI(APISession):
         if not discord_id:
             raise ValueError("discord_id must be a non-empty integer")
 
+        started = time.monotonic()
         try:
-            user = await super().get(f"users/{discord_id}")
+            user = await super().get(
+                f"users/{discord_id}", timeout=timeout, deadline=deadline
+            )
             if user is None:
                 return None
 
-            cards = await super().get(f"accounts/{user['username']}/cards")
+            cards = None
+            if with_cards:
+                if deadline is not None:
+                    deadline = max(deadline - (time.monotonic() - started), 0.0)
+                cards = await super().get(
+                    f"accounts/{user['username']}/cards",
+                    timeout=timeout,
+                    deadline=deadline,
+                )
+                if cards is None:
+                    cards = []
+
+            return User.from_dict(user, cards, client=self)
+        except (KeyError, TypeError) as e:
+            log = __import__("logging").getLogger("pyspapi")
+            log.error("Failed to parse user response: %s", e)
+            return None
+
+    async def get_user_cards(
+        self,
+        username: str,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[List[UserCards]]:
+        """
+        Получает карты пользователя по его нику.
+
+        :param username: Ник пользователя.
+        :type username: str
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Список карт пользователя или None при ошибке.
+        :rtype: list[:class:`UserCards`]
+        """
+        if not username:
+            raise ValueError("username must be a non-empty string")
+
+        try:
+            cards = await super().get(
+                f"accounts/{username}/cards", timeout=timeout, deadline=deadline
+            )
             if cards is None:
-                cards = []
+                return None
 
-            return User(user["username"], user["uuid"], cards)
+            return [UserCards.from_dict(card) for card in cards]
         except (KeyError, TypeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to parse user response: {e}")
+            log.error("Failed to parse user cards response: %s", e)
             return None
 
+    async def get_users(
+        self,
+        discord_ids: Iterable[int],
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[UserResult]:
+        """
+        Получает информацию о нескольких пользователях параллельно.
+
+        Повторяющиеся ID запрашиваются один раз. Запросы выполняются не более
+        чем ``concurrency`` одновременно и проходят через общий ограничитель частоты
+        запросов. Ошибка по одному пользователю не прерывает обработку остальных.
+        Для больших или асинхронных источников ID используйте :meth:`stream_users`.
+
+        :param discord_ids: ID пользователей в Discord.
+        :type discord_ids: Iterable[int]
+        :param concurrency: Максимальное число одновременно обрабатываемых пользователей. По умолчанию 10.
+        :type concurrency: int
+        :param with_cards: Запрашивать карты пользователей. По умолчанию True.
+        :type with_cards: bool
+        :param timeout: Таймаут запросов по каждому пользователю. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждого пользователя в секундах. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Асинхронный итератор объектов UserResult в порядке завершения.
+        :rtype: AsyncIterator[:class:`UserResult`]
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        async for result in self.stream_users(
+            dict.fromkeys(discord_ids),
+            concurrency,
+            with_cards=with_cards,
+            timeout=timeout,
+            deadline=deadline,
+        ):
+            yield result
+
+    def stream_users(
+        self,
+        discord_ids: Union[Iterable[int], AsyncIterable[int]],
+        concurrency: int = 10,
+        prefetch: Optional[int] = None,
+        ordered: bool = False,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[UserResult]:
+        """
+        Потоково получает пользователей из обычного или асинхронного источника ID.
+
+        ID читаются из источника по мере освобождения мест, поэтому память
+        ограничена ``concurrency + prefetch`` пользователями независимо от
+        размера источника. Повторы не отбрасываются.
+
+        .. code-block:: python
+
+            async for result in spapi.stream_users(members(), ordered=True):
+                print(result.discord_id, result.user)
+
+        :param discord_ids: ID пользователей в Discord.
+        :param concurrency: Максимальное число одновременно обрабатываемых пользователей. По умолчанию 10.
+        :type concurrency: int
+        :param prefetch: Сколько готовых результатов держать впереди потребителя. По умолчанию
+            равно ``concurrency``.
+        :type prefetch: int
+        :param ordered: Отдавать результаты в порядке источника. По умолчанию — в порядке завершения.
+        :type ordered: bool
+        :param with_cards: Запрашивать карты пользователей. По умолчанию True.
+        :type with_cards: bool
+        :param timeout: Таймаут запросов по каждому пользователю. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждого пользователя в секундах. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Асинхронный итератор объектов UserResult.
+        :rtype: AsyncIterator[:class:`UserResult`]
+        """
+
+        async def fetch(discord_id: int) -> UserResult:
+            try:
+                user = await self.get_user(
+                    discord_id,
+                    with_cards=with_cards,
+                    timeout=timeout,
+                    deadline=deadline,
+                )
+                return UserResult(discord_id, user=user)
+            except Exception as e:
+                return UserResult(discord_id, error=e)
+
+        return bounded_map(discord_ids, fetch, concurrency, prefetch, ordered)
+
+    def stream_cards(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int = 10,
+        prefetch: Optional[int] = None,
+        ordered: bool = False,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[UserCardsResult]:
+        """
+        Потоково получает карты пользователей по никам, как :meth:`stream_users`.
+
+        :param usernames: Ники пользователей.
+        :param concurrency: Максимальное число одновременных запросов. По умолчанию 10.
+        :type concurrency: int
+        :param prefetch: Сколько готовых результатов держать впереди потребителя. По умолчанию
+            равно ``concurrency``.
+        :type prefetch: int
+        :param ordered: Отдавать результаты в порядке источника. По умолчанию — в порядке завершения.
+        :type ordered: bool
+        :param timeout: Таймаут каждого запроса. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждый запрос в секундах. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Асинхронный итератор объектов UserCardsResult.
+        :rtype: AsyncIterator[:class:`UserCardsResult`]
+        """
+
+        async def fetch(username: str) -> UserCardsResult:
+            try:
+                cards = await self.get_user_cards(
+                    username, timeout=timeout, deadline=deadline
+                )
+                return UserCardsResult(username, cards=cards)
+            except Exception as e:
+                return UserCardsResult(username, error=e)
+
+        return bounded_map(usernames, fetch, concurrency, prefetch, ordered)
+
+    async def gather_users(
+        self,
+        discord_ids: Iterable[int],
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> List[UserResult]:
+        """
+        То же, что :meth:`get_users`, но возвращает результаты списком в порядке ID.
+
+        :param discord_ids: ID пользователей в Discord.
+        :type discord_ids: Iterable[int]
+        :param concurrency: Максимальное число одновременно обрабатываемых пользователей. По умолчанию 10.
+        :type concurrency: int
+        :param with_cards: Запрашивать карты пользователей. По умолчанию True.
+        :type with_cards: bool
+        :param timeout: Таймаут запросов по каждому пользователю. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждого пользователя в секундах. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Список объектов UserResult.
+        :rtype: list[:class:`UserResult`]
+        """
+        ids = list(dict.fromkeys(discord_ids))
+        results = {}
+        async for result in self.get_users(
+            ids, concurrency, with_cards, timeout=timeout, deadline=deadline
+        ):
+            results[result.discord_id] = result
+        return [results[discord_id] for discord_id in ids]
+
+    async def warm_up(
+        self,
+        discord_ids: Union[Iterable[int], AsyncIterable[int]] = (),
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> int:
+        """
+        Прогревает кеш ответов перед началом работы.
+
+        Если кеш — :class:`SQLiteCache`, сначала загружает в память записи,
+        сохраненные на диске, затем запрашивает пользователей ``discord_ids``.
+        Пользователи, которые уже есть в кеше, HTTP-запросов не требуют.
+
+        :param discord_ids: ID пользователей в Discord. По умолчанию только загрузка с диска.
+        :param concurrency: Максимальное число одновременно обрабатываемых пользователей. По умолчанию 10.
+        :type concurrency: int
+        :param with_cards: Запрашивать карты пользователей. По умолчанию True.
+        :type with_cards: bool
+        :param timeout: Таймаут запросов по каждому пользователю. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждого пользователя в секундах. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Число пользователей, которые есть в кеше после прогрева.
+        :rtype: int
+        """
+        if self.cache is None:
+            raise ValueError("warm_up requires a response cache")
+        if isinstance(self.cache, SQLiteCache):
+            self.cache.warm_up()
+
+        warmed = 0
+        async for result in self.stream_users(
+            discord_ids,
+            concurrency,
+            with_cards=with_cards,
+            timeout=timeout,
+            deadline=deadline,
+        ):
+            if result.ok:
+                warmed += 1
+        return warmed
+
     async def create_transaction(
-        self, receiver: str, amount: int, comment: str
+        self,
+        receiver: str,
+        amount: int,
+        comment: str,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = False,
     ) -> Optional[int]:
         """
         Создает транзакцию.
 
+        Запрос отправляется с ключом идемпотентности и фиксируется в журнале,
+        поэтому повторный вызов с тем же ключом после успешного перевода вернет
+        сохраненный результат без отправки. Если после отправки ответ не получен
+        (таймаут, обрыв соединения, ошибка 5xx) или успешный ответ не удалось
+        разобрать, перевод не отправляется снова, а помечается как ``unknown``:
+        см. :class:`UnknownOutcomeError`.
+
         :param receiver: Получатель транзакции.
         :type receiver: str
         :param amount: Сумма транзакции.
         :type amount: int
         :param comment: Комментарий к транзакции.
         :type comment: str
+        :param idempotency_key: Ключ идемпотентности операции. По умолчанию генерируется новый.
+        :type idempotency_key: str
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+        :param idempotent: Сервер отбрасывает повторы с тем же ``Idempotency-Key``, и запрос можно
+            повторять после отправки. SPWorlds API этого не делает. По умолчанию False.
+        :type idempotent: bool
 
         :return: Баланс после транзакции.
         :rtype: int
@@ -173,25 +621,90 @@ class SPAPI(APISession):
         if not isinstance(amount, int) or amount <= 0:
             raise ValueError("amount must be a positive integer")
 
+        data = {"receiver": receiver, "amount": amount, "comment": comment}
+        idempotency_key = idempotency_key or uuid4().hex
+        self._check_idempotency_key("transactions", data, idempotency_key)
+
         try:
-            data = {"receiver": receiver, "amount": amount, "comment": comment}
-            response = await super().post("transactions", data)
+            response = await super().post(
+                "transactions",
+                data,
+                idempotency_key=idempotency_key,
+                timeout=timeout,
+                deadline=deadline,
+                idempotent=idempotent,
+            )
 
             if response is None:
                 return None
 
+            self._invalidate("card")
             return int(response.get("balance", 0))
         except (KeyError, ValueError, TypeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to create transaction: {e}")
+            log.error("Failed to create transaction: %s", e)
             return None
         except InsufficientBalanceError as ibe:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Insufficient balance for transaction: {ibe}")
+            log.error("Insufficient balance for transaction: %s", ibe)
             return None
 
+    def create_transactions(
+        self,
+        transfers: Iterable[TransferLike],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+        precheck: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> BulkPayout:
+        """
+        Создает массовую выплату.
+
+        Каждый перевод задается объектом :class:`Transfer`, словарем с ключами
+        ``receiver``, ``amount``, ``comment`` (и необязательным ``key``) или
+        кортежем ``(receiver, amount, comment)``.
+
+        .. code-block:: python
+
+            payout = spapi.create_transactions(batch, checkpoint="payout.jsonl")
+            async for result in payout:
+                print(result)
+            print(payout.report)
+
+        :param transfers: Переводы для выполнения.
+        :param concurrency: Максимальное число одновременных переводов. По умолчанию 5.
+        :type concurrency: int
+        :param checkpoint: Путь к файлу контрольной точки для возобновления выплаты. При
+            возобновлении выполненные переводы пропускаются, а переводы, исход которых не
+            известен (в том числе отправлявшиеся в момент падения), не отправляются до сверки
+            через :meth:`PayoutCheckpoint.resolve`. По умолчанию None.
+        :type checkpoint: str
+        :param precheck: Проверить баланс против суммы пакета перед отправкой. По умолчанию True.
+        :type precheck: bool
+        :param timeout: Таймаут каждого перевода. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Бюджет времени на каждый перевод в секундах с учетом повторных попыток.
+            По умолчанию ``RetryPolicy.deadline``.
+        :type deadline: float
+
+        :return: Объект выплаты; итерируется по результатам переводов.
+        :rtype: :class:`BulkPayout`
+        """
+        return BulkPayout(
+            self, transfers, concurrency, checkpoint, precheck, timeout, deadline
+        )
+
     async def create_payment(
-        self, webhook_url: str, redirect_url: str, data: str, items: list[Item]
+        self,
+        webhook_url: str,
+        redirect_url: str,
+        data: str,
+        items: list[Item],
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = False,
     ) -> Optional[str]:
         """
         Создает платеж.
@@ -203,6 +716,17 @@ class SPAPI(APISession):
         :param data: Дополнительные данные для платежа.
         :type data: str
         :param items: Элементы, включаемые в платеж.
+        :param idempotency_key: Ключ идемпотентности операции. По умолчанию генерируется новый.
+        :type idempotency_key: str
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
+        :param idempotent: Сервер отбрасывает повторы с тем же ``Idempotency-Key``, и запрос можно
+            повторять после отправки. SPWorlds API этого не делает. По умолчанию False.
+        :type idempotent: bool
 
         :return: URL для платежа или None при ошибке.
         :rtype: str
@@ -212,15 +736,24 @@ class SPAPI(APISession):
         if not items or len(items) == 0:
             raise ValueError("items must contain at least one item")
 
-        try:
-            payload = {
-                "items": items,
-                "redirectUrl": redirect_url,
-                "webhookUrl": webhook_url,
-                "data": data,
-            }
+        payload = {
+            "items": items,
+            "redirectUrl": redirect_url,
+            "webhookUrl": webhook_url,
+            "data": data,
+        }
+        idempotency_key = idempotency_key or uuid4().hex
+        self._check_idempotency_key("payments", payload, idempotency_key)
 
-            response = await super().post("payments", payload)
+        try:
+            response = await super().post(
+                "payments",
+                payload,
+                idempotency_key=idempotency_key,
+                timeout=timeout,
+                deadline=deadline,
+                idempotent=idempotent,
+            )
 
             if response is None:
                 return None
@@ -228,14 +761,25 @@ class SPAPI(APISession):
             return str(response.get("url", ""))
         except (KeyError, ValueError, TypeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to create payment: {e}")
+            log.error("Failed to create payment: %s", e)
             return None
 
-    async def update_webhook(self, url: str) -> Optional[dict]:
+    async def update_webhook(
+        self,
+        url: str,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[dict]:
         """
         Обновляет URL вебхука, связанного с картой.
 
         :param url: Новый URL вебхука.
+        :param timeout: Таймаут этого вызова: число секунд или ``aiohttp.ClientTimeout``
+            с отдельными ``connect``, ``sock_read`` и ``total``. По умолчанию таймаут клиента.
+        :type timeout: float
+        :param deadline: Общий бюджет вызова в секундах с учетом повторных попыток. По умолчанию
+            ``RetryPolicy.deadline``.
+        :type deadline: float
         :return: Ответ API в виде словаря или None при ошибке.
         """
         if not url:
@@ -243,30 +787,93 @@ class SPAPI(APISession):
 
         try:
             data = {"url": url}
-            response = await super().put("card/webhook", data)
+            response = await super().put(
+                "card/webhook", data, timeout=timeout, deadline=deadline
+            )
 
             if response is None:
                 return None
 
+            self._invalidate("card")
             return response
         except (KeyError, TypeError) as e:
             log = __import__("logging").getLogger("pyspapi")
-            log.error(f"Failed to update webhook: {e}")
+            log.error("Failed to update webhook: %s", e)
             return None
 
-    def webhook_verify(self, data: str, header: str) -> bool:
+    def update_credentials(self, card_id: str, token: str) -> None:
+        """
+        Меняет идентификатор карты и токен без пересоздания сессии.
+
+        Запросы, начатые до вызова, завершаются со старыми учетными данными.
+        Закешированные ответы ``card`` и ``accounts/me`` сбрасываются.
+
+        :param card_id: Новый идентификатор карты.
+        :type card_id: str
+        :param token: Новый токен API.
+        :type token: str
+        """
+        super().update_credentials(card_id, token)
+        self.__card_id = card_id
+        self.__token = token
+        self.__hmac = new(token.encode("utf-8"), digestmod=sha256)
+
+    def webhook_verify(
+        self, data: Union[bytes, bytearray, memoryview, str], header: Union[str, bytes]
+    ) -> bool:
         """
         Проверяет достоверность вебхука.
 
-        :param data: Данные из вебхука.
-        :type data: str
+        :param data: Тело вебхука. ``bytes``, ``bytearray`` и ``memoryview`` не копируются.
+        :type data: bytes
         :param header: Заголовок X-Body-Hash из вебхука.
 
         :return: True, если заголовок из вебхука достоверен, иначе False.
         :rtype: bool
         """
-        hmac_data = b64encode(new(self.__token.encode("utf-8"), data, sha256).digest())
-        return compare_digest(hmac_data, header.encode("utf-8"))
+        try:
+            expected = b64decode(header, validate=True)
+        except (binascii.Error, ValueError, TypeError):
+            return False
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        mac = self.__hmac.copy()
+        mac.update(data)
+        return compare_digest(mac.digest(), expected)
+
+    def verify_many(
+        self,
+        webhooks: Iterable[Tuple[Union[bytes, bytearray, memoryview, str], str]],
+        max_workers: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        Проверяет пакет вебхуков, распределяя крупные пакеты по ядрам.
+
+        Хеширование больших тел освобождает GIL, поэтому пул потоков
+        используется, только если процессу доступно больше одного ядра, а
+        суммарный размер тел не меньше :attr:`PARALLEL_VERIFY_BYTES`. Иначе
+        вебхуки проверяются последовательно, без накладных расходов на потоки.
+
+        :param webhooks: Пары ``(тело, заголовок X-Body-Hash)``.
+        :param max_workers: Максимальное число потоков. По умолчанию — число доступных ядер.
+        :type max_workers: int
+
+        :return: Результаты проверки в порядке входных данных.
+        :rtype: list[bool]
+        """
+        webhooks = list(webhooks)
+        workers = min(max_workers or _usable_cpus(), _usable_cpus(), len(webhooks))
+        if (
+            workers < 2
+            or sum(len(data) for data, _ in webhooks) < self.PARALLEL_VERIFY_BYTES
+        ):
+            return [self.webhook_verify(data, header) for data, header in webhooks]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda webhook: self.webhook_verify(*webhook), webhooks)
+            )
 
     def to_dict(self) -> dict:
         """
@@ -0,0 +1,406 @@
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Coroutine, Iterable, Iterator, List, Optional
+
+from pyspapi.api import TimeoutLike
+from pyspapi.exceptions import TimeoutError as APITimeoutError
+from pyspapi.payouts import TransferLike
+from pyspapi.spworlds import SPAPI
+from pyspapi.types import (
+    CardInfo,
+    PayoutReport,
+    User,
+    UserCards,
+    UserCardsResult,
+    UserResult,
+)
+from pyspapi.types.me import Account
+from pyspapi.types.payment import Item
+
+__all__ = ["SyncSPAPI"]
+
+
+class SyncSPAPI:
+    """
+    Синхронный клиент SPWorlds API для Django, Celery и другого синхронного кода.
+
+    Владеет одним фоновым потоком с циклом событий и одним пулом соединений
+    :class:`SPAPI`. Все методы блокирующие и безопасны для вызова из многих
+    потоков одновременно: запросы разных потоков выполняются параллельно в
+    общем цикле событий.
+
+    Принимает те же аргументы, что и :class:`SPAPI`.
+
+    .. code-block:: python
+
+        spapi = SyncSPAPI(card_id='CARD_ID', token='TOKEN')
+        print(spapi.balance)
+        spapi.close()
+    """
+
+    def __init__(self, *args, call_timeout: Optional[float] = None, **kwargs):
+        """
+        :param call_timeout: Максимальное время ожидания одного вызова в секундах. По истечении
+            вызов отменяется и выбрасывается :class:`~pyspapi.exceptions.TimeoutError`. Исход
+            отмененного перевода или платежа неизвестен: запрос мог уже дойти до сервера,
+            его результат попадет в журнал клиента. По умолчанию без ограничения.
+        :type call_timeout: float
+        """
+        self.call_timeout = call_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="pyspapi-loop", daemon=True
+        )
+        self._thread.start()
+        try:
+            self._client: SPAPI = self._call(self._create_client(args, kwargs))
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    async def _create_client(self, args, kwargs) -> SPAPI:
+        client = SPAPI(*args, **kwargs)
+        await client.start()
+        return client
+
+    def _call(self, coro: Coroutine) -> Any:
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncSPAPI cannot be called from its own event loop")
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("SyncSPAPI is closed")
+        name = getattr(coro, "__qualname__", "")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self.call_timeout)
+        except FutureTimeoutError:
+            # The call may have finished (or raised its own TimeoutError) meanwhile.
+            if not future.cancel():
+                return future.result()
+            raise APITimeoutError(
+                self.call_timeout,
+                details={"timeout": self.call_timeout, "call": name},
+            ) from None
+
+    def _iterate(self, results: AsyncIterator) -> Iterator:
+        try:
+            while True:
+                try:
+                    yield self._call(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self._call(results.aclose())
+
+    @property
+    def client(self) -> SPAPI:
+        """
+        Асинхронный клиент, которым управляет фасад.
+        """
+        return self._client
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def close(self) -> None:
+        """
+        Закрывает пул соединений и останавливает фоновый поток.
+        """
+        if self._loop.is_closed():
+            return
+        try:
+            self._call(self._client.close())
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncSPAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._client!r})"
+
+    async def _await(self, awaitable) -> Any:
+        return await awaitable
+
+    @property
+    def balance(self) -> Optional[int]:
+        """
+        Блокирующая версия :attr:`SPAPI.balance`.
+        """
+        return self._call(self._await(self._client.balance))
+
+    @property
+    def webhook(self) -> Optional[str]:
+        """
+        Блокирующая версия :attr:`SPAPI.webhook`.
+        """
+        return self._call(self._await(self._client.webhook))
+
+    @property
+    def me(self) -> Optional[Account]:
+        """
+        Блокирующая версия :attr:`SPAPI.me`.
+        """
+        return self._call(self._await(self._client.me))
+
+    def get_card(
+        self,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[CardInfo]:
+        """
+        Блокирующая версия :meth:`SPAPI.get_card`.
+        """
+        return self._call(self._client.get_card(timeout, deadline))
+
+    def get_me(
+        self,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[Account]:
+        """
+        Блокирующая версия :meth:`SPAPI.get_me`.
+        """
+        return self._call(self._client.get_me(timeout, deadline))
+
+    def get_user(
+        self,
+        discord_id: int,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[User]:
+        """
+        Блокирующая версия :meth:`SPAPI.get_user`.
+
+        Загрузить карты позже можно через :meth:`fetch_cards`.
+        """
+        return self._call(
+            self._client.get_user(discord_id, with_cards, timeout, deadline)
+        )
+
+    def fetch_cards(self, user: User) -> list:
+        """
+        Блокирующая версия ``await user.fetch_cards()``.
+        """
+        return self._call(user.fetch_cards())
+
+    def get_user_cards(
+        self,
+        username: str,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[List[UserCards]]:
+        """
+        Блокирующая версия :meth:`SPAPI.get_user_cards`.
+        """
+        return self._call(self._client.get_user_cards(username, timeout, deadline))
+
+    def get_users(
+        self,
+        discord_ids: Iterable[int],
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[UserResult]:
+        """
+        Блокирующая версия :meth:`SPAPI.get_users`: генератор результатов в порядке завершения.
+        """
+        return self._iterate(
+            self._client.get_users(
+                discord_ids, concurrency, with_cards, timeout, deadline
+            )
+        )
+
+    def stream_users(
+        self,
+        discord_ids: Iterable[int],
+        concurrency: int = 10,
+        prefetch: Optional[int] = None,
+        ordered: bool = False,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[UserResult]:
+        """
+        Блокирующая версия :meth:`SPAPI.stream_users`. Источник читается в фоновом потоке.
+        """
+        return self._iterate(
+            self._client.stream_users(
+                discord_ids,
+                concurrency,
+                prefetch,
+                ordered,
+                with_cards,
+                timeout,
+                deadline,
+            )
+        )
+
+    def stream_cards(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = 10,
+        prefetch: Optional[int] = None,
+        ordered: bool = False,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[UserCardsResult]:
+        """
+        Блокирующая версия :meth:`SPAPI.stream_cards`. Источник читается в фоновом потоке.
+        """
+        return self._iterate(
+            self._client.stream_cards(
+                usernames, concurrency, prefetch, ordered, timeout, deadline
+            )
+        )
+
+    def gather_users(
+        self,
+        discord_ids: Iterable[int],
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> List[UserResult]:
+        """
+        Блокирующая версия :meth:`SPAPI.gather_users`.
+        """
+        return self._call(
+            self._client.gather_users(
+                discord_ids, concurrency, with_cards, timeout, deadline
+            )
+        )
+
+    def warm_up(
+        self,
+        discord_ids: Iterable[int] = (),
+        concurrency: int = 10,
+        with_cards: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> int:
+        """
+        Блокирующая версия :meth:`SPAPI.warm_up`.
+        """
+        return self._call(
+            self._client.warm_up(
+                discord_ids, concurrency, with_cards, timeout, deadline
+            )
+        )
+
+    def create_transaction(
+        self,
+        receiver: str,
+        amount: int,
+        comment: str,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = False,
+    ) -> Optional[int]:
+        """
+        Блокирующая версия :meth:`SPAPI.create_transaction`.
+        """
+        return self._call(
+            self._client.create_transaction(
+                receiver,
+                amount,
+                comment,
+                idempotency_key,
+                timeout,
+                deadline,
+                idempotent,
+            )
+        )
+
+    def create_transactions(
+        self,
+        transfers: Iterable[TransferLike],
+        concurrency: int = 5,
+        checkpoint: Optional[str] = None,
+        precheck: bool = True,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> PayoutReport:
+        """
+        Блокирующая версия :meth:`SPAPI.create_transactions`: выполняет выплату и возвращает сводку.
+        """
+        payout = self._client.create_transactions(
+            transfers, concurrency, checkpoint, precheck, timeout, deadline
+        )
+        return self._call(payout.run())
+
+    def create_payment(
+        self,
+        webhook_url: str,
+        redirect_url: str,
+        data: str,
+        items: List[Item],
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = False,
+    ) -> Optional[str]:
+        """
+        Блокирующая версия :meth:`SPAPI.create_payment`.
+        """
+        return self._call(
+            self._client.create_payment(
+                webhook_url,
+                redirect_url,
+                data,
+                items,
+                idempotency_key,
+                timeout,
+                deadline,
+                idempotent,
+            )
+        )
+
+    def update_webhook(
+        self,
+        url: str,
+        timeout: Optional[TimeoutLike] = None,
+        deadline: Optional[float] = None,
+    ) -> Optional[dict]:
+        """
+        Блокирующая версия :meth:`SPAPI.update_webhook`.
+        """
+        return self._call(self._client.update_webhook(url, timeout, deadline))
+
+    def update_credentials(self, card_id: str, token: str) -> None:
+        """
+        Потокобезопасная версия :meth:`SPAPI.update_credentials`.
+        """
+
+        async def update() -> None:
+            self._client.update_credentials(card_id, token)
+
+        self._call(update())
+
+    def webhook_verify(self, data, header) -> bool:
+        """
+        То же, что :meth:`SPAPI.webhook_verify`; выполняется в вызывающем потоке.
+        """
+        return self._client.webhook_verify(data, header)
+
+    def verify_many(self, webhooks, max_workers: Optional[int] = None) -> List[bool]:
+        """
+        То же, что :meth:`SPAPI.verify_many`; выполняется в вызывающем потоке.
+        """
+        return self._client.verify_many(webhooks, max_workers)
@@ -1,5 +1,28 @@
+from pyspapi.types.card import CardInfo
 from pyspapi.types.me import Account
 from pyspapi.types.payment import Item
-from pyspapi.types.users import Cards, User
+from pyspapi.types.transactions import (
+    PayoutReport,
+    PoolPayoutReport,
+    Transfer,
+    TransferResult,
+)
+from pyspapi.types.users import User, UserCards, UserCardsResult, UserResult
+from pyspapi.types.webhooks import PaymentEvent, TransactionEvent, WebhookEvent
 
-__all__ = ["Account", "Item", "Cards", "User"]
+__all__ = [
+    "Account",
+    "CardInfo",
+    "Item",
+    "PaymentEvent",
+    "PayoutReport",
+    "PoolPayoutReport",
+    "TransactionEvent",
+    "Transfer",
+    "TransferResult",
+    "User",
+    "UserCards",
+    "UserCardsResult",
+    "UserResult",
+    "WebhookEvent",
+]
@@ -0,0 +1,46 @@
+class CardInfo:
+    __slots__ = ("_balance", "_webhook", "_extra")
+
+    def __init__(self, balance=None, webhook=None, **extra):
+        self._balance = balance
+        self._webhook = webhook
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {
+            key: value
+            for key, value in data.items()
+            if key not in ("balance", "webhook")
+        }
+        return cls(
+            balance=int(data.get("balance", 0)),
+            webhook=str(data.get("webhook", "")),
+            **extra,
+        )
+
+    def to_dict(self):
+        return {"balance": self._balance, "webhook": self._webhook, **self._extra}
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @property
+    def webhook(self):
+        return self._webhook
+
+    @property
+    def extra(self):
+        return self._extra
+
+    def __eq__(self, other):
+        if not isinstance(other, CardInfo):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self._balance, self._webhook))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(balance={self._balance!r}, webhook={self._webhook!r})>"
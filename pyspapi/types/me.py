@@ -1,4 +1,16 @@
 class City:
+    __slots__ = (
+        "_id",
+        "_name",
+        "_x",
+        "_z",
+        "_nether_x",
+        "_nether_z",
+        "_lane",
+        "_role",
+        "_created_at",
+    )
+
     def __init__(
         self,
         city_id=None,
@@ -21,6 +33,36 @@ class City:
         self._role = role
         self._created_at = created_at
 
+    @classmethod
+    def from_dict(cls, data):
+        city = data["city"]
+        return cls(
+            city_id=city["id"],
+            name=city["name"],
+            x=city["x"],
+            z=city["z"],
+            nether_x=city["netherX"],
+            nether_z=city["netherZ"],
+            lane=city["lane"],
+            role=data["role"],
+            created_at=data["createdAt"],
+        )
+
+    def to_dict(self):
+        return {
+            "city": {
+                "id": self._id,
+                "name": self._name,
+                "x": self._x,
+                "z": self._z,
+                "netherX": self._nether_x,
+                "netherZ": self._nether_z,
+                "lane": self._lane,
+            },
+            "role": self._role,
+            "createdAt": self._created_at,
+        }
+
     @property
     def id(self):
         return self._id
@@ -57,17 +99,44 @@ class City:
     def created_at(self):
         return self._created_at
 
+    def __eq__(self, other):
+        if not isinstance(other, City):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self._id, self._role))
+
     def __repr__(self):
         return f"<{self.__class__.__name__}(id={self._id!r}, name={self._name!r}, lane={self._lane!r}, role={self._role!r})>"
 
 
 class Card:
+    __slots__ = ("_id", "_name", "_number", "_color")
+
     def __init__(self, card_id=None, name=None, number=None, color=None):
         self._id = card_id
         self._name = name
         self._number = number
         self._color = color
 
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            card_id=data["id"],
+            name=data["name"],
+            number=data["number"],
+            color=data["color"],
+        )
+
+    def to_dict(self):
+        return {
+            "id": self._id,
+            "name": self._name,
+            "number": self._number,
+            "color": self._color,
+        }
+
     @property
     def id(self):
         return self._id
@@ -84,11 +153,37 @@ class Card:
     def color(self):
         return self._color
 
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return (self._id, self._name, self._number, self._color) == (
+            other._id,
+            other._name,
+            other._number,
+            other._color,
+        )
+
+    def __hash__(self):
+        return hash((self._id, self._number))
+
     def __repr__(self):
         return f"<{self.__class__.__name__}(id={self._id!r}, name={self._name!r}, number={self._number!r})>"
 
 
 class Account:
+    __slots__ = (
+        "_id",
+        "_username",
+        "_minecraftuuid",
+        "_status",
+        "_roles",
+        "_cities",
+        "_cards",
+        "_raw_cities",
+        "_raw_cards",
+        "_created_at",
+    )
+
     def __init__(
         self,
         account_id,
@@ -105,31 +200,47 @@ class Account:
         self._minecraftuuid = minecraftuuid
         self._status = status
         self._roles = roles
-        self._cities = [
-            City(
-                city_id=city["city"]["id"],
-                name=city["city"]["name"],
-                x=city["city"]["x"],
-                z=city["city"]["z"],
-                nether_x=city["city"]["netherX"],
-                nether_z=city["city"]["netherZ"],
-                lane=city["city"]["lane"],
-                role=city["role"],
-                created_at=city["createdAt"],
-            )
-            for city in cities
-        ]
-        self._cards = [
-            Card(
-                card_id=card["id"],
-                name=card["name"],
-                number=card["number"],
-                color=card["color"],
-            )
-            for card in cards
-        ]
+        # Nested models are built on first access; most callers only read
+        # the top-level fields.
+        self._raw_cities = cities
+        self._raw_cards = cards
+        self._cities = None
+        self._cards = None
         self._created_at = created_at
 
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            account_id=data.get("id"),
+            username=data.get("username"),
+            minecraftuuid=data.get("minecraftUUID"),
+            status=data.get("status"),
+            roles=data.get("roles", []),
+            cities=data.get("cities", []),
+            cards=data.get("cards", []),
+            created_at=data.get("createdAt"),
+        )
+
+    def to_dict(self):
+        return {
+            "id": self._id,
+            "username": self._username,
+            "minecraftUUID": self._minecraftuuid,
+            "status": self._status,
+            "roles": list(self._roles),
+            "cities": (
+                list(self._raw_cities)
+                if self._cities is None
+                else [city.to_dict() for city in self._cities]
+            ),
+            "cards": (
+                list(self._raw_cards)
+                if self._cards is None
+                else [card.to_dict() for card in self._cards]
+            ),
+            "createdAt": self._created_at,
+        }
+
     @property
     def id(self):
         return self._id
@@ -152,18 +263,35 @@ class Account:
 
     @property
     def cities(self):
+        if self._cities is None:
+            self._cities = [City.from_dict(city) for city in self._raw_cities]
+            self._raw_cities = None
         return self._cities
 
     @property
     def cards(self):
+        if self._cards is None:
+            self._cards = [Card.from_dict(card) for card in self._raw_cards]
+            self._raw_cards = None
         return self._cards
 
     @property
     def created_at(self):
         return self._created_at
 
+    def __eq__(self, other):
+        if not isinstance(other, Account):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self._id, self._username))
+
     def __repr__(self):
+        # Counts instead of the lists, so a repr never builds the nested models.
+        cities = self._raw_cities if self._cities is None else self._cities
+        cards = self._raw_cards if self._cards is None else self._cards
         return (
             f"<{self.__class__.__name__}(id={self._id!r}, username={self._username!r}, status={self._status!r}, "
-            f"roles={self._roles}, cities={self._cities}, cards={self._cards})>"
+            f"roles={self._roles}, cities={len(cities)}, cards={len(cards)})>"
         )
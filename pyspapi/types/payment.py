@@ -1,14 +1,40 @@
 class Item:
+    __slots__ = ("_name", "_count", "_price", "_comment")
+
     def __init__(self, name: str, count: int, price: int, comment: str):
         self._name = name
         self._count = count
         self._price = price
         self._comment = comment
 
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["count"], data["price"], data["comment"])
+
     @property
     def name(self):
         return self._name
 
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def price(self):
+        return self._price
+
+    @property
+    def comment(self):
+        return self._comment
+
+    def __eq__(self, other):
+        if not isinstance(other, Item):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __hash__(self):
+        return hash((self._name, self._count, self._price, self._comment))
+
     def __repr__(self):
         return f"<{self.__class__.__name__}(name={self._name!r}, count={self._count!r}, price={self._price!r}, comment={self._comment!r})>"
 
@@ -19,3 +45,5 @@ class Item:
             "price": self._price,
             "comment": self._comment,
         }
+
+    to_dict = to_json
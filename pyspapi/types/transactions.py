@@ -0,0 +1,157 @@
+class Transfer:
+    def __init__(self, receiver, amount, comment, key=None):
+        self._receiver = receiver
+        self._amount = amount
+        self._comment = comment
+        self._key = key
+
+    @property
+    def receiver(self):
+        return self._receiver
+
+    @property
+    def amount(self):
+        return self._amount
+
+    @property
+    def comment(self):
+        return self._comment
+
+    @property
+    def key(self):
+        return self._key
+
+    def to_json(self):
+        return {
+            "receiver": self._receiver,
+            "amount": self._amount,
+            "comment": self._comment,
+        }
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(receiver={self._receiver!r}, amount={self._amount!r}, key={self._key!r})>"
+
+
+class TransferResult:
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    NOT_SENT = "not_sent"
+    UNKNOWN = "unknown"
+
+    def __init__(self, transfer, status, balance=None, error=None):
+        self._transfer = transfer
+        self._status = status
+        self._balance = balance
+        self._error = error
+
+    @property
+    def transfer(self):
+        return self._transfer
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def ok(self):
+        return self._status in (self.SUCCEEDED, self.SKIPPED)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(transfer={self._transfer!r}, status={self._status!r}, error={self._error!r})>"
+
+
+class PayoutReport:
+    def __init__(self):
+        self._results = []
+        self._final_balance = None
+        self._stopped = False
+
+    def add(self, result):
+        self._results.append(result)
+
+    def finish(self, final_balance, stopped):
+        self._final_balance = final_balance
+        self._stopped = stopped
+
+    def _count(self, status):
+        return sum(1 for result in self._results if result.status == status)
+
+    @property
+    def results(self):
+        return self._results
+
+    @property
+    def succeeded(self):
+        return self._count(TransferResult.SUCCEEDED)
+
+    @property
+    def failed(self):
+        return self._count(TransferResult.FAILED)
+
+    @property
+    def skipped(self):
+        return self._count(TransferResult.SKIPPED)
+
+    @property
+    def not_sent(self):
+        return self._count(TransferResult.NOT_SENT)
+
+    @property
+    def unknown(self):
+        return self._count(TransferResult.UNKNOWN)
+
+    @property
+    def paid(self):
+        return sum(
+            result.transfer.amount
+            for result in self._results
+            if result.status == TransferResult.SUCCEEDED
+        )
+
+    @property
+    def failures(self):
+        return [
+            result
+            for result in self._results
+            if result.status in (TransferResult.FAILED, TransferResult.NOT_SENT)
+        ]
+
+    @property
+    def final_balance(self):
+        return self._final_balance
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(succeeded={self.succeeded}, failed={self.failed}, "
+            f"skipped={self.skipped}, not_sent={self.not_sent}, unknown={self.unknown}, "
+            f"paid={self.paid}, "
+            f"final_balance={self._final_balance!r}, stopped={self._stopped})>"
+        )
+
+
+class PoolPayoutReport(PayoutReport):
+    def __init__(self):
+        super().__init__()
+        self._cards = {}
+        self._errors = {}
+
+    @property
+    def cards(self):
+        return self._cards
+
+    @property
+    def errors(self):
+        return self._errors
@@ -1,8 +1,17 @@
 class UserCards:
+    __slots__ = ("_name", "_number")
+
     def __init__(self, name, number):
         self._name: str = name
         self._number: str = number
 
+    @classmethod
+    def from_dict(cls, data):
+        return cls(name=data["name"], number=data["number"])
+
+    def to_dict(self):
+        return {"name": self._name, "number": self._number}
+
     @property
     def name(self):
         return self._name
@@ -11,21 +20,46 @@ class UserCards:
     def number(self):
         return self._number
 
+    def __eq__(self, other):
+        if not isinstance(other, UserCards):
+            return NotImplemented
+        return (self._name, self._number) == (other._name, other._number)
+
+    def __hash__(self):
+        return hash((self._name, self._number))
+
     def __repr__(self):
-        return f"<{self.__class__.__name__}(id={self._id!r}, name={self._name!r}, number={self._number!r})>"
+        return (
+            f"<{self.__class__.__name__}(name={self._name!r}, number={self._number!r})>"
+        )
 
 
 class User:
-    def __init__(self, username, uuid, cards):
+    __slots__ = ("_username", "_uuid", "_cards", "_client")
+
+    def __init__(self, username, uuid, cards=None, client=None):
         self._username: str = username
         self._uuid: str = uuid
-        self._cards = [
-            UserCards(
-                name=card["name"],
-                number=card["number"],
-            )
-            for card in cards
-        ]
+        self._cards = None if cards is None else self._build_cards(cards)
+        self._client = client
+
+    @staticmethod
+    def _build_cards(cards):
+        return [UserCards.from_dict(card) for card in cards]
+
+    @classmethod
+    def from_dict(cls, data, cards=None, client=None):
+        """
+        :param data: Ответ ``users/{id}``.
+        :param cards: Ответ ``accounts/{username}/cards`` или None, если карты не загружены.
+        """
+        return cls(data["username"], data["uuid"], cards, client=client)
+
+    def to_dict(self):
+        data = {"username": self._username, "uuid": self._uuid}
+        if self._cards is not None:
+            data["cards"] = [card.to_dict() for card in self._cards]
+        return data
 
     @property
     def username(self):
@@ -39,5 +73,86 @@ class User:
     def cards(self):
         return self._cards
 
+    @property
+    def cards_loaded(self):
+        return self._cards is not None
+
+    async def fetch_cards(self):
+        if self._client is None:
+            raise RuntimeError("User is not bound to a client, cards cannot be fetched")
+
+        cards = await self._client.get(f"accounts/{self._username}/cards")
+        self._cards = self._build_cards(cards or [])
+        return self._cards
+
+    def __eq__(self, other):
+        if not isinstance(other, User):
+            return NotImplemented
+        return (self._username, self._uuid, self._cards) == (
+            other._username,
+            other._uuid,
+            other._cards,
+        )
+
+    def __hash__(self):
+        return hash((self._username, self._uuid))
+
+    def __repr__(self):
+        fields = {
+            "_username": self._username,
+            "_uuid": self._uuid,
+            "_cards": self._cards,
+        }
+        return "%s(%s)" % (self.__class__.__name__, fields)
+
+
+class UserResult:
+    def __init__(self, discord_id, user=None, error=None):
+        self._discord_id = discord_id
+        self._user = user
+        self._error = error
+
+    @property
+    def discord_id(self):
+        return self._discord_id
+
+    @property
+    def user(self):
+        return self._user
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def ok(self):
+        return self._user is not None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(discord_id={self._discord_id!r}, user={self._user!r}, error={self._error!r})>"
+
+
+class UserCardsResult:
+    def __init__(self, username, cards=None, error=None):
+        self._username = username
+        self._cards = cards
+        self._error = error
+
+    @property
+    def username(self):
+        return self._username
+
+    @property
+    def cards(self):
+        return self._cards
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def ok(self):
+        return self._cards is not None
+
     def __repr__(self):
-        return "%s(%s)" % (self.__class__.__name__, self.__dict__)
+        return f"<{self.__class__.__name__}(username={self._username!r}, cards={self._cards!r}, error={self._error!r})>"
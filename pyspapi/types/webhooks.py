@@ -0,0 +1,79 @@
+class WebhookEvent:
+    type = "unknown"
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    @property
+    def payload(self):
+        return self._payload
+
+    @property
+    def id(self):
+        return self._payload.get("id")
+
+    @staticmethod
+    def from_payload(payload):
+        if not isinstance(payload, dict):
+            return WebhookEvent({"raw": payload})
+        if "payer" in payload:
+            return PaymentEvent(payload)
+        if "sender" in payload or "receiver" in payload:
+            return TransactionEvent(payload)
+        return WebhookEvent(payload)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(payload={self._payload!r})>"
+
+
+class PaymentEvent(WebhookEvent):
+    type = "payment"
+
+    @property
+    def payer(self):
+        return self._payload.get("payer")
+
+    @property
+    def amount(self):
+        return self._payload.get("amount")
+
+    @property
+    def data(self):
+        return self._payload.get("data")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(payer={self.payer!r}, amount={self.amount!r}, data={self.data!r})>"
+
+
+class TransactionEvent(WebhookEvent):
+    type = "transaction"
+
+    @property
+    def amount(self):
+        return self._payload.get("amount")
+
+    @property
+    def transaction_type(self):
+        return self._payload.get("type")
+
+    @property
+    def sender(self):
+        return self._payload.get("sender")
+
+    @property
+    def receiver(self):
+        return self._payload.get("receiver")
+
+    @property
+    def comment(self):
+        return self._payload.get("comment")
+
+    @property
+    def created_at(self):
+        return self._payload.get("createdAt")
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(id={self.id!r}, amount={self.amount!r}, "
+            f"sender={self.sender!r}, receiver={self.receiver!r})>"
+        )
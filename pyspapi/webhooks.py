@@ -0,0 +1,232 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from logging import getLogger
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from pyspapi.types.webhooks import WebhookEvent
+
+__all__ = ["WebhookReceiver"]
+
+log = getLogger("pyspapi")
+
+Handler = Callable[[WebhookEvent], Awaitable[None]]
+
+
+class WebhookReceiver:
+    """
+    HTTP-сервер для приема вебхуков SPWorlds.
+
+    Проверяет заголовок ``X-Body-Hash``, разбирает тело в типизированное
+    событие и передает его асинхронным обработчикам через ограниченную
+    очередь, которую разбирают ``workers`` воркеров. Если очередь
+    заполнена, сервер отвечает 503, чтобы вебхук был доставлен повторно.
+
+    Повторные доставки события с тем же ``id`` отбрасываются. У вебхуков
+    платежей ``id`` нет, а два разных платежа могут прийти с одинаковым
+    телом, поэтому такие вебхуки по умолчанию не отбрасываются; окно
+    ``dedupe_body_ttl`` включает их отбрасывание по хешу тела.
+
+    .. code-block:: python
+
+        receiver = WebhookReceiver(spapi)
+
+        @receiver.on("payment")
+        async def on_payment(event):
+            print(event.payer, event.amount)
+
+        await receiver.start(port=8080)
+
+    :param client: Клиент :class:`SPAPI`, токен которого используется для проверки подписи.
+    :param path: Путь, на который приходят вебхуки. По умолчанию ``/webhook``.
+    :param workers: Число воркеров, вызывающих обработчики. По умолчанию 4.
+    :param queue_size: Размер очереди необработанных событий. По умолчанию 1000.
+    :param dedupe_size: Сколько последних вебхуков помнить для отбрасывания повторов. По умолчанию 10000.
+    :param dedupe_ttl: Сколько секунд помнить ``id`` доставленного события. По умолчанию 3600.
+    :param dedupe_body_ttl: Сколько секунд считать повтором вебхук без ``id`` с тем же телом.
+        По умолчанию 0 — такие вебхуки не отбрасываются.
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str = "/webhook",
+        workers: int = 4,
+        queue_size: int = 1000,
+        dedupe_size: int = 10000,
+        dedupe_ttl: float = 3600.0,
+        dedupe_body_ttl: float = 0.0,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self.queue_size = queue_size
+        self.dedupe_size = dedupe_size
+        self.dedupe_ttl = dedupe_ttl
+        self.dedupe_body_ttl = dedupe_body_ttl
+        self.received = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.failed = 0
+        self._handlers: Dict[Optional[str], List[Handler]] = {}
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._runner: Optional[web.AppRunner] = None
+
+    def add_handler(self, handler: Handler, event_type: Optional[str] = None) -> None:
+        """
+        Регистрирует обработчик событий типа ``event_type`` (``"payment"``,
+        ``"transaction"``) или всех событий, если тип не указан.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def on(self, event_type: Optional[str] = None) -> Callable[[Handler], Handler]:
+        def decorator(handler: Handler) -> Handler:
+            self.add_handler(handler, event_type)
+            return handler
+
+        return decorator
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _dedupe_key(
+        self, event: WebhookEvent, header: str
+    ) -> Tuple[Optional[str], float]:
+        if event.id is not None:
+            return f"id:{event.id}", self.dedupe_ttl
+        if self.dedupe_body_ttl > 0:
+            return f"body:{header}", self.dedupe_body_ttl
+        return None, 0.0
+
+    def _is_duplicate(self, key: str) -> bool:
+        now = time.monotonic()
+        while self._seen:
+            oldest, expires = next(iter(self._seen.items()))
+            if expires > now and len(self._seen) <= self.dedupe_size:
+                break
+            del self._seen[oldest]
+        expires = self._seen.get(key)
+        return expires is not None and expires > now
+
+    def _remember(self, key: str, ttl: float) -> None:
+        self._seen[key] = time.monotonic() + ttl
+        self._seen.move_to_end(key)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        header = request.headers.get("X-Body-Hash")
+        if not header or not self.client.webhook_verify(body, header):
+            log.warning("[pyspapi] Rejected webhook with invalid X-Body-Hash")
+            return web.Response(status=401)
+
+        try:
+            event = WebhookEvent.from_payload(json.loads(body))
+        except (ValueError, RecursionError):
+            log.warning("[pyspapi] Rejected webhook with invalid JSON body")
+            return web.Response(status=400)
+
+        key, ttl = self._dedupe_key(event, header)
+        if key is not None and self._is_duplicate(key):
+            self.duplicates += 1
+            return web.Response(status=200)
+
+        if self._queue is None:
+            raise RuntimeError("WebhookReceiver is not started")
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return web.Response(status=503, headers={"Retry-After": "1"})
+
+        if key is not None:
+            self._remember(key, ttl)
+        self.received += 1
+        return web.Response(status=200)
+
+    async def _worker(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                for handler in self._handlers.get(event.type, []) + self._handlers.get(
+                    None, []
+                ):
+                    try:
+                        await handler(event)
+                    except Exception:
+                        self.failed += 1
+                        log.exception("[pyspapi] Webhook handler failed for %r", event)
+            finally:
+                self._queue.task_done()
+
+    def _start_workers(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.workers)
+        ]
+
+    def make_app(self) -> web.Application:
+        """
+        Создает aiohttp-приложение с маршрутом вебхука, чтобы встроить его в свой сервер.
+        """
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+
+        async def on_startup(_):
+            self._start_workers()
+
+        async def on_cleanup(_):
+            await self._stop_workers()
+
+        app.on_startup.append(on_startup)
+        app.on_cleanup.append(on_cleanup)
+        return app
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080) -> Tuple[str, int]:
+        """
+        Запускает HTTP-сервер.
+
+        :return: Адрес, на котором слушает сервер.
+        """
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        address = self._runner.addresses[0]
+        log.info(
+            "[pyspapi] Webhook receiver listening on %s:%s%s",
+            address[0],
+            address[1],
+            self.path,
+        )
+        return address[0], address[1]
+
+    async def drain(self) -> None:
+        """
+        Ожидает обработки всех событий из очереди.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _stop_workers(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def stop(self) -> None:
+        """
+        Останавливает сервер, дождавшись обработки принятых событий.
+        """
+        await self.drain()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None